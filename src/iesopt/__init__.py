@@ -1,6 +1,7 @@
-import os
+import importlib
 import importlib.metadata
 from pathlib import Path
+from typing import Any
 
 # Set version.
 __version__ = importlib.metadata.version("iesopt")
@@ -8,13 +9,15 @@ __version__ = importlib.metadata.version("iesopt")
 # Set juliapkg target path.
 __target__ = Path(__file__).parent.resolve()
 
-# Set sysimage path.
-__sysimage__ = __target__ / ("sysimage_v" + __version__.replace(".", "-") + ".so")
+# Set sysimage path, keyed by the fingerprint of the config (that defines the Julia environment).
+from .config import Config as _Config  # noqa: E402
+
+__sysimage__ = __target__ / ("sysimage_" + _Config.fingerprint()[:16] + ".so")
 
 
 # =======================================================================
-# Setup "module globals" that will be overwritten internally.
-julia = None
+# "Module globals" that are resolved lazily (see `__getattr__`), which sets up Julia on first access.
+julia: Any
 """
 The Julia object, if setup was successful.
 
@@ -25,87 +28,119 @@ The Julia object, if setup was successful.
     iesopt.julia.println("Hello, from Julia's world!")
 """
 
-Symbol = None
-
-IESopt = None
+IESopt: Any
 """IESopt.jl module from Julia."""
 
-JuMP = None
+JuMP: Any
 """JuMP.jl module from Julia."""
 
 
 def jump_value(item):
     """Calls `JuMP.value.(item)`."""
-    pass
+    return _get_iesopt_module_attr("jump_value")(item)
 
 
 def jump_dual(item):
     """Calls `JuMP.dual.(item)`."""
-    pass
+    return _get_iesopt_module_attr("jump_dual")(item)
 
 
 def jump_reduced_cost(item):
     """Calls `JuMP.reduced_cost.(item)`."""
-    pass
+    return _get_iesopt_module_attr("jump_reduced_cost")(item)
 
 
 def jump_shadow_price(item):
     """Calls `JuMP.shadow_price.(item)`."""
-    pass
+    return _get_iesopt_module_attr("jump_shadow_price")(item)
 
 
 def get_jl_docstr(obj: str):
     """Get the documentation string of a Julia object inside the IESopt module."""
-    pass
+    return jl_docs(obj)
 
 
 # =======================================================================
 
-# Setup Julia.
-from .julia import initialize as _initialize_everything  # noqa: E402
 from .util import get_iesopt_module_attr as _get_iesopt_module_attr  # noqa: E402
-
-julia = _initialize_everything(
-    __target__, __sysimage__, reuse_julia_env=os.environ.get("IESOPT_REUSE_JULIA_ENV", "no") == "yes"
-)
-
-# Export everything.
-from iesopt.model import Model as Model, ModelStatus as ModelStatus  # noqa: E402
-from iesopt.results import Results as Results  # noqa: E402
-from iesopt.iesopt import run as run, examples as examples, make_example as make_example  # noqa: E402
-
 from .julia.util import jl_symbol as jl_symbol, jl_docs  # noqa: E402
 from .julia import jl_isa as jl_isa  # noqa: E402
+from .julia.report import startup_report as startup_report  # noqa: E402
+from .threads import thread_report as thread_report  # noqa: E402
 
 Symbol = jl_symbol
 
-if not os.getenv("IESOPT_DOCS_NOEXEC"):
-    IESopt = _get_iesopt_module_attr("IESopt")
-    JuMP = _get_iesopt_module_attr("JuMP")
+# Importing from `.julia` binds the subpackage to `iesopt.julia`; drop it, so that `iesopt.julia` resolves to Julia's
+# `Main` module on first access (like all other Julia related attributes, see `__getattr__`).
+globals().pop("julia", None)
+
+# Exports that are only imported on first access, since they pull in heavy dependencies (e.g., `pandas`, `pydantic`).
+_LAZY_EXPORTS = {
+    "Model": "iesopt.model",
+    "ModelStatus": "iesopt.model",
+    "Results": "iesopt.results",
+    "run": "iesopt.iesopt",
+    "examples": "iesopt.iesopt",
+    "make_example": "iesopt.iesopt",
+    "register_frame": "iesopt.registry",
+    "release_frame": "iesopt.registry",
+    "registered_frames": "iesopt.registry",
+}
+
+_JULIA_ATTRS = ("julia", "IESopt", "JuMP")
+
 
-    jump_value = _get_iesopt_module_attr("jump_value")
-    jump_dual = _get_iesopt_module_attr("jump_dual")
-    jump_reduced_cost = _get_iesopt_module_attr("jump_reduced_cost")
-    jump_shadow_price = _get_iesopt_module_attr("jump_shadow_price")
-    get_jl_docstr = jl_docs
+def __getattr__(name: str):
+    if name in _JULIA_ATTRS:
+        from .julia.general import ensure_initialized
 
+        ensure_initialized()
+        value = globals().get(f"_!_attr_{name}")
+    elif name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+    else:
+        raise AttributeError(f"module 'iesopt' has no attribute '{name}'")
 
-def create_sysimage():
-    """Create a sysimage containing IESopt.jl and important dependencies."""
-    import juliacall
-    import juliapkg
+    globals()[name] = value
+    return value
 
-    julia.Pkg.add("PackageCompiler")
-    julia.seval("import PackageCompiler")
 
-    __target__.mkdir(exist_ok=True)
+def __dir__():
+    return sorted(set(globals().keys()) | set(_JULIA_ATTRS) | set(_LAZY_EXPORTS.keys()))
 
-    juliapkg.add("Pkg", "44cfe95a-1eb2-52ea-b672-e2afdf69b78f", target=str(__target__ / "juliapkg.json"))
-    juliapkg.resolve()
 
-    julia.PackageCompiler.create_sysimage(
-        juliacall.convert(julia.Vector, ["IESopt", "JuMP", "HiGHS", "Pkg"]), sysimage_path=str(__sysimage__)
-    )
+def create_sysimage(*, examples: list[str] | None = None, workload: bool = True):
+    """Create a sysimage containing IESopt.jl and important dependencies.
+
+    By default, a representative workload (all bundled examples, keyword argument conversion, and result extraction) is
+    executed in a separate process, and all precompile statements that it triggers are baked into the sysimage. The
+    sysimage is keyed by the fingerprint of the current config, and used automatically on the next launch.
+
+    Keyword Arguments:
+        examples (Optional[list[str]]): Examples to run as part of the workload, defaults to all bundled examples.
+        workload (bool): Whether to record and include precompile statements of the workload, defaults to `True`.
+    """
+    from .julia.sysimage import create_sysimage as _create_sysimage
+
+    _create_sysimage(__target__, __sysimage__, examples=examples, workload=workload)
 
     print("Successfully created sysimage; launch your script/code again to use it")
     exit(0)
+
+
+def export_environment(dest: str | Path):
+    """Export the Julia environment (Julia, packages, and sysimage), to be used read-only by other machines.
+
+    This is meant for clusters: export once (from a node with network access) to a shared filesystem, and set
+    `IESOPT_SHARED_ENV` to that folder on all compute nodes. These then skip resolving, installing, and precompiling
+    entirely. The exported environment is relocatable, so it can be moved after exporting.
+
+    Arguments:
+        dest (str | Path): Empty (or non-existing) folder to export into.
+    """
+    from .julia.general import ensure_initialized
+    from .julia.shared import export_environment as _export_environment
+
+    # Make sure that the environment is set up (and matches the current config), before exporting it.
+    ensure_initialized()
+    _export_environment(Path(dest), __sysimage__ if __sysimage__.exists() else None)
@@ -1,19 +1,11 @@
-import iesopt
+from ...julia.helpers import jl_helper
 
 
-add_obj_threshold_constraint = iesopt.IESopt.seval("""
-function (model, obj, ub)
-    JuMP.@constraint(model, internal(model).model.objectives[obj].expr <= ub)
-    return nothing
-end
-""")
+def add_obj_threshold_constraint(model, obj, ub):
+    """Constrain the objective `obj` of `model` to be at most `ub`."""
+    return jl_helper("add_obj_threshold_constraint")(model, obj, ub)
 
-set_weighted_objective = iesopt.IESopt.seval("""
-function (model, objs)
-    objectives = internal(model).model.objectives
-    JuMP.@objective(model, Min, sum(
-        objectives[name].expr * weight for (name, weight) in objs
-    ))
-    return nothing
-end
-""")
+
+def set_weighted_objective(model, objs):
+    """Set the objective of `model` to the weighted sum of the objectives in `objs` (mapping name to weight)."""
+    return jl_helper("set_weighted_objective")(model, objs)
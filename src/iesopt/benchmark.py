@@ -0,0 +1,400 @@
+import os
+import sys
+import json
+import subprocess
+from pathlib import Path
+
+from .util import logger
+
+
+# Executed in a fresh Python process; prints a single JSON line containing all timings (in seconds).
+_TIME_TO_FIRST_SOLVE = """
+import sys, json, time, tempfile
+
+t0 = time.perf_counter()
+import iesopt
+iesopt.julia
+timings = {"startup": time.perf_counter() - t0}
+
+filename = sys.argv[1]
+if filename == "":
+    filename = iesopt.make_example("01_basic_single_node", dst_dir=tempfile.mkdtemp(), dst_name="config")
+
+t = time.perf_counter()
+model = iesopt.Model(filename, config={"general.verbosity.core": "error"})
+model.generate()
+timings["generate"] = time.perf_counter() - t
+
+t = time.perf_counter()
+model.optimize()
+timings["optimize"] = time.perf_counter() - t
+
+t = time.perf_counter()
+model.results.to_pandas()
+timings["results"] = time.perf_counter() - t
+
+timings["total"] = time.perf_counter() - t0
+print(json.dumps(timings))
+"""
+
+# Executed in a fresh Python process (using a specific `IESOPT_OPTIMIZATION` profile); prints a single JSON line.
+_PROFILE = """
+import sys, json, time, resource, tempfile
+
+t0 = time.perf_counter()
+import iesopt
+iesopt.julia
+timings = {"startup": time.perf_counter() - t0}
+
+filename, repeats = sys.argv[1], int(sys.argv[2])
+if filename == "":
+    filename = iesopt.make_example("01_basic_single_node", dst_dir=tempfile.mkdtemp(), dst_name="config")
+
+def solve():
+    t = time.perf_counter()
+    model = iesopt.Model(filename, config={"general.verbosity.core": "error"})
+    model.generate()
+    t_generate = time.perf_counter() - t
+    t = time.perf_counter()
+    model.optimize()
+    return t_generate, time.perf_counter() - t
+
+timings["generate"], timings["optimize"] = solve()
+timings["repeated"] = [sum(solve()) for _ in range(repeats)]
+
+# `ru_maxrss` is reported in kilobytes on Linux, but in bytes on macOS.
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+timings["peak_rss_mb"] = rss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+print(json.dumps(timings))
+"""
+
+# Executed in a fresh Python process; prints a single JSON line with the timings of each example (skipping the ones that
+# fail to generate). Each example is generated once before measuring, to exclude compilation from the timings.
+_CLONE = """
+import sys, json, time, tempfile
+
+import iesopt
+
+examples, repeats = json.loads(sys.argv[1]) or iesopt.examples(), int(sys.argv[2])
+workdir = tempfile.mkdtemp()
+
+def measure(f):
+    t = time.perf_counter()
+    ret = f()
+    return time.perf_counter() - t, ret
+
+timings = {}
+for example in examples:
+    filename = iesopt.make_example(example, dst_dir=workdir, dst_name=example)
+    model = iesopt.Model(filename, config={"general.verbosity.core": "error"})
+    try:
+        model.generate()
+        model.clone()
+    except Exception:
+        pass
+    if model.status != iesopt.ModelStatus.GENERATED:
+        continue
+
+    timings[example] = {
+        "variables": iesopt.JuMP.num_variables(model.core),
+        "generate": min(measure(model.generate)[0] for _ in range(repeats)),
+        "clone": min(measure(model.clone)[0] for _ in range(repeats)),
+    }
+print(json.dumps(timings))
+"""
+
+# Executed in a fresh Python process; prints a single JSON line with the time and additional peak memory of converting a
+# DataFrame (after a warm-up using a small one), either copying it (`copy`), or using `recursive_convert_py2jl`.
+_DATAFRAME = """
+import sys, json, time, resource
+
+import numpy as np
+import pandas as pd
+import iesopt
+from iesopt.julia.util import recursive_convert_py2jl
+
+method, rows, columns = sys.argv[1], int(sys.argv[2]), int(sys.argv[3])
+convert = iesopt.julia.IESopt.DataFrames.DataFrame if method == "copy" else recursive_convert_py2jl
+
+convert(pd.DataFrame({"a": [1.0, 2.0], "b": [1, 2]}))
+df = pd.DataFrame(np.random.default_rng(0).random((rows, columns)), columns=[f"c{i}" for i in range(columns)])
+iesopt.julia.GC.gc()
+
+# `ru_maxrss` is reported in kilobytes on Linux, but in bytes on macOS.
+scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+t = time.perf_counter()
+jl_df = convert(df)
+elapsed = time.perf_counter() - t
+
+print(json.dumps({"time": elapsed, "peak_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale - rss}))
+"""
+
+PROFILES = ["rapid", "latency", "normal", "performance"]
+
+
+def _run_isolated(script: str, args: list[str], env: dict | None = None) -> dict:
+    """Run `script` in a fresh Python process, and return the JSON object that it prints as last line."""
+    ret = subprocess.run(
+        [sys.executable, "-c", script, *args],
+        env=os.environ | (env or {}),
+        capture_output=True,
+        text=True,
+    )
+    if ret.returncode != 0:
+        logger.error("Benchmark process failed:\n%s" % ret.stderr)
+        raise Exception("Benchmark process failed, see log for details")
+    return json.loads(ret.stdout.strip().splitlines()[-1])
+
+
+def time_to_first_solve(filename: str | Path | None = None, *, use_sysimage: bool = True) -> dict:
+    """
+    Measure the time to first solve of a model, in a fresh Python process.
+
+    Arguments:
+        filename (Optional[str | Path]): Path to the config file of the model, defaults to a small bundled example.
+
+    Keyword Arguments:
+        use_sysimage (bool): Whether to use the custom sysimage (if it exists), defaults to `True`.
+
+    Returns:
+        Timings (in seconds) of `startup` (import and Julia setup), `generate`, `optimize`, `results` (extracting
+        results using `to_pandas`) and `total`.
+    """
+    env = {"IESOPT_USE_SYSIMAGE": "yes" if use_sysimage else "no"}
+    return _run_isolated(_TIME_TO_FIRST_SOLVE, ["" if filename is None else str(filename)], env=env)
+
+
+def compare_sysimage(filename: str | Path | None = None) -> dict:
+    """
+    Compare the time to first solve of a model, without and with the custom sysimage.
+
+    This should be used after creating a sysimage using :py:func:`iesopt.create_sysimage`, to check its benefit.
+
+    Arguments:
+        filename (Optional[str | Path]): Path to the config file of the model, defaults to a small bundled example.
+
+    Returns:
+        Timings (see :py:func:`iesopt.benchmark.time_to_first_solve`) for `before` (default sysimage), and `after`
+        (custom sysimage).
+
+    Example:
+        ..  code-block:: python
+            :caption: Comparing time to first solve
+
+            import iesopt.benchmark
+            iesopt.benchmark.compare_sysimage("opt/config.iesopt.yaml")
+    """
+    import iesopt
+
+    if not iesopt.__sysimage__.exists():
+        logger.warning("No custom sysimage found at '%s'; both runs use the default sysimage" % iesopt.__sysimage__)
+
+    ret = {
+        "before": time_to_first_solve(filename, use_sysimage=False),
+        "after": time_to_first_solve(filename, use_sysimage=True),
+    }
+
+    for key in ret["before"].keys():
+        logger.info(
+            "    %s: %.2fs -> %.2fs" % (key.ljust(8), ret["before"][key], ret["after"][key]),
+        )
+
+    return ret
+
+
+def compare_profiles(
+    filename: str | Path | None = None, *, profiles: list[str] | None = None, repeats: int = 3, solves: int = 1
+) -> dict:
+    """
+    Compare the `IESOPT_OPTIMIZATION` profiles, running a model in a fresh Python process for each profile.
+
+    Each process measures the cold start (import and Julia setup), the first `generate` and `optimize`, the time of
+    `repeats` additional solves (generate and optimize), and its peak memory usage. The recommended profile is the one
+    with the lowest expected time for a process that solves the model `solves` times: use `solves=1` for short
+    interactive runs, and a higher number for long-running processes (e.g., the daemon, or parameter studies).
+
+    Arguments:
+        filename (Optional[str | Path]): Path to the config file of the model, defaults to a small bundled example.
+
+    Keyword Arguments:
+        profiles (Optional[list[str]]): Profiles to compare, defaults to all (`rapid`, `latency`, `normal`,
+            `performance`).
+        repeats (int): Number of repeated solves (after the first one) in each process, defaults to 3.
+        solves (int): Number of solves per process that the recommendation is based on, defaults to 1.
+
+    Returns:
+        Dictionary with the entries `profiles` (mapping each profile to its timings in seconds: `startup`, `generate`,
+        `optimize`, `repeated` (list), `peak_rss_mb`, and the resulting `expected` time), and `recommended`.
+
+    Example:
+        ..  code-block:: python
+            :caption: Choosing a profile for a long-running process
+
+            import iesopt.benchmark
+            iesopt.benchmark.compare_profiles("opt/config.iesopt.yaml", solves=100)["recommended"]
+    """
+    if repeats < 1:
+        raise ValueError("`repeats` must be at least 1")
+
+    ret = {}
+    for profile in profiles or PROFILES:
+        logger.info("Benchmarking profile '%s'" % profile)
+        timings = _run_isolated(
+            _PROFILE,
+            ["" if filename is None else str(filename), str(repeats)],
+            env={"IESOPT_OPTIMIZATION": profile},
+        )
+
+        repeated = sum(timings["repeated"]) / len(timings["repeated"])
+        timings["expected"] = timings["startup"] + timings["generate"] + timings["optimize"] + (solves - 1) * repeated
+        ret[profile] = timings
+
+    recommended = min(ret.keys(), key=lambda profile: ret[profile]["expected"])
+
+    for profile, timings in ret.items():
+        logger.info(
+            "    %s: startup %.2fs, first solve %.2fs, repeated %.3fs, peak RSS %.0f MB, expected %.2fs"
+            % (
+                profile.ljust(11),
+                timings["startup"],
+                timings["generate"] + timings["optimize"],
+                sum(timings["repeated"]) / len(timings["repeated"]),
+                timings["peak_rss_mb"],
+                timings["expected"],
+            )
+        )
+    logger.info("Recommended profile for %d solve(s) per process: '%s'" % (solves, recommended))
+
+    return {"profiles": ret, "recommended": recommended}
+
+
+def compare_clone(examples: list[str] | None = None, *, repeats: int = 3) -> dict:
+    """
+    Compare the time of cloning a generated model (see :py:meth:`iesopt.Model.clone`) to generating it, in a fresh
+    Python process.
+
+    Arguments:
+        examples (Optional[list[str]]): Names of the bundled examples to compare, defaults to all (see
+            :py:func:`iesopt.examples`). Examples that fail to generate are skipped.
+
+    Keyword Arguments:
+        repeats (int): Number of measurements of each operation (the fastest one is reported), defaults to 3.
+
+    Returns:
+        Dictionary mapping each example to its number of `variables`, and the timings (in seconds) of `generate`,
+        `clone`, and the resulting `speedup`.
+
+    Example:
+        ..  code-block:: python
+            :caption: Checking if cloning pays off for scenario fan-out
+
+            import iesopt.benchmark
+            iesopt.benchmark.compare_clone()
+    """
+    if repeats < 1:
+        raise ValueError("`repeats` must be at least 1")
+
+    ret = _run_isolated(_CLONE, [json.dumps(examples or []), str(repeats)])
+    for timings in ret.values():
+        timings["speedup"] = timings["generate"] / max(timings["clone"], 1e-9)
+
+    # Report the largest examples first, which are the relevant ones for deciding on cloning.
+    for example, timings in sorted(ret.items(), key=lambda item: -item[1]["variables"]):
+        logger.info(
+            "    %s: %d variables, generate %.3fs, clone %.3fs (%.1fx)"
+            % (example, timings["variables"], timings["generate"], timings["clone"], timings["speedup"])
+        )
+
+    return ret
+
+
+def compare_dataframe_transfer(rows: int = 8760, columns: int = 2000) -> dict:
+    """
+    Compare the time and additional peak memory of passing a (numerical) `pd.DataFrame` to Julia, by copying it, and
+    by sharing its memory (the way that, e.g., `virtual_files` are passed), each in a fresh Python process.
+
+    Keyword Arguments:
+        rows (int): Number of rows of the DataFrame, defaults to 8760.
+        columns (int): Number of columns of the DataFrame, defaults to 2000.
+
+    Returns:
+        Dictionary mapping `copy` and `shared` to their timings (`time` in seconds, and `peak_mb`, the additional peak
+        memory in MB).
+
+    Example:
+        ..  code-block:: python
+            :caption: Measuring the transfer of a large profile table
+
+            import iesopt.benchmark
+            iesopt.benchmark.compare_dataframe_transfer(rows=8760, columns=2000)
+    """
+    ret = {method: _run_isolated(_DATAFRAME, [method, str(rows), str(columns)]) for method in ["copy", "shared"]}
+
+    logger.info("DataFrame transfer (%d x %d, %.0f MB):" % (rows, columns, rows * columns * 8 / 1024**2))
+    for method, timings in ret.items():
+        logger.info("    %s: %.3fs, peak memory +%.0f MB" % (method.ljust(6), timings["time"], timings["peak_mb"]))
+
+    return ret
+
+
+def results_to_pandas(rows: int = 10_000_000, snapshots: int = 8760) -> dict:
+    """
+    Measure the time and peak memory of converting results into a long DataFrame (see `Results.to_pandas`).
+
+    This uses synthetic results (temporal results of a few components, without Julia), and runs in the current process.
+
+    Keyword Arguments:
+        rows (int): Number of rows of the resulting DataFrame, defaults to 10^7.
+        snapshots (int): Number of snapshots, defaults to 8760.
+
+    Returns:
+        Dictionary with the entries `rows`, `time` (in seconds), `peak_mb` (peak memory during the conversion in MB), and
+        `frame_mb` (memory used by the resulting DataFrame in MB).
+
+    Example:
+        ..  code-block:: python
+            :caption: Measuring the extraction of 10^7 rows
+
+            import iesopt.benchmark
+            iesopt.benchmark.results_to_pandas()
+    """
+    import time
+    import tracemalloc
+
+    import numpy as np
+    from .results import Results
+
+    n_results = max(1, rows // snapshots)
+    rng = np.random.default_rng(0)
+    results = Results(
+        data={
+            "source": "benchmark",
+            "snapshots": [f"t{t}" for t in range(snapshots)],
+            "components": [f"component_{i // 4}" for i in range(0, n_results, 4)],
+            "objectives": {},
+            "results": {
+                (f"component_{i // 4}", "var", f"field_{i % 4}"): rng.random(snapshots) for i in range(n_results)
+            },
+        }
+    )
+
+    tracemalloc.start()
+    t = time.perf_counter()
+    df = results.to_pandas(orientation="long")
+    elapsed = time.perf_counter() - t
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    ret = {
+        "rows": len(df),
+        "time": elapsed,
+        "peak_mb": peak / 1024**2,
+        "frame_mb": df.memory_usage(deep=True).sum() / 1024**2,
+    }
+    logger.info(
+        "Long results (%d rows): %.2fs, peak memory %.0f MB, DataFrame %.0f MB"
+        % (ret["rows"], ret["time"], ret["peak_mb"], ret["frame_mb"])
+    )
+    return ret
@@ -0,0 +1,202 @@
+import os
+import json
+import hashlib
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .config import Config
+from .util import logger
+
+
+# Statistics of the current process, see `info`.
+_stats = {"hits": 0, "misses": 0, "stored": 0, "evicted": 0}
+
+SUFFIX = ".jls"
+
+
+def folder() -> Path | None:
+    """Folder of the input cache (see `IESOPT_INPUT_CACHE`), or `None` if it is disabled."""
+    value = Config.get("input_cache")
+    if value in ["", "no"]:
+        return None
+    if value == "yes":
+        return Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "iesopt" / "inputs"
+    return Path(value)
+
+
+def size_limit() -> int:
+    """Size limit of the input cache in bytes (see `IESOPT_INPUT_CACHE_SIZE`, given in MB)."""
+    return int(float(Config.get("input_cache_size")) * 1024 * 1024)
+
+
+def input_files(filename: str | Path, folders: dict, parameters: str | None, config: dict | None = None) -> list[Path]:
+    """All files that a model may read: the top-level config, its parameter file, and everything in the input folders.
+
+    Arguments:
+        filename (str | Path): Top-level config file.
+        folders (dict): Input folders (`files`, `templates`, ...) as configured in `config.paths`, relative to the
+            top-level config file.
+        parameters (Optional[str]): Parameter file, relative to the top-level config file, if one is used.
+        config (Optional[dict]): The `config` keyword argument of the model, which may override `config.paths`.
+    """
+    root = Path(filename).resolve().parent
+    folders = folders | {k[6:]: v for (k, v) in (config or {}).items() if k.startswith("paths.") and k[6:] in folders}
+
+    files = [Path(filename).resolve()]
+    if parameters is not None:
+        files.append(root / parameters)
+    for path in dict.fromkeys(folders.values()):
+        files.extend(sorted(p for p in (root / path).rglob("*") if p.is_file()))
+    return files
+
+
+def _hash_value(h, value):
+    from .registry import FrameHandle
+
+    if isinstance(value, FrameHandle):
+        h.update(value.digest())
+    elif isinstance(value, pd.DataFrame):
+        h.update(json.dumps([str(c) for c in value.columns] + [str(t) for t in value.dtypes]).encode())
+        h.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, dict):
+        for k in sorted(value.keys(), key=str):
+            h.update(repr(k).encode())
+            _hash_value(h, value[k])
+    elif isinstance(value, (list, tuple)):
+        h.update(b"[%d]" % len(value))
+        for v in value:
+            _hash_value(h, v)
+    elif value is None or isinstance(value, (bool, int, float, str)):
+        h.update(repr((type(value).__name__, value)).encode())
+    else:
+        raise TypeError(f"Cannot hash value of type `{type(value).__name__}`")
+
+
+def cache_key(files: list[Path], kwargs: dict) -> str | None:
+    """Content hash of all input files, all keyword arguments, and the config; `None` if any of them can not be hashed."""
+    h = hashlib.sha256(Config.fingerprint().encode())
+    try:
+        _hash_value(h, kwargs)
+    except TypeError as e:
+        logger.debug("Not using the input cache: %s" % e)
+        return None
+
+    root = files[0].parent
+    for file in files:
+        if not file.exists():
+            continue
+        h.update(str(file.relative_to(root) if file.is_relative_to(root) else file).encode())
+        with open(file, "rb") as f:
+            h.update(hashlib.file_digest(f, "sha256").digest())
+    return h.hexdigest()
+
+
+def _entries(path: Path) -> list[os.DirEntry]:
+    """All cache entries, least recently used first."""
+    try:
+        with os.scandir(path) as it:
+            entries = [e for e in it if e.is_file() and e.name.endswith(SUFFIX)]
+    except FileNotFoundError:
+        return []
+    return sorted(entries, key=lambda e: e.stat().st_mtime)
+
+
+def evict(path: Path, limit: int) -> int:
+    """Remove the least recently used entries, until the cache fits into `limit` bytes; returns the number removed."""
+    entries = _entries(path)
+    total = sum(e.stat().st_size for e in entries)
+
+    removed = 0
+    for entry in entries:
+        if total <= limit:
+            break
+        total -= entry.stat().st_size
+        Path(entry.path).unlink(missing_ok=True)
+        removed += 1
+
+    _stats["evicted"] += removed
+    return removed
+
+
+def load(key: str):
+    """Load the generated model stored for `key`, or `None` (on a cache miss, or if loading fails)."""
+    from .julia.helpers import jl_helper
+
+    file = folder() / (key + SUFFIX)
+    if not file.exists():
+        _stats["misses"] += 1
+        return None
+
+    try:
+        model = jl_helper("load_model")(str(file), Config.fingerprint()).model
+    except Exception as e:
+        logger.warning("Failed to load model from input cache, removing entry: %s" % e)
+        file.unlink(missing_ok=True)
+        _stats["misses"] += 1
+        return None
+
+    # Mark the entry as recently used (eviction removes the least recently used ones first).
+    os.utime(file)
+    _stats["hits"] += 1
+    return model
+
+
+def store(key: str, model):
+    """Store a generated model for `key`, evicting old entries if the cache exceeds its size limit."""
+    from .julia.helpers import jl_helper
+
+    path = folder()
+    path.mkdir(parents=True, exist_ok=True)
+
+    # Write to a temporary file first, so that other processes never see incomplete entries.
+    fd, tmp = tempfile.mkstemp(dir=path, suffix=".tmp")
+    os.close(fd)
+    try:
+        jl_helper("save_model")(model, tmp, Config.fingerprint(), np.zeros(0, dtype=np.uint8))
+        if os.path.getsize(tmp) > size_limit():
+            logger.warning("Generated model exceeds the size limit of the input cache; not caching it")
+            return
+        os.replace(tmp, path / (key + SUFFIX))
+        _stats["stored"] += 1
+    except Exception as e:
+        logger.warning("Failed to store model in input cache: %s" % e)
+    finally:
+        Path(tmp).unlink(missing_ok=True)
+
+    evict(path, size_limit())
+
+
+def info() -> dict:
+    """
+    Get information about the input cache (see `IESOPT_INPUT_CACHE`).
+
+    Returns:
+        Dictionary with the entries `folder` (`None` if the cache is disabled), `entries`, `size` (in bytes), `limit`
+        (in bytes), and the number of `hits`, `misses`, `stored`, and `evicted` entries in the current process.
+
+    Example:
+        ..  code-block:: python
+            :caption: Checking the input cache
+
+            import iesopt.cache
+            iesopt.cache.info()
+    """
+    path = folder()
+    entries = [] if path is None else _entries(path)
+    return {
+        "folder": path,
+        "entries": len(entries),
+        "size": sum(e.stat().st_size for e in entries),
+        "limit": size_limit(),
+        **_stats,
+    }
+
+
+def clear():
+    """Remove all entries from the input cache."""
+    path = folder()
+    if path is not None:
+        evict(path, 0)
@@ -1,3 +1,8 @@
+import os
+import json
+import hashlib
+import importlib.metadata
+
 from dotenv import dotenv_values
 
 
@@ -18,7 +23,22 @@ class Config:
         "IESOPT_SOLVER_HIGHS": "1.23.0",
         "IESOPT_MULTITHREADED": "no",  # yes, no
         "IESOPT_OPTIMIZATION": "latency",  # rapid, latency, normal, performance
+        "IESOPT_THREADS": "",  # total thread budget: "" (none), auto, or a number
+        "IESOPT_WORKERS": "1",  # number of Python workers sharing the thread budget
+        "IESOPT_INPUT_CACHE": "",  # cache of generated models: "" (disabled), yes (default folder), or a folder
+        "IESOPT_INPUT_CACHE_SIZE": "2048",  # size limit of the input cache in MB
+        "IESOPT_RESULTS_BUDGET": "",  # memory budget of lazily accessed results in MB: "" (load all at once), or a number
     }
+    # Entries that only affect how Julia is launched, but not the contents of the Julia environment.
+    RUNTIME_KEYS = [
+        "multithreaded",
+        "optimization",
+        "threads",
+        "workers",
+        "input_cache",
+        "input_cache_size",
+        "results_budget",
+    ]
     _config = None
 
     @classmethod
@@ -31,10 +51,21 @@ class Config:
             for (k, v) in {
                 **cls.DEFAULTS,
                 **dotenv_values(),
+                **cls._from_environ(),
             }.items()
             if k.startswith("IESOPT_")
         }
 
+    @classmethod
+    def _from_environ(cls) -> dict:
+        # Environment variables take precedence over `.env`; other `IESOPT_*` variables (e.g., `IESOPT_USE_SYSIMAGE`)
+        # are not config entries, and are handled where they are used.
+        return {
+            k: v
+            for (k, v) in os.environ.items()
+            if k in cls.DEFAULTS or k.startswith("IESOPT_SOLVER_") or k.startswith("IESOPT_PKG_")
+        }
+
     @classmethod
     def get(cls, key: str):
         value = cls._config[key]
@@ -48,5 +79,16 @@ class Config:
             if k.startswith(prefix):
                 yield k
 
+    @classmethod
+    def fingerprint(cls) -> str:
+        """Content hash of all entries that define the Julia environment (Julia, core, solvers, `PKG_*` entries).
+
+        The versions of `iesopt` and `juliacall` are included, since they ship their own Julia dependencies.
+        """
+        entries = {k: v for (k, v) in cls._config.items() if k not in cls.RUNTIME_KEYS}
+        entries["__iesopt__"] = importlib.metadata.version("iesopt")
+        entries["__juliacall__"] = importlib.metadata.version("juliacall")
+        return hashlib.sha256(json.dumps(entries, sort_keys=True).encode()).hexdigest()
+
 
 Config.init()
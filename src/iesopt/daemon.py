@@ -0,0 +1,285 @@
+"""
+Daemon mode: keep initialized (and warmed up) Julia runtimes alive, and run models that are submitted over a local Unix
+socket.
+
+This allows short-lived scripts (CLI tools, cron jobs, ...) to skip Julia's startup and compilation latency entirely.
+Start the daemon using
+
+..  code-block:: bash
+
+    python -m iesopt.daemon --workers 2
+
+and then submit jobs using :py:func:`iesopt.daemon.run`, which mirrors :py:func:`iesopt.run`.
+
+Jobs are exchanged using `pickle`; the socket is only accessible by the user that started the daemon, and clients refuse
+to connect to sockets that are owned by other users (or accessible by them).
+"""
+
+import os
+import sys
+import pickle
+import stat
+import socket
+import struct
+import tempfile
+from pathlib import Path
+
+from .util import logger
+from .threads import set_workers, thread_report
+
+
+def default_socket() -> Path:
+    """Default path of the daemon's Unix socket (one per user), inside a directory that only this user can access.
+
+    This is `$XDG_RUNTIME_DIR/iesopt.sock` if set, otherwise `iesopt-<uid>/iesopt.sock` in the temporary directory.
+    """
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime:
+        return Path(runtime) / "iesopt.sock"
+    return Path(tempfile.gettempdir()) / f"iesopt-{os.getuid()}" / "iesopt.sock"
+
+
+def _check_private(path: Path, kind: str):
+    """Raise, unless `path` is owned by the current user, and not accessible by any other user."""
+    st = os.lstat(path)
+    if st.st_uid != os.getuid():
+        raise PermissionError(f"Refusing to use {kind} '{path}', since it is owned by another user")
+    if st.st_mode & 0o077:
+        raise PermissionError(f"Refusing to use {kind} '{path}', since other users can access it")
+
+
+def _check_socket(path: Path):
+    """Raise, unless `path` is a socket that can only have been created by (a daemon of) the current user."""
+    if not stat.S_ISSOCK(os.lstat(path).st_mode):
+        raise PermissionError(f"Refusing to use '{path}', since it is not a socket")
+    _check_private(path, "socket")
+
+
+def _send(conn: socket.socket, obj):
+    data = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    conn.sendall(struct.pack("!Q", len(data)) + data)
+
+
+def _recv_exactly(conn: socket.socket, size: int) -> bytes:
+    buffer = bytearray()
+    while len(buffer) < size:
+        chunk = conn.recv(min(size - len(buffer), 1 << 20))
+        if not chunk:
+            raise ConnectionError("Connection closed unexpectedly")
+        buffer.extend(chunk)
+    return bytes(buffer)
+
+
+def _recv(conn: socket.socket):
+    (size,) = struct.unpack("!Q", _recv_exactly(conn, 8))
+    return pickle.loads(_recv_exactly(conn, size))
+
+
+class RemoteModel:
+    """A model that was run by the daemon, mirroring the parts of :py:class:`iesopt.Model` that do not require Julia."""
+
+    def __init__(self, reply: dict):
+        from .model import ModelStatus
+        from .results import Results
+
+        self._status = ModelStatus(reply["status"])
+        self._objective_value = reply.get("objective_value")
+        self._results = None if reply.get("results") is None else Results(data=reply["results"])
+
+    def __repr__(self) -> str:
+        return f"An IESopt model (run by the daemon):\n\tstatus: {self._status}"
+
+    @property
+    def status(self):
+        """Get the status of this model. See `ModelStatus` for possible values."""
+        return self._status
+
+    @property
+    def objective_value(self):
+        """Get the objective value of the model. Only available if the model was solved successfully."""
+        if self._objective_value is None:
+            raise Exception("Model is not optimal; no objective value available")
+        return self._objective_value
+
+    @property
+    def results(self):
+        """Get the results of the model."""
+        if self._results is None:
+            raise Exception("No results available; the model was not solved successfully")
+        return self._results
+
+
+def run(filename: str | Path, *, socket_path: str | Path | None = None, timeout: float | None = None, **kwargs):
+    r"""
+    Generate and optimize an IESopt model, using a running daemon.
+
+    Arguments:
+        filename : str
+            Path to the IESopt model file to load.
+
+    Keyword Arguments:
+        socket_path : Optional[str | Path]
+            Path to the daemon's Unix socket, defaults to :py:func:`iesopt.daemon.default_socket`.
+        timeout : Optional[float]
+            Timeout (in seconds) for the whole job, defaults to `None` (wait indefinitely).
+        **kwargs: Additional keyword arguments to pass to the `Model` constructor (e.g., `parameters`, `config`, or
+            `virtual_files`).
+
+    Returns:
+        A :py:class:`iesopt.daemon.RemoteModel`, that contains the status, objective value, and results.
+
+    Example:
+        ..  code-block:: python
+            :caption: Run an IESopt model using the daemon
+
+            import iesopt.daemon
+            model = iesopt.daemon.run("opt/config.iesopt.yaml", parameters={"price": 10.0})
+            model.results.to_pandas()
+    """
+    path = Path(socket_path or default_socket())
+    _check_socket(path)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.settimeout(timeout)
+        conn.connect(str(path))
+        if hasattr(socket, "SO_PEERCRED"):
+            # The path may have been replaced since checking it; make sure that the daemon runs as the current user.
+            _, uid, _ = struct.unpack(
+                "3i", conn.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+            )
+            if uid != os.getuid():
+                raise PermissionError(f"Refusing to use socket '{path}', since it is served by another user")
+        _send(conn, {"filename": str(Path(filename).resolve()), "kwargs": kwargs})
+        reply = _recv(conn)
+
+    if "error" in reply:
+        raise Exception(f"Daemon failed to run model: {reply['error']}")
+
+    return RemoteModel(reply)
+
+
+def _execute(job: dict) -> dict:
+    import iesopt
+    from .results import Results
+
+    model = iesopt.run(job["filename"], **job["kwargs"])
+    reply = {"status": model.status.value}
+
+    if model.status in [iesopt.ModelStatus.OPTIMAL, iesopt.ModelStatus.OPTIMAL_LOCALLY]:
+        reply["objective_value"] = Results._to_plain(model.objective_value)
+        reply["results"] = model.results.to_data()
+
+    return reply
+
+
+def _warmup():
+    import iesopt
+
+    with tempfile.TemporaryDirectory() as workdir:
+        config = iesopt.make_example("01_basic_single_node", dst_dir=workdir, dst_name="config")
+        iesopt.run(config, config={"general.verbosity.core": "error"}).results.to_data()
+
+
+def _bind_private(server: socket.socket, path: Path):
+    """Bind `server` to `path`, creating the socket accessible only by the current user.
+
+    The umask applies while binding, so that there is no window in which other users can connect (jobs are unpickled).
+    """
+    umask = os.umask(0o077)
+    try:
+        server.bind(str(path))
+    finally:
+        os.umask(umask)
+    os.chmod(path, 0o600)
+
+
+def _worker(server: socket.socket, warmup: bool):
+    import iesopt
+
+    iesopt.julia
+    if warmup:
+        _warmup()
+    logger.info("Daemon worker (pid %d) ready" % os.getpid())
+    thread_report(log=True)
+
+    while True:
+        conn, _ = server.accept()
+        with conn:
+            try:
+                job = _recv(conn)
+                try:
+                    reply = _execute(job)
+                except Exception as e:
+                    logger.error("Exception while running job '%s': %s" % (job.get("filename"), e))
+                    reply = {"error": str(e)}
+                _send(conn, reply)
+            except Exception as e:
+                logger.error("Failed to communicate with client: %s" % e)
+
+
+def serve(socket_path: str | Path | None = None, *, workers: int = 1, warmup: bool = True):
+    """
+    Start the daemon, and serve jobs until interrupted.
+
+    Each worker is a separate process, with its own Julia runtime, that accepts jobs from the shared socket.
+
+    Arguments:
+        socket_path (Optional[str | Path]): Path of the Unix socket, defaults to :py:func:`iesopt.daemon.default_socket`.
+
+    Keyword Arguments:
+        workers (int): Number of worker processes (= Julia runtimes), defaults to 1. Workers share the thread budget
+            (`IESOPT_THREADS`), if one is configured.
+        warmup (bool): Whether each worker runs a small example before accepting jobs, which compiles most of the code
+            paths that are needed to generate, optimize, and extract results. Defaults to `True`.
+    """
+    import multiprocessing
+
+    if "juliacall" in sys.modules:
+        raise Exception("Julia is already loaded in this process; start the daemon from a fresh process")
+
+    path = Path(socket_path or default_socket())
+    if socket_path is None:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        _check_private(path.parent, "directory")
+    if path.exists():
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(str(path))
+                raise Exception(f"A daemon is already running at '{path}'")
+            except (ConnectionRefusedError, FileNotFoundError):
+                path.unlink()
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    _bind_private(server, path)
+    server.listen(max(16, 4 * workers))
+
+    set_workers(workers)
+
+    # Workers are forked before Julia is loaded, so each of them sets up its own (independent) Julia runtime.
+    ctx = multiprocessing.get_context("fork")
+    processes = [ctx.Process(target=_worker, args=(server, warmup), daemon=True) for _ in range(workers)]
+    for p in processes:
+        p.start()
+
+    logger.info("Daemon listening on '%s' with %d worker(s)" % (path, workers))
+    try:
+        for p in processes:
+            p.join()
+    except KeyboardInterrupt:
+        logger.info("Shutting down daemon")
+    finally:
+        for p in processes:
+            p.terminate()
+        server.close()
+        path.unlink(missing_ok=True)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m iesopt.daemon", description="Run the IESopt daemon.")
+    parser.add_argument("--socket", default=None, help="path of the Unix socket")
+    parser.add_argument("--workers", type=int, default=1, help="number of worker processes")
+    parser.add_argument("--no-warmup", action="store_true", help="skip warming up workers")
+    args = parser.parse_args()
+
+    serve(args.socket, workers=args.workers, warmup=not args.no_warmup)
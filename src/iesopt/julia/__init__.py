@@ -1,2 +1,3 @@
 from .general import initialize as initialize
 from .util import jl_import as jl_import, jl_isa as jl_isa
+from .helpers import jl_helper as jl_helper, jl_type as jl_type
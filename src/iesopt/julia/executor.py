@@ -0,0 +1,48 @@
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from ..config import Config
+from ..util import logger
+
+
+_executor = None
+_local = threading.local()
+_warned = False
+
+
+def _init_thread():
+    _local.nogil = True
+
+
+def executor() -> ThreadPoolExecutor:
+    """The executor that runs all asynchronous Julia work, one call at a time, on a single dedicated thread."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="iesopt-julia", initializer=_init_thread)
+    return _executor
+
+
+def jl_call(f, *args, **kwargs):
+    """Call a Julia function, releasing the GIL while Julia runs if called from the executor (see `run`)."""
+    if getattr(_local, "nogil", False):
+        return f._jl_call_nogil(*args, **kwargs)
+    return f(*args, **kwargs)
+
+
+async def run(func, *args, **kwargs):
+    """Run `func` (which calls Julia) on the executor, without blocking the event loop.
+
+    Calling Julia from any thread other than the main one requires Julia to handle signals, which is only the case if
+    `IESOPT_MULTITHREADED` is enabled; otherwise, `func` is run directly (blocking the event loop).
+    """
+    global _warned
+    if not Config.get("multithreaded"):
+        if not _warned:
+            logger.warning("Asynchronous calls block the event loop, unless `IESOPT_MULTITHREADED` is enabled")
+            _warned = True
+        return func(*args, **kwargs)
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor(), functools.partial(func, *args, **kwargs))
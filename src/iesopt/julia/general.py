@@ -1,21 +1,57 @@
 import os
+import sys
+import time
+import threading
 import importlib.metadata
 from pathlib import Path
 
 from ..util import logger, set_iesopt_module_attr
 from .setup import setup_julia, import_modules, use_existing_julia_environment
+from .report import phase, record, startup_report
+from .helpers import jl_helper
+from ..threads import record_julia_threads
 
+_lock = threading.RLock()
+_initialized = False
 
-def initialize(target: Path, sysimage: Path, *, reuse_julia_env: bool = False):
+
+def ensure_initialized():
+    """Initialize Julia, based on the settings of the `iesopt` module, if that did not happen yet in this process."""
+    global _initialized
+
+    with _lock:
+        if _initialized:
+            return
+
+        # Mark as initialized upfront, which prevents recursing into the setup from inside the setup itself.
+        _initialized = True
+        try:
+            iesopt = sys.modules["iesopt"]
+            initialize(
+                iesopt.__target__,
+                iesopt.__sysimage__ if os.environ.get("IESOPT_USE_SYSIMAGE", "yes") == "yes" else None,
+                reuse_julia_env=os.environ.get("IESOPT_REUSE_JULIA_ENV", "no") == "yes",
+                shared_env=Path(os.environ["IESOPT_SHARED_ENV"]) if os.environ.get("IESOPT_SHARED_ENV") else None,
+            )
+        except BaseException:
+            _initialized = False
+            raise
+
+
+def initialize(target: Path, sysimage: Path | None, *, reuse_julia_env: bool = False, shared_env: Path | None = None):
     if os.getenv("IESOPT_DOCS_NOEXEC"):
         logger.warning("Detected docs environment (env. var. `IESOPT_DOCS_NOEXEC` is set), skip loading Julia")
         return
 
+    t0 = time.perf_counter()
+
     logger.info("Integrated Energy System Optimization (IESopt)")
     logger.info("    © 2021 - now:  AIT Austrian Institute of Technology GmbH")
     logger.info("    Documentation: https://ait-energy.github.io/iesopt")
 
-    if reuse_julia_env:
+    if shared_env is not None:
+        juliacall = use_existing_julia_environment(sysimage, shared=shared_env)
+    elif reuse_julia_env:
         juliacall = use_existing_julia_environment(sysimage)
     else:
         juliacall = setup_julia(target, sysimage)
@@ -29,14 +65,19 @@ def initialize(target: Path, sysimage: Path, *, reuse_julia_env: bool = False):
         "Loaded versions: py=%s, jl=%s" % (importlib.metadata.version("iesopt"), str(julia.pkgversion(julia.IESopt)))
     )
 
+    record_julia_threads(int(julia.Threads.nthreads()))
+
     set_iesopt_module_attr("IESopt", julia.IESopt)
     set_iesopt_module_attr("JuMP", julia.JuMP)
 
-    set_iesopt_module_attr("jump_value", julia.seval("(x) -> JuMP.value.(x)"))
-    set_iesopt_module_attr("jump_dual", julia.seval("(x) -> JuMP.dual.(x)"))
-    set_iesopt_module_attr("jump_reduced_cost", julia.seval("(x) -> JuMP.reduced_cost.(x)"))
-    set_iesopt_module_attr("jump_shadow_price", julia.seval("(x) -> JuMP.reduced_cost.(x)"))
+    with phase("helpers"):
+        for name in ["jump_value", "jump_dual", "jump_reduced_cost", "jump_shadow_price"]:
+            set_iesopt_module_attr(name, jl_helper(name))
+
+        set_iesopt_module_attr("Docs.doc", jl_helper("docs"))
 
-    set_iesopt_module_attr("Docs.doc", julia.seval("(x) -> Docs.doc(x)"))
+    record("initialized", True)
+    record("total", time.perf_counter() - t0)
+    startup_report(log=True)
 
     return julia
@@ -0,0 +1,518 @@
+from ..util import get_iesopt_module_attr
+
+
+# All Julia helper functions that the Python side relies on, defined (and therefore compiled) once per process. Named
+# functions (instead of anonymous closures) allow baking them, including their precompile statements, into a sysimage.
+HELPERS = """
+module IESoptPythonHelpers
+
+import IESopt
+import JuMP
+import Logging
+import PythonCall
+import Serialization
+
+jump_value(x) = JuMP.value.(x)
+jump_dual(x) = JuMP.dual.(x)
+jump_reduced_cost(x) = JuMP.reduced_cost.(x)
+jump_shadow_price(x) = JuMP.shadow_price.(x)
+
+docs(x) = Base.Docs.doc(x)
+
+isa_type(x, T::Type) = x isa T
+
+# Classify values returned from results containers, to convert them using a single call (see `Results._safe_convert`).
+classify(x::AbstractVector) = 1
+classify(x::AbstractDict) = 2
+classify(x::AbstractSet) = 3
+classify(x) = 0
+
+function set_threads(model, n::Integer)
+    JuMP.MOI.supports(JuMP.backend(model), JuMP.MOI.NumberOfThreads()) || return false
+    JuMP.set_attribute(model, JuMP.MOI.NumberOfThreads(), n)
+    return true
+end
+
+# Pack all results of all components into a few contiguous arrays, to extract them using a single call (see
+# `Results.to_dict`): `names` (component, fieldtype, and field of each result, all joined using "\0"), `kinds` (0 =
+# scalar, 1 = vector, 2 = other, which is not packed), and `offsets` into `buffer` that hold the values of each result.
+# Using `values = false` only collects names and kinds (e.g., to index all results without extracting them).
+function pack_results(components, fieldtypes, values::Bool=true)
+    names, kinds, offsets, buffer = String[], Int8[], Int[0], Float64[]
+    for (c, component) in components, t in fieldtypes
+        hasproperty(component, Symbol(t)) || continue
+        container = getproperty(component, Symbol(t))
+        for f in keys(container)
+            value = getproperty(container, Symbol(f))
+            push!(names, string(c), string(t), string(f))
+            if value isa AbstractFloat
+                push!(kinds, 0)
+                values && push!(buffer, value)
+            elseif value isa AbstractVector{<:AbstractFloat}
+                push!(kinds, 1)
+                values && append!(buffer, value)
+            else
+                push!(kinds, 2)
+            end
+            push!(offsets, length(buffer))
+        end
+    end
+    return (names=join(names, '\0'), kinds=kinds, offsets=offsets, buffer=buffer)
+end
+
+# Set (or unset, using `nothing`) the time limit of the solver; returns the previous one.
+function set_time_limit(model, seconds)
+    previous = JuMP.time_limit_sec(model)
+    isnothing(seconds) ? JuMP.set_time_limit_sec(model, nothing) : JuMP.set_time_limit_sec(model, Float64(seconds))
+    return previous
+end
+
+# Whether the solver of a model can be asked to stop while it is running (see `interrupt`).
+can_interrupt(model) = nameof(parentmodule(typeof(JuMP.unsafe_backend(model)))) == :Gurobi
+
+# Ask the solver of a (running) model to stop as soon as possible; returns `false` if the solver does not support it.
+function interrupt(model)
+    can_interrupt(model) || return false
+    optimizer = JuMP.unsafe_backend(model)
+    parentmodule(typeof(optimizer)).GRBterminate(optimizer)
+    return true
+end
+
+# Optimize a model, interrupting the solver once the byte at `address` (owned by Python) is set. Setting it does not
+# call into Julia, so it is safe from any Python thread while this runs; a task on another Julia thread polls it.
+function optimize_interruptible(model, address::Integer)
+    flag = Ptr{UInt8}(UInt(address))
+    done = Threads.Atomic{Bool}(false)
+    watcher = Threads.@spawn while !done[]
+        if unsafe_load(flag) != 0
+            interrupt(model)
+            break
+        end
+        sleep(0.05)
+    end
+    try
+        IESopt.optimize!(model)
+    finally
+        done[] = true
+        wait(watcher)
+    end
+    return nothing
+end
+
+# Build a `DataFrame` from columns passed from Python, without copying them (numerical columns are views into NumPy
+# arrays, see `_convert_dataframe`). Other columns use `missing` for `None`, and are narrowed to their element types.
+_column(column) = column
+_column(column::Vector{Any}) = identity.(replace(column, nothing => missing))
+function dataframe(names, columns)
+    return IESopt.DataFrames.DataFrame(Any[_column(c) for c in columns], collect(String, names); copycols=false)
+end
+
+# Build nested containers from a tree that was flattened in pre-order (see `recursive_convert_py2jl`), so that converting
+# arbitrarily nested keyword arguments only takes a single call. For each node, `kinds` holds its kind (0 = value, 1 =
+# `Dict{String, Any}`, 2 = `Vector{Any}`, 3 = numerical vector), `sizes` its number of children, `keys` its key in the
+# parent dict, and `values` its value (for kinds 0 and 3).
+function build_tree(kinds, sizes, keys, values)
+    kinds, sizes = Vector{Int}(kinds), Vector{Int}(sizes)
+    keys, values = collect(String, keys), collect(Any, values)
+
+    pos = Ref(0)
+    function node()
+        i = (pos[] += 1)
+        if kinds[i] == 1
+            dict = Dict{String, Any}()
+            for _ in 1:sizes[i]
+                key = keys[pos[] + 1]
+                dict[key] = node()
+            end
+            return dict
+        elseif kinds[i] == 2
+            return Any[node() for _ in 1:sizes[i]]
+        elseif kinds[i] == 3
+            return collect(values[i])
+        end
+        return values[i]
+    end
+
+    return node()
+end
+
+file_format(name::String) = getfield(JuMP.MOI.FileFormats, Symbol("FORMAT_", uppercase(name)))
+
+# In-place updates of generated models: a snapshot contains all values (objective coefficients, constraint coefficients
+# and right-hand sides, variable bounds) that can be modified without changing the structure of the model. Keys are
+# `(kind, index, variable index)`, where `index` is a variable index (`:obj`, `:lb`, `:ub`, `:fix`), or the position of
+# the constraint in `_affine_constraints` (`:rhs`, `:coef`).
+const _AffineSets = Union{JuMP.MOI.LessThan{Float64}, JuMP.MOI.GreaterThan{Float64}, JuMP.MOI.EqualTo{Float64}}
+
+function _affine_constraints(model)
+    constraints = JuMP.ConstraintRef[]
+    for (F, S) in JuMP.list_of_constraint_types(model)
+        (F == JuMP.AffExpr && S <: _AffineSets) || continue
+        append!(constraints, JuMP.all_constraints(model, F, S))
+    end
+    return constraints
+end
+
+_isapprox(x, y) = isapprox(x, y; rtol=1e-8, atol=1e-10)
+
+function snapshot(model)
+    objective = JuMP.objective_function(model)
+    (objective isa Union{JuMP.AffExpr, JuMP.VariableRef}) || error("Only linear objective functions are supported")
+    objective = convert(JuMP.AffExpr, objective)
+
+    values = Dict{Tuple{Symbol, Int, Int}, Float64}((:obj_constant, 0, 0) => objective.constant)
+    for (v, c) in objective.terms
+        values[(:obj, JuMP.index(v).value, 0)] = c
+    end
+    for (i, c) in enumerate(_affine_constraints(model))
+        values[(:rhs, i, 0)] = JuMP.normalized_rhs(c)
+        for (v, a) in JuMP.constraint_object(c).func.terms
+            values[(:coef, i, JuMP.index(v).value)] = a
+        end
+    end
+    for v in JuMP.all_variables(model)
+        k = JuMP.index(v).value
+        JuMP.has_lower_bound(v) && (values[(:lb, k, 0)] = JuMP.lower_bound(v))
+        JuMP.has_upper_bound(v) && (values[(:ub, k, 0)] = JuMP.upper_bound(v))
+        JuMP.is_fixed(v) && (values[(:fix, k, 0)] = JuMP.fix_value(v))
+    end
+
+    structure = (
+        JuMP.num_variables(model),
+        [(F, S, JuMP.num_constraints(model, F, S)) for (F, S) in JuMP.list_of_constraint_types(model)],
+    )
+    return (structure=structure, values=values)
+end
+
+function _check_structure(base, probe)
+    base.structure == probe.structure && return nothing
+    error("Change alters the structure of the model (variables or constraints); it requires `generate` instead")
+end
+
+# Sensitivity of a generated model (`base`) w.r.t. a scalar parameter, based on two models generated using the
+# parameter values `a` and `b`. Returns the (derived) parameter value of `base`, and `(base value, slope)` of all
+# values that depend on it; fails if the model does not depend affinely on the parameter.
+function scalar_sensitivity(base, probe_a, a::Float64, probe_b, b::Float64)
+    _check_structure(base, probe_a)
+    _check_structure(base, probe_b)
+
+    entries = Dict{Tuple{Symbol, Int, Int}, Tuple{Float64, Float64}}()
+    p0, max_slope = a, 0.0
+    for k in union(keys(base.values), keys(probe_a.values), keys(probe_b.values))
+        va, vb, v0 = get(probe_a.values, k, 0.0), get(probe_b.values, k, 0.0), get(base.values, k, 0.0)
+        (_isapprox(va, v0) && _isapprox(vb, v0)) && continue
+        slope = (vb - va) / (b - a)
+        entries[k] = (v0, slope)
+        if abs(slope) > max_slope
+            p0, max_slope = a + (v0 - va) / slope, abs(slope)
+        end
+    end
+
+    # Check that all values are consistent with a single (affine) dependency on the parameter.
+    for (k, (v0, slope)) in entries
+        _isapprox(get(probe_a.values, k, 0.0) + slope * (p0 - a), v0) && continue
+        error("Model does not depend affinely on the parameter; it requires `generate` instead")
+    end
+
+    return (p0=p0, entries=entries)
+end
+
+# Whether two sensitivities share any value, i.e., whether both parameters enter the same coefficient, bound, ...
+sensitivities_overlap(a, b) = !isdisjoint(keys(a.entries), keys(b.entries))
+
+# Check that all values depend jointly affinely on multiple parameters (e.g., not on `<price> * <factor>`), based on a
+# model generated after changing all of them at once (by `deltas`), compared to the sum of the single sensitivities.
+function check_joint_sensitivity(base, probe, sensitivities, deltas)
+    _check_structure(base, probe)
+    predicted = Dict{Tuple{Symbol, Int, Int}, Float64}()
+    for (sensitivity, delta) in zip(sensitivities, deltas)
+        for (k, (v0, slope)) in sensitivity.entries
+            predicted[k] = get(predicted, k, v0) + slope * delta
+        end
+    end
+    for (k, value) in predicted
+        _isapprox(get(probe.values, k, 0.0), value) && continue
+        error("Model depends on multiple parameters jointly (e.g., their product); it requires `generate` instead")
+    end
+    return nothing
+end
+
+function _set_values!(model, values)
+    variables = Dict(JuMP.index(v).value => v for v in JuMP.all_variables(model))
+    constraints = _affine_constraints(model)
+    for ((kind, i, j), value) in values
+        if kind == :obj
+            JuMP.set_objective_coefficient(model, variables[i], value)
+        elseif kind == :obj_constant
+            F = JuMP.MOI.ScalarAffineFunction{Float64}
+            JuMP.MOI.modify(JuMP.backend(model), JuMP.MOI.ObjectiveFunction{F}(), JuMP.MOI.ScalarConstantChange(value))
+        elseif kind == :rhs
+            JuMP.set_normalized_rhs(constraints[i], value)
+        elseif kind == :coef
+            JuMP.set_normalized_coefficient(constraints[i], variables[j], value)
+        elseif kind == :lb
+            JuMP.set_lower_bound(variables[i], value)
+        elseif kind == :ub
+            JuMP.set_upper_bound(variables[i], value)
+        elseif kind == :fix
+            JuMP.fix(variables[i], value)
+        end
+    end
+    return nothing
+end
+
+# Sensitivity of a generated model (`base`) w.r.t. a column of a time series, based on two models generated after
+# shifting each row `t` by `steps[t]` (`probe_uniform`), and by `steps[t] * t / nrows` (`probe_rows`). Returns `(base
+# value, slope, row)` of all values that depend on the column; fails if any value does not depend affinely on exactly
+# one row of it.
+function column_sensitivity(base, probe_uniform, probe_rows, steps::AbstractVector{<:Real})
+    _check_structure(base, probe_uniform)
+    _check_structure(base, probe_rows)
+
+    nrows = length(steps)
+    entries = Dict{Tuple{Symbol, Int, Int}, Tuple{Float64, Float64, Int}}()
+    for k in union(keys(base.values), keys(probe_uniform.values), keys(probe_rows.values))
+        v0 = get(base.values, k, 0.0)
+        vu, vr = get(probe_uniform.values, k, 0.0), get(probe_rows.values, k, 0.0)
+        if _isapprox(vu, v0)
+            _isapprox(vr, v0) && continue
+            error("Model does not depend affinely on the time series; it requires `generate` instead")
+        end
+
+        position = (vr - v0) / (vu - v0) * nrows
+        row = round(Int, position)
+        if !(1 <= row <= nrows && isapprox(position, row; atol=1e-3))
+            error("Model depends on multiple rows of the time series at once (e.g., using a sum); it requires `generate`")
+        end
+        entries[k] = (v0, (vu - v0) / steps[row], row)
+    end
+
+    return (entries=entries,)
+end
+
+# Set all values that depend on parameters or time series, based on their change w.r.t. to their base values: `deltas`
+# contains one number for each (scalar) parameter, `column_deltas` one vector for each column of a time series.
+function apply_updates(model, sensitivities, deltas, column_sensitivities, column_deltas)
+    values = Dict{Tuple{Symbol, Int, Int}, Float64}()
+    for (sensitivity, delta) in zip(sensitivities, deltas)
+        for (k, (v0, slope)) in sensitivity.entries
+            values[k] = get(values, k, v0) + slope * delta
+        end
+    end
+    for (sensitivity, delta) in zip(column_sensitivities, column_deltas)
+        for (k, (v0, slope, row)) in sensitivity.entries
+            values[k] = get(values, k, v0) + slope * delta[row]
+        end
+    end
+    _set_values!(model, values)
+    return length(values)
+end
+
+# Warm starts: primal values of all variables (in the order of `JuMP.all_variables`), and setting them as start values.
+primal_values(model) = JuMP.value.(JuMP.all_variables(model))
+
+function set_start_values(model, values)
+    variables = JuMP.all_variables(model)
+    length(variables) == length(values) || error("Number of start values does not match the number of variables")
+    JuMP.set_start_value.(variables, values)
+    return nothing
+end
+
+set_variable_start_values(variables, values) = (JuMP.set_start_value.(variables, values); nothing)
+
+function solve_stats(model)
+    stat(f) = try
+        f(model)
+    catch
+        nothing
+    end
+    return Dict{String, Any}(
+        "solve_time" => stat(JuMP.solve_time),
+        "simplex_iterations" => stat(JuMP.simplex_iterations),
+        "barrier_iterations" => stat(JuMP.barrier_iterations),
+        "node_count" => stat(JuMP.node_count),
+    )
+end
+
+# Copy of a generated model, including all IESopt data (components, ...), without a solver attached; returns the copy,
+# and the solver (`nothing` if none) of the original model.
+# Numerical columns of DataFrames passed from Python (see `dataframe`), and other NumPy arrays passed as values, are views
+# into memory that Python owns: a deep copy would keep pointing to the original array, and serializing one loses it. This
+# registers a copy (that owns its arrays) of each container holding such views in `stackdict`, which `deepcopy_internal`
+# then uses instead of copying the container itself.
+_owned(x, stackdict) = x isa PythonCall.PyArray ? Array(x) : Base.deepcopy_internal(x, stackdict)
+_skip_views(x) = x isa Union{Module, Type, Function, JuMP.AbstractModel, PythonCall.Py, PythonCall.PyArray}
+_skip_views(x::AbstractArray) = isbitstype(eltype(x)) || eltype(x) <: JuMP.AbstractJuMPScalar
+function _own_views!(stackdict, x, seen=Base.IdSet{Any}())
+    (isbits(x) || _skip_views(x)) && return
+    if ismutable(x)
+        x in seen && return
+        push!(seen, x)
+    end
+
+    if x isa IESopt.DataFrames.DataFrame
+        columns = IESopt.DataFrames.eachcol(x)
+        any(c -> c isa PythonCall.PyArray, columns) || return
+        owned = Any[_owned(c, stackdict) for c in columns]
+        stackdict[x] = IESopt.DataFrames.DataFrame(owned, IESopt.DataFrames.names(x); copycols=false)
+    elseif x isa AbstractDict
+        foreach(v -> _own_views!(stackdict, v, seen), values(x))
+        any(v -> v isa PythonCall.PyArray, values(x)) || return
+        stackdict[x] = typeof(x)(Base.deepcopy_internal(k, stackdict) => _owned(v, stackdict) for (k, v) in x)
+    elseif x isa Vector
+        foreach(v -> _own_views!(stackdict, v, seen), x)
+        any(v -> v isa PythonCall.PyArray, x) || return
+        stackdict[x] = eltype(x)[_owned(v, stackdict) for v in x]
+    elseif !(x isa AbstractArray)
+        for i in 1:nfields(x)
+            isdefined(x, i) && _own_views!(stackdict, getfield(x, i), seen)
+        end
+    end
+    return nothing
+end
+
+function _detached_copy(model)
+    optimizer = try
+        JuMP.unsafe_backend(model)
+    catch
+        nothing
+    end
+
+    # `copy_model` warns about extension data (which is copied below).
+    new_model, reference_map = Logging.with_logger(Logging.NullLogger()) do
+        return JuMP.copy_model(model)
+    end
+
+    # All references (e.g., inside of components) are copied as is, which requires identical indices.
+    for v in JuMP.all_variables(model)
+        JuMP.index(reference_map[v]) == JuMP.index(v) || error("Cannot copy a model with non-contiguous variables")
+    end
+    for (F, S) in JuMP.list_of_constraint_types(model), c in JuMP.all_constraints(model, F, S)
+        JuMP.index(reference_map[c]) == JuMP.index(c) || error("Cannot copy a model with non-contiguous constraints")
+    end
+
+    # Deep copy all extension data, replacing each reference to the model with the new one (which, e.g., turns every
+    # `VariableRef` into the respective variable of the new model), and each view into a NumPy array with a copy.
+    stackdict = IdDict{Any, Any}(model => new_model)
+    _own_views!(stackdict, model.ext)
+    for (key, data) in model.ext
+        new_model.ext[key] = Base.deepcopy_internal(data, stackdict)
+    end
+
+    return new_model, optimizer
+end
+
+# All attributes that the solver reports (or, if it does not support that, a few common ones), with their values.
+function _optimizer_attributes(optimizer)
+    attributes = try
+        JuMP.MOI.get(optimizer, JuMP.MOI.ListOfOptimizerAttributesSet())
+    catch
+        [JuMP.MOI.Silent(), JuMP.MOI.TimeLimitSec(), JuMP.MOI.NumberOfThreads()]
+    end
+
+    values = Pair{Any, Any}[]
+    for attr in attributes
+        try
+            push!(values, attr => JuMP.MOI.get(optimizer, attr))
+        catch
+        end
+    end
+    return values
+end
+
+function _attach_optimizer(model, optimizer_type, attributes)
+    JuMP.set_optimizer(model, optimizer_type)
+    for (attr, value) in attributes
+        try
+            JuMP.MOI.set(model, attr, value)
+        catch
+        end
+    end
+    return nothing
+end
+
+# Clone a generated model, attaching a new instance of the same solver.
+function clone_model(model)
+    new_model, optimizer = _detached_copy(model)
+    isnothing(optimizer) || _attach_optimizer(new_model, typeof(optimizer), _optimizer_attributes(optimizer))
+    return new_model
+end
+
+# Save a generated model (without its solver, which is attached again on loading). The header contains everything that
+# is needed before deserializing the model: the fingerprint of the environment (see `Config.fingerprint`), the package
+# that defines the solver, and arbitrary `metadata` (bytes) of the Python side.
+function save_model(model, filename::String, fingerprint::String, metadata)
+    new_model, optimizer = _detached_copy(model)
+    solver = isnothing(optimizer) ? nothing : (typeof(optimizer), _optimizer_attributes(optimizer))
+    pkg = isnothing(optimizer) ? nothing : Base.PkgId(parentmodule(typeof(optimizer)))
+
+    open(filename, "w") do io
+        Serialization.serialize(io, (fingerprint=fingerprint, pkg=pkg, metadata=Vector{UInt8}(metadata)))
+        Serialization.serialize(io, (model=new_model, solver=solver))
+    end
+    return nothing
+end
+
+function load_model(filename::String, fingerprint::String)
+    return open(filename, "r") do io
+        header = Serialization.deserialize(io)
+        if header.fingerprint != fingerprint
+            error("Model was saved using a different environment (Julia, IESopt.jl, or solver versions); generate it")
+        end
+        isnothing(header.pkg) || Base.require(header.pkg)
+
+        # The solver package may have just been loaded, which requires running in the latest world.
+        model = Base.invokelatest() do
+            data = Serialization.deserialize(io)
+            isnothing(data.solver) || _attach_optimizer(data.model, data.solver...)
+            return data.model
+        end
+        return (model=model, metadata=header.metadata)
+    end
+end
+
+# Paths (relative to the top-level config file) of all inputs that a model may read; see `iesopt.cache`.
+function input_paths(filename::String)
+    data = IESopt.YAML.load_file(filename)
+    paths = get(get(data, "config", Dict()), "paths", Dict())
+    folders = Dict{String, String}(k => string(get(paths, k, k)) for k in ("files", "templates", "components", "addons"))
+    parameters = get(data, "parameters", nothing)
+    return (folders=folders, parameters=(parameters isa AbstractString ? String(parameters) : nothing))
+end
+
+function add_obj_threshold_constraint(model, obj, ub)
+    JuMP.@constraint(model, IESopt.internal(model).model.objectives[obj].expr <= ub)
+    return nothing
+end
+
+function set_weighted_objective(model, objs)
+    objectives = IESopt.internal(model).model.objectives
+    JuMP.@objective(model, Min, sum(objectives[name].expr * weight for (name, weight) in objs))
+    return nothing
+end
+
+end
+"""
+
+_helpers = {}
+_types = {}
+
+
+def jl_helper(name: str):
+    """Get a compiled Julia helper function (see `HELPERS`), defining all of them on first access."""
+    helper = _helpers.get(name)
+    if helper is None:
+        julia = get_iesopt_module_attr("julia")
+        if len(_helpers) == 0 and not julia.seval("isdefined(Main, :IESoptPythonHelpers)"):
+            # Not baked into the sysimage, define them now.
+            julia.seval(HELPERS)
+        helper = _helpers[name] = getattr(julia.IESoptPythonHelpers, name)
+    return helper
+
+
+def jl_type(name: str):
+    """Get a Julia type (e.g., `"Dict{String, Any}"`), parsing and evaluating it only on first access."""
+    jl_t = _types.get(name)
+    if jl_t is None:
+        jl_t = _types[name] = get_iesopt_module_attr("julia").seval(name)
+    return jl_t
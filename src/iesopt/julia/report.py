@@ -0,0 +1,61 @@
+import time
+import copy
+from contextlib import contextmanager
+
+from ..util import logger
+
+
+_report = {"initialized": False, "total": None, "environment": None, "sysimage": None, "phases": {}}
+
+
+@contextmanager
+def phase(name: str):
+    """Time a phase of the startup, adding up the time if the same phase is entered multiple times."""
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        _report["phases"][name] = _report["phases"].get(name, 0.0) + (time.perf_counter() - t0)
+
+
+def record(key: str, value):
+    """Record an (untimed) property of the startup, e.g., the sysimage that was used."""
+    _report[key] = value
+
+
+def startup_report(*, log: bool = False) -> dict:
+    """
+    Get a report on the startup of Julia in the current process, containing the time (in seconds) spent in each phase.
+
+    Keyword Arguments:
+        log (bool): Whether to also write the report to the logger (at `INFO` level), defaults to `False`.
+
+    Returns:
+        Dictionary with the entries `initialized` (whether Julia was set up in this process), `total` (total time of
+        the setup), `environment` (`"cached"` if the environment setup was skipped based on the config fingerprint,
+        `"resolved"` if it was set up, `"reused"` if `IESOPT_REUSE_JULIA_ENV` is active, `"shared"` if `IESOPT_SHARED_ENV`
+        is active), `sysimage` (path of the custom sysimage that was used, or `None`), and `phases` (mapping each phase
+        to its time).
+
+    Example:
+        ..  code-block:: python
+            :caption: Inspecting the startup
+
+            import iesopt
+            model = iesopt.run("opt/config.iesopt.yaml")
+            iesopt.startup_report(log=True)
+    """
+    report = copy.deepcopy(_report)
+
+    if log:
+        if not report["initialized"]:
+            logger.info("Startup report: Julia was not initialized (yet)")
+        else:
+            logger.info(
+                "Startup report: %.2fs total (environment: %s, sysimage: %s)"
+                % (report["total"], report["environment"], report["sysimage"] or "default")
+            )
+            for name, elapsed in report["phases"].items():
+                logger.info("    %s %.3fs" % (name.ljust(24, "."), elapsed))
+
+    return report
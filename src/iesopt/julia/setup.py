@@ -2,10 +2,13 @@ import os
 import sys
 from pathlib import Path
 import ssl
+from contextlib import contextmanager
 
 from ..util import logger
 from .util import jl_import
+from .report import phase, record
 from ..config import Config
+from ..threads import allocation
 
 
 def lookup_package(name: str):
@@ -48,6 +51,10 @@ def _handle_env_vars():
         os.environ["PYTHON_JULIACALL_THREADS"] = "1"
         os.environ["PYTHON_JULIACALL_HANDLE_SIGNAL"] = "no"
 
+    alloc = allocation()
+    if alloc is not None:
+        os.environ["PYTHON_JULIACALL_THREADS"] = str(alloc["julia"])
+
     opt = Config.get("optimization")
     if opt == "rapid":
         os.environ["PYTHON_JULIACALL_COMPILE"] = "min"
@@ -57,7 +64,7 @@ def _handle_env_vars():
         os.environ["PYTHON_JULIACALL_COMPILE"] = "yes"
         os.environ["PYTHON_JULIACALL_OPTIMIZE"] = "0"
         os.environ["PYTHON_JULIACALL_MIN_OPTLEVEL"] = "0"
-    elif opt == "default":
+    elif opt in ["normal", "default"]:
         pass
     elif opt == "performance":
         os.environ["PYTHON_JULIACALL_COMPILE"] = "all"
@@ -67,8 +74,12 @@ def _handle_env_vars():
         raise Exception(f"Unknown optimization setting '{opt}'")
 
 
-def _handle_sysimage(sysimage: Path):
-    if sysimage.exists():
+def _handle_sysimage(sysimage: Path | None):
+    record("sysimage", str(sysimage) if (sysimage is not None and sysimage.exists()) else None)
+
+    if sysimage is None:
+        logger.info("    Using default sysimage (custom sysimages are disabled)")
+    elif sysimage.exists():
         logger.info("    Using custom sysimage: %s" % str(sysimage))
         os.environ["PYTHON_JULIACALL_SYSIMAGE"] = str(sysimage)
     else:
@@ -79,7 +90,10 @@ def _handle_sysimage(sysimage: Path):
         )
 
 
-def use_existing_julia_environment(sysimage: Path):
+def use_existing_julia_environment(sysimage: Path | None, *, shared: Path | None = None):
+    if shared is not None:
+        return _use_shared_julia_environment(sysimage, shared)
+
     logger.info(
         "    Reusing existing Julia environment; if you encounter issues or strange behavior, consider disabling this "
         "option at least for one import. This is especially recommended after upgrading `iesopt` or if you use custom "
@@ -93,6 +107,7 @@ def use_existing_julia_environment(sysimage: Path):
             " this message, but we cannot guarantee anything to work as expected."
         )
 
+    record("environment", "reused")
     _handle_env_vars()
     _handle_sysimage(sysimage)
 
@@ -112,18 +127,39 @@ def use_existing_julia_environment(sysimage: Path):
                 + "variable (e.g., by using 'export LD_LIBRARY_PATH=\"...\"')to: '%s'." % libdir
             )
 
-    logger.info("    Executable: %s" % juliapkg.executable())
-    logger.info("    Project: %s" % juliapkg.project())
+    with phase("juliapkg_executable"):
+        logger.info("    Executable: %s" % juliapkg.executable())
+        logger.info("    Project: %s" % juliapkg.project())
     os.environ["PYTHON_JULIACALL_BINDIR"] = str(Path(juliapkg.executable()).parent)
 
-    import juliacall
+    with phase("import_juliacall"):
+        import juliacall
+
+    logger.info("Julia setup complete")
+
+    return juliacall
+
+
+def _use_shared_julia_environment(sysimage: Path | None, shared: Path):
+    from .shared import shared_environment, SYSIMAGE
+
+    logger.info("    Using shared Julia environment (read-only): '%s'" % shared)
+    record("environment", "shared")
+    _handle_env_vars()
+    _handle_sysimage(None if sysimage is None else shared / SYSIMAGE)
+
+    # Points `juliacall` directly to the exported Julia executable and project, which skips `juliapkg` entirely.
+    os.environ.update(shared_environment(shared))
+
+    with phase("import_juliacall"):
+        import juliacall
 
     logger.info("Julia setup complete")
 
     return juliacall
 
 
-def setup_julia(target: Path, sysimage: Path):
+def setup_julia(target: Path, sysimage: Path | None):
     target.mkdir(exist_ok=True)
     target_fullpath = str(target.resolve())
     logger.info(f"    Target for juliapkg: '{target_fullpath}/juliapkg.json'")
@@ -146,70 +182,184 @@ def setup_julia(target: Path, sysimage: Path):
             " this message, but we cannot guarantee anything to work as expected."
         )
 
+    # Make the `juliapkg.json` inside `target` visible to `juliapkg`.
+    sys.path.insert(0, target_fullpath)
+
+    # Skip (re-)writing and resolving the environment if it was already set up using the exact same config.
+    with phase("fingerprint"):
+        fingerprint = Config.fingerprint()
+        current = _is_environment_current(target, fingerprint)
+    if current:
+        logger.info("    Julia environment matches the current config (fingerprint: %s)" % fingerprint[:12])
+        record("environment", "cached")
+        return _load_juliacall(sysimage)
+
+    # Only one process (e.g., out of many cluster workers that start at the same time) sets up the environment, while
+    # all others wait for it to finish, and then reuse it.
+    juliacall = None
+    with _setup_lock(target):
+        if _is_environment_current(target, fingerprint):
+            logger.info("    Julia environment was set up by another process (fingerprint: %s)" % fingerprint[:12])
+            record("environment", "cached")
+        else:
+            record("environment", "resolved")
+            juliacall = _setup_environment(target, sysimage, fingerprint)
+
+    if juliacall is None:
+        juliacall = _load_juliacall(sysimage)
+
+    return juliacall
+
+
+@contextmanager
+def _setup_lock(target: Path):
+    """Exclusive (inter-process) lock on setting up the Julia environment inside `target`."""
+    from filelock import FileLock, Timeout
+
+    lock = FileLock(target / ".setup.lock")
+    with phase("lock"):
+        try:
+            lock.acquire(timeout=0)
+        except Timeout:
+            logger.info("    Waiting for another process to finish setting up the Julia environment")
+            lock.acquire()
+
+    try:
+        yield
+    finally:
+        lock.release()
+
+
+def _setup_environment(target: Path, sysimage: Path | None, fingerprint: str):
+    target_fullpath = str(target.resolve())
+
+    # Invalidate the fingerprint first, so that no other process reuses the environment while it is being modified.
+    _fingerprint_file().unlink(missing_ok=True)
+
     if (target / "juliapkg.json").exists():
         (target / "juliapkg.json").unlink()
 
-    # Check for local SSL certificate file, that can interfere with Julia setup.
-    _ssl = None
-    if "SSL_CERT_FILE" in os.environ:
-        logger.debug("Detected local `SSL_CERT_FILE`; disabling it during Julia setup")
-        _ssl = os.environ.pop("SSL_CERT_FILE")
-
-    ssl._create_default_https_context = ssl._create_unverified_context
-    logger.info("Disabling SSL verification to prevent problems; this may be unsafe")
-
-    # Set `JULIA_SSL_CA_ROOTS_PATH` to prevent various SSL related issues (with Julia setup; LibGit2; etc.).
-    if "JULIA_SSL_CA_ROOTS_PATH" in os.environ:
-        if os.environ["JULIA_SSL_CA_ROOTS_PATH"] != "":
-            logger.info(
-                "Overwriting the env. variable `JULIA_SSL_CA_ROOTS_PATH` (current: `%s`) to prevent SSL issues during the Julia setup"
-                % str(os.environ["JULIA_SSL_CA_ROOTS_PATH"])
-            )
+    with phase("ssl"):
+        # Check for local SSL certificate file, that can interfere with Julia setup.
+        _ssl = None
+        if "SSL_CERT_FILE" in os.environ:
+            logger.debug("Detected local `SSL_CERT_FILE`; disabling it during Julia setup")
+            _ssl = os.environ.pop("SSL_CERT_FILE")
+
+        ssl._create_default_https_context = ssl._create_unverified_context
+        logger.info("Disabling SSL verification to prevent problems; this may be unsafe")
+
+        # Set `JULIA_SSL_CA_ROOTS_PATH` to prevent various SSL related issues (with Julia setup; LibGit2; etc.).
+        if "JULIA_SSL_CA_ROOTS_PATH" in os.environ:
+            if os.environ["JULIA_SSL_CA_ROOTS_PATH"] != "":
+                logger.info(
+                    "Overwriting the env. variable `JULIA_SSL_CA_ROOTS_PATH` (current: `%s`) to prevent SSL issues during the Julia setup"
+                    % str(os.environ["JULIA_SSL_CA_ROOTS_PATH"])
+                )
+                os.environ["JULIA_SSL_CA_ROOTS_PATH"] = ""
+        else:
+            logger.debug('Setting `JULIA_SSL_CA_ROOTS_PATH = ""` to prevent SSL issues during the Julia setup')
             os.environ["JULIA_SSL_CA_ROOTS_PATH"] = ""
-    else:
-        logger.debug('Setting `JULIA_SSL_CA_ROOTS_PATH = ""` to prevent SSL issues during the Julia setup')
-        os.environ["JULIA_SSL_CA_ROOTS_PATH"] = ""
 
     # Setup Julia (checking if it "looks" valid).
-    sys.path.insert(0, target_fullpath)
     import juliapkg
 
-    # Check allowed/existing `juliapkg.json` files.
-    allowed_deps_files = [("juliacall", "juliapkg"), ("juliapkg", "juliapkg")]
-    all_deps_files = juliapkg.deps.deps_files()
-    for f in all_deps_files:
-        f, p = Path(f), Path(f).parent
-        if any((p.stem == el[0] and f.stem == el[1]) for el in allowed_deps_files):
-            logger.debug("   Detected valid `juliapkg.json` file: '%s'" % f)
-            continue
-        logger.warning("Detected invalid `juliapkg.json` file, renaming to render it stale: '%s'" % f)
-        f.rename(f.with_suffix(".json.DISABLED"))
-
-    # Set Julia version.
-    juliapkg.require_julia(f"={Config.get('julia')}", target=target_fullpath)
-    # add_package(juliapkg.add, "pythoncall", "0.9.23", target)
-
-    # Set versions of "core" packages.
-    add_package(juliapkg.add, "jump", Config.get("jump"), target=target_fullpath)
-    add_package(juliapkg.add, "iesopt", Config.get("core"), target=target_fullpath)
-
-    # Set versions of "solver" packages.
-    for entry in Config.find("solver_"):
-        name = entry[7:]
-        add_package(juliapkg.add, name, Config.get(entry), target=target_fullpath)
-
-    if not juliapkg.resolve(dry_run=True):
+    with phase("juliapkg_setup"):
+        # Check allowed/existing `juliapkg.json` files.
+        allowed_deps_files = [("juliacall", "juliapkg"), ("juliapkg", "juliapkg")]
+        all_deps_files = juliapkg.deps.deps_files()
+        for f in all_deps_files:
+            f, p = Path(f), Path(f).parent
+            if any((p.stem == el[0] and f.stem == el[1]) for el in allowed_deps_files):
+                logger.debug("   Detected valid `juliapkg.json` file: '%s'" % f)
+                continue
+            logger.warning("Detected invalid `juliapkg.json` file, renaming to render it stale: '%s'" % f)
+            f.rename(f.with_suffix(".json.DISABLED"))
+
+        # Set Julia version.
+        juliapkg.require_julia(f"={Config.get('julia')}", target=target_fullpath)
+        # add_package(juliapkg.add, "pythoncall", "0.9.23", target)
+
+        # Set versions of "core" packages.
+        add_package(juliapkg.add, "jump", Config.get("jump"), target=target_fullpath)
+        add_package(juliapkg.add, "iesopt", Config.get("core"), target=target_fullpath)
+
+        # Set versions of "solver" packages.
+        for entry in Config.find("solver_"):
+            name = entry[7:]
+            add_package(juliapkg.add, name, Config.get(entry), target=target_fullpath)
+
+    with phase("resolve_dry_run"):
+        resolved = juliapkg.resolve(dry_run=True)
+    if not resolved:
         logger.warning("The Julia environment is dirty and needs to be resolved, which can take some time")
-        if not juliapkg.resolve(dry_run=False):
-            raise Exception("Julia setup is not valid")
+        with phase("resolve"):
+            if not juliapkg.resolve(dry_run=False):
+                raise Exception("Julia setup is not valid")
 
     logger.info("Julia environment ready, loading Julia")
 
+    juliacall = _load_juliacall(sysimage)
+
+    complete = True
+    custom_packages = list(Config.find("PKG_"))
+    with phase("custom_packages"):
+        if len(custom_packages) > 0:
+            logger.info("Installing custom Julia packages")
+
+            try:
+                juliacall.Main.seval("import Pkg")
+            except Exception as e:
+                complete = False
+                logger.error(f"Failed to import Julia `Pkg`: {e}")
+
+            for entry in custom_packages:
+                name = entry[4:]
+                try:
+                    juliacall.Main.Pkg.add(name=name, version=Config.get(entry))
+                except Exception as e:
+                    complete = False
+                    logger.error(f"Failed to install custom package '{name}': {e}")
+
+    # Restoring potential SSL certificate.
+    if _ssl is not None:
+        logger.debug("Restoring local `SSL_CERT_FILE`")
+        os.environ["SSL_CERT_FILE"] = _ssl
+
+    # Remember the config that this environment was set up with, which allows skipping the setup next time.
+    if complete:
+        _fingerprint_file().parent.mkdir(parents=True, exist_ok=True)
+        _fingerprint_file().write_text(fingerprint)
+
+    return juliacall
+
+
+def _fingerprint_file() -> Path:
+    """Location of the config fingerprint, stored next to the metadata of the resolved `juliapkg` environment."""
+    from juliapkg.state import STATE
+
+    return Path(STATE["prefix"]) / "iesopt_fingerprint"
+
+
+def _is_environment_current(target: Path, fingerprint: str) -> bool:
+    if not (target / "juliapkg.json").exists():
+        return False
+
+    try:
+        return _fingerprint_file().read_text().strip() == fingerprint
+    except OSError:
+        return False
+
+
+def _load_juliacall(sysimage: Path | None):
+    import juliapkg
+
     _handle_env_vars()
     _handle_sysimage(sysimage)
 
-    logger.info("    Executable: %s" % juliapkg.executable())
-    logger.info("    Project: %s" % juliapkg.project())
+    with phase("juliapkg_executable"):
+        logger.info("    Executable: %s" % juliapkg.executable())
+        logger.info("    Project: %s" % juliapkg.project())
 
     # Try to find out if we are running on an old cluster, that might have issues with GLIBC.
     if sys.platform == "linux":
@@ -224,35 +374,17 @@ def setup_julia(target: Path, sysimage: Path):
 
     os.environ["PYTHON_JULIACALL_BINDIR"] = str(Path(juliapkg.executable()).parent)
 
-    import juliacall
+    with phase("import_juliacall"):
+        import juliacall
 
     logger.info("Julia setup complete")
 
-    custom_packages = list(Config.find("PKG_"))
-    if len(custom_packages) > 0:
-        logger.info("Installing custom Julia packages")
-
-        try:
-            juliacall.Main.seval("import Pkg")
-        except Exception as e:
-            logger.error(f"Failed to import Julia `Pkg`: {e}")
-
-        for entry in custom_packages:
-            name = entry[4:]
-            try:
-                juliacall.Pkg.add(name=name, version=Config.get(entry))
-            except Exception as e:
-                logger.error(f"Failed to install custom package '{name}': {e}")
-
-    # Restoring potential SSL certificate.
-    if _ssl is not None:
-        logger.debug("Restoring local `SSL_CERT_FILE`")
-        os.environ["SSL_CERT_FILE"] = _ssl
-
     return juliacall
 
 
 def import_modules():
     logger.info("Importing Julia modules:")
-    jl_import("IESopt")
-    jl_import("JuMP")
+    with phase("import_IESopt"):
+        jl_import("IESopt")
+    with phase("import_JuMP"):
+        jl_import("JuMP")
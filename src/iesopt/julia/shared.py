@@ -0,0 +1,123 @@
+import os
+import sys
+import json
+import shutil
+import tempfile
+import subprocess
+from pathlib import Path
+
+from ..util import logger
+from ..config import Config
+
+
+# Layout of an exported (shared) environment; all paths are relative, so the whole folder can be moved/copied.
+METADATA = "iesopt_shared.json"
+PROJECT = "project"
+DEPOT = "depot"
+SYSIMAGE = "sysimage.so"
+
+# Warm up the exported environment in a fresh process, compiling everything into its depot (using the same flags that
+# are used at runtime, since compiled package images are only valid for a specific set of flags).
+_WARMUP = """
+import tempfile
+import iesopt
+config = iesopt.make_example("01_basic_single_node", dst_dir=tempfile.mkdtemp(), dst_name="config")
+iesopt.run(config, config={"general.verbosity.core": "error"})
+"""
+
+
+def _read_metadata(shared: Path) -> dict:
+    try:
+        return json.loads((shared / METADATA).read_text())
+    except OSError:
+        raise Exception(f"'{shared}' is not a shared IESopt environment; create it using `iesopt.export_environment`")
+
+
+def local_depot() -> Path:
+    """Writable depot that is stacked on top of the shared (read-only) depot, see `IESOPT_LOCAL_DEPOT`."""
+    return Path(os.environ.get("IESOPT_LOCAL_DEPOT", Path(tempfile.gettempdir()) / f"iesopt-depot-{os.getuid()}"))
+
+
+def shared_environment(shared: Path) -> dict:
+    """Environment variables that make `juliacall` use the shared environment, without any resolving or installing."""
+    metadata = _read_metadata(shared)
+
+    if metadata["fingerprint"] != Config.fingerprint():
+        logger.warning("Shared Julia environment was exported using a different config; this may not work as expected")
+    if metadata["optimization"] != Config.get("optimization"):
+        logger.warning(
+            "Shared Julia environment was compiled for `IESOPT_OPTIMIZATION=%s`, but `%s` is used; this triggers "
+            "compilation on every node" % (metadata["optimization"], Config.get("optimization"))
+        )
+
+    julia_home = shared / metadata["julia"]
+    depots = [local_depot(), shared / DEPOT, julia_home / "local" / "share" / "julia", julia_home / "share" / "julia"]
+
+    return {
+        "PYTHON_JULIACALL_EXE": str(shared / metadata["executable"]),
+        "PYTHON_JULIACALL_PROJECT": str(shared / PROJECT),
+        "JULIA_DEPOT_PATH": os.pathsep.join(dict.fromkeys(str(d) for d in depots)),
+        "JULIA_PKG_OFFLINE": "true",
+        "JULIA_PKG_PRECOMPILE_AUTO": "0",
+        "PYTHON_JULIAPKG_OFFLINE": "yes",
+    }
+
+
+def export_environment(dest: Path, sysimage: Path | None):
+    """Export the current Julia environment into `dest`, see :py:func:`iesopt.export_environment`."""
+    import juliapkg
+
+    dest = Path(dest).resolve()
+    if dest.exists() and any(dest.iterdir()):
+        raise Exception(f"Destination '{dest}' for the shared environment must be empty")
+
+    executable = Path(juliapkg.executable()).resolve()
+    julia_home = executable.parent.parent
+    if str(julia_home) in ["/", "/usr", "/usr/local", "/opt"]:
+        raise Exception(f"Refusing to export the system-wide Julia installation at '{julia_home}'")
+
+    logger.info("Exporting Julia installation: '%s'" % julia_home)
+    shutil.copytree(julia_home, dest / "julia", symlinks=True)
+
+    (dest / PROJECT).mkdir(parents=True)
+    for name in ["Project.toml", "Manifest.toml"]:
+        shutil.copy2(Path(juliapkg.project()) / name, dest / PROJECT / name)
+
+    if sysimage is not None and sysimage.exists():
+        logger.info("Exporting sysimage: '%s'" % sysimage)
+        shutil.copy2(sysimage, dest / SYSIMAGE)
+
+    (dest / METADATA).write_text(
+        json.dumps(
+            {
+                "julia": "julia",
+                "executable": str(Path("julia") / executable.relative_to(julia_home)),
+                "fingerprint": Config.fingerprint(),
+                "optimization": Config.get("optimization"),
+            },
+            indent=2,
+        )
+    )
+
+    # Install all packages into the shared depot (this is the only step that needs network access).
+    logger.info("Installing packages into shared depot")
+    env = os.environ | shared_environment(dest) | {"JULIA_PKG_OFFLINE": "false"}
+    env["JULIA_DEPOT_PATH"] = env["JULIA_DEPOT_PATH"].split(os.pathsep, 1)[1]
+    subprocess.run(
+        [
+            env["PYTHON_JULIACALL_EXE"],
+            f"--project={dest / PROJECT}",
+            "--startup-file=no",
+            "-e",
+            "import Pkg; Pkg.instantiate()",
+        ],
+        env=env | {"JULIA_PYTHONCALL_EXE": sys.executable, "JULIA_CONDAPKG_BACKEND": "Null"},
+        check=True,
+    )
+
+    # Compile everything into the shared depot, by using it as local (= writable) depot once.
+    logger.info("Compiling shared environment, this can take a few minutes")
+    env = os.environ | {"IESOPT_SHARED_ENV": str(dest), "IESOPT_LOCAL_DEPOT": str(dest / DEPOT)}
+    subprocess.run([sys.executable, "-c", _WARMUP], env=env, check=True)
+
+    logger.info("Shared environment ready: '%s'" % dest)
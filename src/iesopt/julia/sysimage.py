@@ -0,0 +1,114 @@
+import os
+import sys
+import subprocess
+import tempfile
+from pathlib import Path
+
+from ..util import logger, get_iesopt_module_attr
+from .helpers import HELPERS
+
+
+# Julia only supports `--trace-compile` as command line option, which `juliacall` does not expose. Setting the pointer
+# inside of `jl_options` has the same effect, since Julia (lazily) opens the file on the first recorded statement.
+_ENABLE_TRACE_COMPILE = """
+function (path::String)
+    global __iesopt_trace_compile = path  # keep the string alive, since Julia only stores a pointer to it
+    idx = findfirst(==(:trace_compile), fieldnames(Base.JLOptions))
+    ptr = Ptr{Ptr{UInt8}}(cglobal(:jl_options, Base.JLOptions) + fieldoffset(Base.JLOptions, idx))
+    unsafe_store!(ptr, pointer(__iesopt_trace_compile))
+    return nothing
+end
+"""
+
+# Packages that are baked into the sysimage. `PythonCall` is included, since most precompile statements that are
+# recorded while running the workload from Python involve types from it.
+SYSIMAGE_PACKAGES = ["IESopt", "JuMP", "HiGHS", "Pkg", "PythonCall"]
+
+
+def run_workload(trace_file: str | Path, workdir: str | Path, examples: list[str] | None = None):
+    """Run a representative workload, recording all precompile statements to `trace_file`.
+
+    This covers the bundled examples (`generate` and `optimize`), the conversion of keyword arguments, as well as
+    result extraction (including `to_pandas`). It is meant to be executed in a fresh process, see `trace_workload`.
+    """
+    import pandas as pd
+
+    import iesopt
+    from .util import recursive_convert_py2jl, jl_isa
+
+    julia = get_iesopt_module_attr("julia")
+    julia.seval(_ENABLE_TRACE_COMPILE)(str(Path(trace_file).resolve()))
+
+    jl_isa(julia.IESopt, "Module")
+
+    recursive_convert_py2jl(
+        {
+            "config": {"general.verbosity.core": "error", "optimization.snapshots.count": 4},
+            "parameters": {"a": 1, "b": 2.0, "c": "string", "d": [1, 2, 3], "e": [1.0, "mixed"]},
+            "virtual_files": {"profiles": pd.DataFrame({"x": [1.0, 2.0], "y": [1, 2], "z": ["a", "b"]})},
+        }
+    )
+
+    for example in iesopt.examples() if examples is None else examples:
+        try:
+            config = iesopt.make_example(example, dst_dir=workdir, dst_name=example)
+            model = iesopt.run(config, config={"general.verbosity.core": "error"})
+            if model.status not in [iesopt.ModelStatus.OPTIMAL, iesopt.ModelStatus.OPTIMAL_LOCALLY]:
+                continue
+
+            results = model.results
+            results.to_dict()
+            results.to_pandas(orientation="long")
+            results.overview(".*", temporal=True)
+            results.overview(".*", temporal=False)
+            results.query_available_results(".*")
+        except Exception as e:
+            logger.warning("Workload failed for example '%s': %s" % (example, e))
+
+
+def trace_workload(trace_file: Path, examples: list[str] | None = None):
+    """Execute `run_workload` in a fresh Python process (without any custom sysimage), recording to `trace_file`."""
+    env = os.environ | {"IESOPT_USE_SYSIMAGE": "no"}
+    code = "import sys; from iesopt.julia.sysimage import run_workload; run_workload(sys.argv[1], sys.argv[2], %r)"
+
+    logger.info("Tracing precompile statements of workload, this can take a few minutes")
+    with tempfile.TemporaryDirectory() as workdir:
+        subprocess.run(
+            [sys.executable, "-c", code % (examples,), str(trace_file), workdir], env=env, check=True, cwd=os.getcwd()
+        )
+
+    if not trace_file.exists():
+        raise Exception("Workload did not record any precompile statements")
+
+    logger.info("Recorded precompile statements: '%s'" % trace_file)
+
+
+def create_sysimage(target: Path, sysimage: Path, *, examples: list[str] | None = None, workload: bool = True):
+    import juliacall
+    import juliapkg
+
+    statements = None
+    if workload:
+        statements = sysimage.with_suffix(".jl")
+        statements.unlink(missing_ok=True)
+        trace_workload(statements, examples)
+
+    julia = get_iesopt_module_attr("julia")
+    julia.Pkg.add("PackageCompiler")
+    julia.seval("import PackageCompiler")
+
+    target.mkdir(exist_ok=True)
+
+    juliapkg.add("Pkg", "44cfe95a-1eb2-52ea-b672-e2afdf69b78f", target=str(target / "juliapkg.json"))
+    juliapkg.resolve()
+
+    # Define the helper functions while building, which bakes them (and their traced statements) into the sysimage.
+    helpers = sysimage.with_suffix(".helpers.jl")
+    helpers.write_text(HELPERS)
+
+    kwargs = {"sysimage_path": str(sysimage), "script": str(helpers)}
+    if statements is not None:
+        kwargs["precompile_statements_file"] = str(statements)
+
+    logger.info("Creating sysimage: '%s'" % sysimage)
+    julia.PackageCompiler.create_sysimage(juliacall.convert(julia.Vector, SYSIMAGE_PACKAGES), **kwargs)
@@ -1,5 +1,5 @@
-import pandas as pd
 from ..util import logger, get_iesopt_module_attr
+from .helpers import jl_helper, jl_type
 
 
 def jl_safe_seval(code: str):
@@ -43,18 +43,8 @@ def jl_symbol(string: str):
 
 
 def jl_isa(obj, julia_type: str):
-    julia = get_iesopt_module_attr("julia")
-
-    if julia_type == "AbstractVector":
-        return julia.isa(obj, julia.AbstractVector)
-
-    if julia_type == "AbstractSet":
-        return julia.isa(obj, julia.AbstractSet)
-
-    if julia_type == "AbstractDict":
-        return julia.isa(obj, julia.AbstractDict)
-
-    return julia.seval(f"(x) -> (x isa {julia_type})")(obj)
+    """Check whether `obj` is of the Julia type `julia_type` (e.g., `"AbstractVector"`)."""
+    return jl_helper("isa_type")(obj, jl_type(julia_type))
 
 
 def jl_docs(obj: str, module: str = "IESopt"):
@@ -68,17 +58,107 @@ def jl_docs(obj: str, module: str = "IESopt"):
         return "".join(str(el) for el in julia_docstr.text)
 
 
-def recursive_convert_py2jl(item):
+def _convert_dataframe(df):
+    """Convert a `pd.DataFrame` into a Julia `DataFrame`, sharing the memory of all numerical columns.
+
+    Numerical columns are passed as NumPy arrays, which Julia wraps without copying (these must therefore not be
+    modified afterwards). All other columns (strings, categoricals, nullable types, ...) are copied, converting `None`
+    into `missing`.
+    """
+    import numpy as np
+
+    convert = get_iesopt_module_attr("juliacall").convert
+
+    columns = []
+    for _, series in df.items():
+        if isinstance(series.dtype, np.dtype) and series.dtype.kind in "biuf":
+            columns.append(np.ascontiguousarray(series.to_numpy()))
+        elif series.map(type).eq(str).all():
+            columns.append(convert(jl_type("Vector{String}"), series.tolist()))
+        else:
+            columns.append(convert(jl_type("Vector{Any}"), series.astype(object).tolist()))
+
+    return jl_helper("dataframe")([str(c) for c in df.columns], convert(jl_type("Vector{Any}"), columns))
+
+
+def _numerical_vector(item):
+    """Concrete (`float64`, `int64`, or `bool`) 1-dimensional array of `item`, or `None` if it is not homogeneous."""
+    import numpy as np
+
+    if isinstance(item, np.ndarray):
+        if item.ndim != 1:
+            return None
+        for kinds, dtype in [("f", np.float64), ("iu", np.int64), ("b", np.bool_)]:
+            if item.dtype.kind in kinds:
+                return np.ascontiguousarray(item, dtype=dtype)
+        return None
+
+    if len(item) == 0:
+        return None
+    for t, dtype in [(float, np.float64), (int, np.int64)]:
+        if all(type(v) is t for v in item):
+            try:
+                return np.array(item, dtype=dtype)
+            except OverflowError:
+                return None
+    return None
+
+
+def _flatten(item, key: str, tree: tuple[list, list, list, list]):
+    import numpy as np
+    import pandas as pd
+
+    from ..registry import FrameHandle
+
+    kinds, sizes, keys, values = tree
+    i = len(kinds)
+    kinds.append(0)
+    sizes.append(0)
+    keys.append(key)
+    values.append(None)
+
     if isinstance(item, dict):
-        julia = get_iesopt_module_attr("julia")
-        convert = get_iesopt_module_attr("juliacall").convert
-        return convert(julia.seval("Dict{String, Any}"), {k: recursive_convert_py2jl(v) for (k, v) in item.items()})
-    elif isinstance(item, list):
-        julia = get_iesopt_module_attr("julia")
-        convert = get_iesopt_module_attr("juliacall").convert
-        return convert(julia.seval("Vector{Any}"), [recursive_convert_py2jl(v) for v in item])
+        kinds[i], sizes[i] = 1, len(item)
+        for k, v in item.items():
+            _flatten(v, k, tree)
+    elif isinstance(item, list) or (isinstance(item, np.ndarray) and item.ndim == 1):
+        vector = _numerical_vector(item)
+        if vector is not None:
+            kinds[i], values[i] = 3, vector
+        else:
+            kinds[i], sizes[i] = 2, len(item)
+            for v in item:
+                _flatten(v, "", tree)
     elif isinstance(item, pd.DataFrame):
-        julia = get_iesopt_module_attr("julia")
-        return julia.IESopt.DataFrames.DataFrame(item)
+        values[i] = _convert_dataframe(item)
+    elif isinstance(item, FrameHandle):
+        values[i] = item.jl
+    else:
+        values[i] = item
 
-    return item
+
+def recursive_convert_py2jl(item):
+    """Convert (nested) Python containers into Julia ones, using a single call into Julia.
+
+    Dicts are converted into `Dict{String, Any}`, and lists into `Vector{Any}`, except for homogeneous numerical lists
+    and 1-dimensional NumPy arrays, that are converted into `Vector{Float64}`, `Vector{Int64}`, or `Vector{Bool}`.
+    DataFrames are converted using `_convert_dataframe`, registered frames (see `iesopt.register_frame`) are passed
+    without converting them again; all other values (including NumPy arrays of other dimensions) are passed as they
+    are.
+    """
+    import numpy as np
+    import pandas as pd
+
+    from ..registry import FrameHandle
+
+    if isinstance(item, pd.DataFrame):
+        return _convert_dataframe(item)
+    if isinstance(item, FrameHandle):
+        return item.jl
+    if not isinstance(item, (dict, list)) and not (isinstance(item, np.ndarray) and item.ndim == 1):
+        return item
+
+    tree = ([], [], [], [])
+    _flatten(item, "", tree)
+    kinds, sizes, keys, values = tree
+    return jl_helper("build_tree")(np.array(kinds, dtype=np.int64), np.array(sizes, dtype=np.int64), keys, values)
@@ -1,10 +1,23 @@
+import copy
+import pickle
+import asyncio
 from enum import Enum
 from pathlib import Path
 from warnings import warn
 
+import numpy as np
+import pandas as pd
+
 from .util import logger, get_iesopt_module_attr
-from .julia.util import jl_symbol, recursive_convert_py2jl, jl_safe_seval
+from .config import Config
+from .julia.util import jl_symbol, recursive_convert_py2jl
+from .julia.helpers import jl_helper, jl_type
+from .julia import executor
+from .julia.executor import jl_call
+from .threads import apply_solver_threads
+from . import cache
 from .results import Results
+from .registry import FrameHandle, resolve_frame
 
 
 class ModelStatus(Enum):
@@ -21,11 +34,31 @@ class ModelStatus(Enum):
     OTHER = "other"
 
 
+def _own_frame(df):
+    # Copy DataFrames, so that modifying them afterwards does not affect the model, and in-place updates (see
+    # `update_virtual_file`) are computed against the values the model was created with. Registered frames are shared,
+    # using an own reference that stays valid if the frame is released.
+    if isinstance(df, pd.DataFrame):
+        return df.copy()
+    if isinstance(df, FrameHandle):
+        return df._reference()
+    return df
+
+
 class Model:
-    """An IESopt model, based on an :jl:module:`IESopt.jl <IESopt.IESopt>` core model."""
+    """An IESopt model, based on an :jl:module:`IESopt.jl <IESopt.IESopt>` core model.
+
+    DataFrames passed as `virtual_files` are copied when creating the model, so modifying them afterwards does not
+    affect it; Julia shares the memory of all numerical columns of that copy, without copying them again. Registered
+    frames (see :py:func:`iesopt.register_frame`) are shared as they are, and must therefore not be modified.
+    """
 
     def __init__(self, filename: str | Path, **kwargs) -> None:
+        if kwargs.get("virtual_files"):
+            kwargs = kwargs | {"virtual_files": {k: _own_frame(v) for (k, v) in kwargs["virtual_files"].items()}}
+
         self._filename = filename
+        self._kwargs_py = kwargs
         self._kwargs = recursive_convert_py2jl(kwargs)
 
         self._model = None
@@ -33,9 +66,22 @@ class Model:
 
         self._status = ModelStatus.EMPTY
         self._status_details = None
+        self._use_input_cache = True
 
         self._results = None
 
+        # State of in-place updates, see `update_parameters`.
+        self._updated_in_place = False
+        self._snapshot = None
+        self._sensitivities = {}
+        self._parameters = {}
+        self._column_sensitivities = {}
+        self._virtual_files = {}
+
+        # State of warm starts, see `optimize`.
+        self._last_primal = None
+        self._solve_stats = []
+
         self._IESopt = get_iesopt_module_attr("IESopt")
         self._JuMP = get_iesopt_module_attr("JuMP")
         self._jump_value = get_iesopt_module_attr("jump_value")
@@ -43,7 +89,7 @@ class Model:
 
         if "virtual_files" in self._kwargs:
             # Ensure proper type of this entry, since it is enforced by `IESopt.parse!`.
-            _dict_typed = self._IESopt.seval("Dict{String, DataFrames.DataFrame}")
+            _dict_typed = jl_type("Dict{String, IESopt.DataFrames.DataFrame}")
             self._kwargs["virtual_files"] = _dict_typed(self._kwargs["virtual_files"])
 
     def __repr__(self) -> str:
@@ -104,10 +150,24 @@ class Model:
         return self._JuMP.objective_value(self.core)
 
     def generate(self) -> None:
-        """Generate a IESopt model from the attached top-level YAML config."""
+        """Generate a IESopt model from the attached top-level YAML config.
+
+        If the input cache is enabled (see `IESOPT_INPUT_CACHE`), and none of the inputs (config files, templates, data
+        files, keyword arguments) changed since the model was last generated, it is loaded from the cache instead.
+        """
         try:
-            self._model = self._IESopt.generate_b(str(self._filename), **self._kwargs)
+            key = self._input_cache_key()
+            self._model = None if key is None else cache.load(key)
+            if self._model is None:
+                self._model = jl_call(self._IESopt.generate_b, str(self._filename), **self._kwargs)
+                if key is not None:
+                    cache.store(key, self._model)
             self._status = ModelStatus.GENERATED
+            self._updated_in_place = False
+            self._snapshot, self._sensitivities, self._parameters = None, {}, {}
+            self._column_sensitivities, self._virtual_files = {}, {}
+            self._last_primal, self._solve_stats = None, []
+            apply_solver_threads(self.core)
         except Exception as e:
             self._status = ModelStatus.FAILED_GENERATE
             logger.error(f"Exception during `generate`: {e}")
@@ -116,6 +176,23 @@ class Model:
             except Exception as e:
                 logger.error("Failed to extract debugging info")
 
+    def _input_cache_key(self) -> str | None:
+        if not self._use_input_cache or cache.folder() is None:
+            return None
+        try:
+            paths = jl_helper("input_paths")(str(self._filename))
+        except Exception as e:
+            logger.warning("Not using the input cache, failed to determine the inputs of the model: %s" % e)
+            return None
+
+        files = cache.input_files(
+            self._filename,
+            {str(k): str(v) for (k, v) in paths.folders.items()},
+            None if paths.parameters is None else str(paths.parameters),
+            self._kwargs_py.get("config"),
+        )
+        return cache.cache_key(files, self._kwargs_py)
+
     def write_to_file(self, filename=None, *, format: str = "automatic") -> str:
         """Write the model to a file.
 
@@ -162,16 +239,37 @@ class Model:
             if filename is None:
                 return self._IESopt.write_to_file(self.core)
             else:
-                format = jl_safe_seval(f"JuMP.MOI.FileFormats.FORMAT_{format.upper()}")
+                format = jl_helper("file_format")(format)
                 return self._IESopt.write_to_file(self.core, str(filename), format=format)
         except Exception as e:
             logger.error(f"Error while writing model to file: {e}")
             return ""
 
-    def optimize(self) -> None:
-        """Optimize the model."""
+    def optimize(self, *, warm_start: bool | Results = False) -> None:
+        """Optimize the model.
+
+        Keyword Arguments:
+            warm_start (bool | Results): Whether to warm start the solver, by setting the start values of all variables.
+                If `True`, the last solution of this model (also from before any `update_parameters` or
+                `update_virtual_file`) is used. If a `Results` object is passed, the start values are taken from it
+                (e.g., the results of a similar model). Defaults to `False`. Note that solvers that support it keep
+                their basis between solves of an in-place updated model, which does not require `warm_start`.
+
+        Statistics of each solve (solve time, iterations, and savings of warm starts) are available in
+        :py:attr:`iesopt.Model.solve_stats`.
+        """
+        self._optimize(warm_start)
+
+    def _optimize(self, warm_start: bool | Results, interrupt: np.ndarray | None = None):
+        # If given, setting `interrupt[0]` (from any thread) asks the solver to stop, see `optimize_async`.
+        warm = warm_start is not False and self._set_warm_start(warm_start)
+
         try:
-            self._IESopt.optimize_b(self.core)
+            if interrupt is None:
+                jl_call(self._IESopt.optimize_b, self.core)
+            else:
+                jl_call(jl_helper("optimize_interruptible"), self.core, interrupt.ctypes.data)
+            self._record_solve_stats(warm)
 
             if self._JuMP.is_solved_and_feasible(self.core, allow_local=False):
                 self._status = ModelStatus.OPTIMAL
@@ -199,6 +297,466 @@ class Model:
             except Exception as e:
                 logger.error("Failed to extract debugging info")
 
+    async def generate_async(self) -> None:
+        """Generate the model (see `generate`), without blocking the event loop.
+
+        All asynchronous calls (of all models) run one after another on a single dedicated thread, that releases the
+        GIL while Julia runs. This requires `IESOPT_MULTITHREADED` to be enabled; otherwise, the model is generated
+        directly (logging a warning once), which blocks the event loop until it is done.
+        """
+        await executor.run(self.generate)
+
+    async def optimize_async(self, *, timeout: float | None = None, warm_start: bool | Results = False) -> None:
+        """Optimize the model (see `optimize`), without blocking the event loop (see `generate_async`).
+
+        Keyword Arguments:
+            timeout (Optional[float]): Time limit of the solver (in seconds) for this solve, defaults to `None` (using
+                the time limit of the solver configuration, if any).
+            warm_start (bool | Results): See `optimize`.
+
+        Raises:
+            TimeoutError: If the solver stopped due to reaching `timeout`. The model then holds the status that the
+                solver reported (e.g., a feasible, but not optimal, solution).
+
+        Cancelling the task asks the solver to stop. If the solver does not support that (currently, only Gurobi does),
+        a warning is logged, and it keeps running in the background until it finishes (or reaches its time limit),
+        delaying all further asynchronous calls. Without `IESOPT_MULTITHREADED`, the model is optimized directly,
+        blocking the event loop, and the task can only be cancelled after the solve has finished (which then has no
+        effect on the solver). Use `timeout` to bound the solve time in that case.
+
+        Examples:
+            ..  code-block:: python
+                :caption: Solving a model in an async request handler.
+
+                import iesopt
+
+                async def solve(filename: str) -> float:
+                    model = iesopt.Model(filename)
+                    await model.generate_async()
+                    await model.optimize_async(timeout=60.0)
+                    return model.objective_value
+        """
+        if self._status == ModelStatus.EMPTY:
+            await self.generate_async()
+
+        # All Julia calls, including checking the solver, go through the executor, since Julia must not be called from
+        # the event loop while the executor runs it. Cancelling only sets `interrupt`, that Julia polls while solving.
+        interruptible = await executor.run(self._can_interrupt)
+        interrupt = np.zeros(1, dtype=np.uint8)
+        try:
+            reached_time_limit = await executor.run(self._optimize_with_time_limit, timeout, warm_start, interrupt)
+        except asyncio.CancelledError:
+            interrupt[0] = 1
+            if not interruptible:
+                logger.warning("Solver does not support interrupting it; it keeps running until it finishes")
+            raise
+
+        if reached_time_limit:
+            raise TimeoutError(f"Solver reached the time limit of {timeout}s")
+
+    def _can_interrupt(self) -> bool:
+        return bool(jl_helper("can_interrupt")(self.core))
+
+    def _optimize_with_time_limit(self, timeout: float | None, warm_start: bool | Results, interrupt: np.ndarray):
+        # Returns whether the solver stopped due to reaching `timeout`.
+        if not Config.get("multithreaded"):
+            interrupt = None  # nothing can set it while solving, and Julia has no other thread to poll it
+        if timeout is None:
+            self._optimize(warm_start, interrupt)
+            return False
+
+        previous = jl_helper("set_time_limit")(self.core, float(timeout))
+        try:
+            self._optimize(warm_start, interrupt)
+        finally:
+            jl_helper("set_time_limit")(self.core, previous)
+        return str(self._JuMP.termination_status(self.core)) == "TIME_LIMIT"
+
+    def update_parameters(self, **values) -> None:
+        """Update (numerical) global parameters of the generated model in place, without regenerating it.
+
+        This modifies all objective coefficients, constraint coefficients, right-hand sides, and variable bounds that
+        depend on the parameters, so that a following `optimize` directly re-solves the model. The first update of
+        each parameter generates the model twice (using different values of the parameter) to detect these
+        dependencies (and once more for each pair of parameters that enter the same value, to check that they do not
+        interact); all further updates are applied directly.
+
+        This requires that the model depends affinely on each parameter (e.g., `cost: <price>` or
+        `cost: <price> * 2`, but not `cost: <price> * <factor>` if both are updated), and that changing it does not
+        alter the structure of the model (e.g., a parameter that is used as a filename, or to decide whether a
+        component is active, is not supported). Otherwise, an exception is raised, and the model is left unchanged.
+
+        Only the optimization problem is updated, not the expressions that IESopt keeps for its components and
+        objectives. After an update, the objective value and all "var" and "con" results are exact, while "exp",
+        "obj", and "res" results (and `results.objectives`) are not available; use `generate` to obtain them.
+
+        Keyword Arguments:
+            **values: New values of the parameters to update.
+
+        Examples:
+            ..  code-block:: python
+                :caption: Re-solving a model for different gas prices.
+
+                import iesopt
+
+                model = iesopt.Model("config.iesopt.yaml", parameters=dict(gas_eur_mwh=27.5))
+                model.generate()
+
+                for gas_price in [20.0, 30.0, 40.0]:
+                    model.update_parameters(gas_eur_mwh=gas_price)
+                    model.optimize()
+                    print(model.objective_value)
+        """
+        if self._status == ModelStatus.EMPTY:
+            self.generate()
+
+        for name, value in values.items():
+            if isinstance(value, bool) or not isinstance(value, int | float):
+                raise TypeError(f"Parameter `{name}` must be numerical to be updated in place, got `{value!r}`")
+
+        for name, value in values.items():
+            if name not in self._sensitivities:
+                sensitivity = self._probe_parameter(name, float(value))
+                for other, other_sensitivity in self._sensitivities.items():
+                    if jl_helper("sensitivities_overlap")(sensitivity, other_sensitivity):
+                        self._probe_joint({name: sensitivity, other: other_sensitivity})
+                self._sensitivities[name] = sensitivity
+
+        self._parameters.update({name: float(value) for (name, value) in values.items()})
+        self._apply_updates()
+
+    def update_virtual_file(self, name: str, df: pd.DataFrame | FrameHandle) -> None:
+        """Replace a virtual file (see the `virtual_files` argument) of the generated model in place.
+
+        This modifies all values of the model that depend on the time series in the virtual file (e.g., the values
+        of a `Profile`, or the availability of a `Unit`), so that a following `optimize` directly re-solves the model,
+        without regenerating it. The first change of each column generates the model twice (using slightly modified
+        versions of that column, within the range of its values) to detect these dependencies; all further updates
+        are applied directly.
+
+        This requires that each value of the model depends affinely on a single row of the time series (e.g.,
+        `value: demand@data`, or `availability_factor: solar@data`). Changes that alter the structure of the model
+        (different columns, a different number of rows, or values that, e.g., decide whether a variable is created),
+        as well as time series that enter the model aggregated over multiple rows, raise an exception, and leave the
+        model unchanged. Results are limited in the same way as after `update_parameters`.
+
+        Arguments:
+            name (str): Name of the virtual file, as passed to `virtual_files` when creating the model.
+            df (pd.DataFrame | FrameHandle): New contents, with the same columns and number of rows as the original.
+
+        Examples:
+            ..  code-block:: python
+                :caption: Re-solving a model for different weather years.
+
+                import iesopt
+
+                model = iesopt.Model("config.iesopt.yaml", virtual_files=dict(data=dfs_weather[2017]))
+                model.generate()
+
+                for year in range(2017, 2023):
+                    model.update_virtual_file("data", dfs_weather[year])
+                    model.optimize()
+        """
+        if self._status == ModelStatus.EMPTY:
+            self.generate()
+
+        df = resolve_frame(df)
+        base = self._base_virtual_file(name)
+        if base is None:
+            raise Exception(f"`{name}` is not a virtual file of this model; pass it using `virtual_files` first")
+        if list(df.columns) != list(base.columns) or len(df) != len(base):
+            raise Exception(
+                f"Virtual file `{name}` must keep its columns and number of rows, since changing them alters the "
+                f"structure of the model; use `generate` instead"
+            )
+
+        for column in df.columns:
+            if (name, column) in self._column_sensitivities or df[column].equals(base[column]):
+                continue
+            if not (pd.api.types.is_numeric_dtype(df[column]) and pd.api.types.is_numeric_dtype(base[column])):
+                raise Exception(f"Column `{column}` of virtual file `{name}` must be numerical to be updated in place")
+            if df[column].isna().any():
+                raise Exception(
+                    f"Column `{column}` of virtual file `{name}` contains NaN values; it requires `generate`"
+                )
+            self._column_sensitivities[(name, column)] = self._probe_column(name, column)
+
+        self._virtual_files[name] = df.copy()
+        self._apply_updates()
+
+    def _apply_updates(self):
+        # Keep the current solution (which is invalidated by modifying the model) to allow warm starting from it.
+        if self._status in [ModelStatus.OPTIMAL, ModelStatus.OPTIMAL_LOCALLY]:
+            self._last_primal = jl_helper("primal_values")(self.core)
+
+        # Set all values that depend on parameters or virtual files, relative to the model as generated.
+        names = list(self._sensitivities.keys())
+        columns = list(self._column_sensitivities.keys())
+        n = jl_helper("apply_updates")(
+            self.core,
+            [self._sensitivities[name] for name in names],
+            [self._parameters.get(name, self._sensitivities[name].p0) - self._sensitivities[name].p0 for name in names],
+            [self._column_sensitivities[key] for key in columns],
+            [
+                self._virtual_files.get(file, self._base_virtual_file(file))[column].to_numpy(dtype=np.float64)
+                - self._base_virtual_file(file)[column].to_numpy(dtype=np.float64)
+                for (file, column) in columns
+            ],
+        )
+        logger.debug("Updated %d values of the model" % n)
+
+        self._status = ModelStatus.GENERATED
+        self._updated_in_place = True
+        self._results = None
+
+    def _base_virtual_file(self, name: str) -> pd.DataFrame | None:
+        return resolve_frame((self._kwargs_py.get("virtual_files") or {}).get(name))
+
+    def _base_snapshot(self):
+        # Snapshot of the model as generated (before any in-place update), that all updates are relative to.
+        if self._snapshot is None:
+            self._snapshot = jl_helper("snapshot")(self.core)
+        return self._snapshot
+
+    def _generate_variant(self, *, parameters: dict | None = None, virtual_files: dict | None = None):
+        kwargs = dict(self._kwargs_py)
+        if parameters is not None:
+            kwargs["parameters"] = dict(kwargs.get("parameters") or {}) | parameters
+        if virtual_files is not None:
+            kwargs["virtual_files"] = dict(kwargs.get("virtual_files") or {}) | virtual_files
+
+        # Variants are only used once, so they are not worth caching.
+        variant = Model(self._filename, **kwargs)
+        variant._use_input_cache = False
+        variant.generate()
+        if variant.status != ModelStatus.GENERATED:
+            raise Exception("Failed to generate variant of the model, see log for details")
+
+        return jl_helper("snapshot")(variant.core)
+
+    def _probe_parameter(self, name: str, value: float):
+        logger.info("Detecting how the model depends on parameter `%s`" % name)
+        base = self._base_snapshot()
+        a, b = value, value + max(1.0, abs(value))
+        return jl_helper("scalar_sensitivity")(
+            base, self._generate_variant(parameters={name: a}), a, self._generate_variant(parameters={name: b}), b
+        )
+
+    def _probe_joint(self, sensitivities: dict):
+        # Parameters that enter the same values are only updated correctly if they do not interact (e.g., multiply).
+        logger.info(
+            "Detecting how the model depends on parameters %s jointly" % ", ".join(f"`{n}`" for n in sensitivities)
+        )
+        deltas = {name: max(1.0, abs(float(s.p0))) for (name, s) in sensitivities.items()}
+        probe = self._generate_variant(
+            parameters={name: float(s.p0) + deltas[name] for (name, s) in sensitivities.items()}
+        )
+        jl_helper("check_joint_sensitivity")(
+            self._base_snapshot(), probe, list(sensitivities.values()), list(deltas.values())
+        )
+
+    def _probe_column(self, name: str, column: str):
+        logger.info("Detecting how the model depends on column `%s` of virtual file `%s`" % (column, name))
+        base = self._base_virtual_file(name)
+        values = base[column].to_numpy(dtype=np.float64)
+        if np.isnan(values).any():
+            raise Exception(f"Column `{column}` of virtual file `{name}` contains NaN values; it requires `generate`")
+
+        # Small steps towards the inside of the range of the column (e.g., lowering availability factors of 1), so that
+        # probing does not create values that the model rejects; probing each row `t` with a weight of `t / nrows`
+        # identifies the row that each value depends on.
+        steps = np.ones_like(values)
+        if len(values) > 0:
+            lo, hi = float(np.min(values)), float(np.max(values))
+            steps = np.where(values > ((lo + hi) / 2 if lo < hi else 0.0), -1.0, 1.0)
+            steps *= 1e-3 * (float(np.max(np.abs(values))) or 1.0)
+
+        uniform, rows = base.copy(), base.copy()
+        uniform[column] = values + steps
+        rows[column] = values + steps * np.arange(1, len(values) + 1) / max(1, len(values))
+
+        return jl_helper("column_sensitivity")(
+            self._base_snapshot(),
+            self._generate_variant(virtual_files={name: uniform}),
+            self._generate_variant(virtual_files={name: rows}),
+            steps,
+        )
+
+    @property
+    def solve_stats(self) -> list[dict]:
+        """Statistics of all calls to `optimize` (since the last `generate`).
+
+        Each entry contains `warm_start` (whether a warm start was used), `solve_time` (in seconds),
+        `simplex_iterations`, `barrier_iterations`, and `node_count` (`None` if not reported by the solver). Warm
+        started solves additionally report `time_saved` and `iterations_saved`, compared to the last cold solve.
+        """
+        return [dict(entry) for entry in self._solve_stats]
+
+    def _record_solve_stats(self, warm_start: bool):
+        stats = {"warm_start": warm_start} | dict(jl_helper("solve_stats")(self.core))
+        stats["iterations"] = sum(stats.get(k) or 0 for k in ["simplex_iterations", "barrier_iterations"])
+
+        cold = [entry for entry in self._solve_stats if not entry["warm_start"]]
+        if warm_start and len(cold) > 0:
+            if stats["solve_time"] is not None and cold[-1]["solve_time"] is not None:
+                stats["time_saved"] = cold[-1]["solve_time"] - stats["solve_time"]
+            stats["iterations_saved"] = cold[-1]["iterations"] - stats["iterations"]
+            logger.info(
+                "Warm start saved %s iteration(s), and %.3fs solve time"
+                % (stats["iterations_saved"], stats.get("time_saved", float("nan")))
+            )
+
+        self._solve_stats.append(stats)
+
+    def _set_warm_start(self, warm_start) -> bool:
+        # Returns whether any start values were actually set (otherwise, the solve is recorded as cold).
+        if isinstance(warm_start, Results):
+            n = 0
+            for (c, t, f), value in warm_start.to_dict(field_types=["var"]).items():
+                if f.endswith("__dual"):
+                    continue
+                try:
+                    jl_helper("set_variable_start_values")(getattr(self.get_component(c).var, f), value)
+                    n += 1
+                except Exception:
+                    logger.debug("Skipping warm start of `%s.var.%s`" % (c, f))
+            logger.info("Warm start: set start values from %d result(s)" % n)
+            return n > 0
+        elif warm_start is True:
+            if self._status in [ModelStatus.OPTIMAL, ModelStatus.OPTIMAL_LOCALLY]:
+                values = jl_helper("primal_values")(self.core)
+            elif self._last_primal is not None:
+                values = self._last_primal
+            else:
+                logger.warning("No previous solution available for warm start; starting cold")
+                return False
+            jl_helper("set_start_values")(self.core, values)
+            return True
+        else:
+            raise TypeError(f"`warm_start` must be a `bool` or `Results`, got `{warm_start!r}`")
+
+    def clone(self) -> "Model":
+        """Clone the generated model, without parsing the config, expanding templates, or reading files again.
+
+        The clone contains a copy of the core `JuMP` model and of all IESopt data (components, ...), and uses a new
+        instance of the same solver. It can be modified (e.g., using `update_parameters`) and optimized independently
+        of the original model. Solver attributes are copied as far as the solver reports them (otherwise, only
+        `Silent`, `TimeLimitSec`, and `NumberOfThreads` are copied). This will automatically invoke `generate` if the
+        model has not been generated yet.
+
+        Returns:
+            Model: The cloned model.
+
+        Examples:
+            ..  code-block:: python
+                :caption: Solving scenarios based on a single generated model.
+
+                import iesopt
+
+                template = iesopt.Model("config.iesopt.yaml")
+                template.generate()
+
+                scenarios = {}
+                for price in [20.0, 30.0, 40.0]:
+                    model = scenarios[price] = template.clone()
+                    model.update_parameters(gas_eur_mwh=price)
+                    model.optimize()
+        """
+        if self._status == ModelStatus.EMPTY:
+            self.generate()
+        if self._model is None:
+            raise Exception("Model was not properly set up; cannot clone it")
+
+        clone = copy.copy(self)
+        clone._model = jl_helper("clone_model")(self.core)
+        clone._status, clone._status_details, clone._results = ModelStatus.GENERATED, None, None
+
+        # Sensitivities (and the base snapshot) are relative to the model as generated, which also holds for the clone.
+        clone._sensitivities = dict(self._sensitivities)
+        clone._parameters = dict(self._parameters)
+        clone._column_sensitivities = dict(self._column_sensitivities)
+        clone._virtual_files = dict(self._virtual_files)
+        clone._solve_stats = []
+
+        apply_solver_threads(clone.core)
+        return clone
+
+    def save_generated(self, filename: str | Path) -> None:
+        """Save the generated model, including all IESopt data (components, ...), to restore it using `load_generated`.
+
+        In contrast to `write_to_file`, this keeps everything that is needed to optimize the model, and extract its
+        results, without generating it again (e.g., in a restarted process, or on another node). Loading requires the
+        same environment (Julia, IESopt.jl, and solver versions, see `Config.fingerprint`). This will automatically
+        invoke `generate` if the model has not been generated yet.
+
+        Arguments:
+            filename (str | Path): File to save the model to.
+
+        Examples:
+            ..  code-block:: python
+                :caption: Generating a model once, and solving it in another process.
+
+                import iesopt
+
+                model = iesopt.Model("config.iesopt.yaml")
+                model.save_generated("model.iesopt.jls")
+
+                # ... later, or somewhere else:
+                model = iesopt.Model.load_generated("model.iesopt.jls")
+                model.optimize()
+        """
+        if self._status == ModelStatus.EMPTY:
+            self.generate()
+        if self._model is None:
+            raise Exception("Model was not properly set up; cannot save it")
+
+        # The config and keyword arguments (including all in-place updates) allow in-place updates of the loaded model.
+        kwargs = dict(self._kwargs_py)
+        if self._parameters:
+            kwargs["parameters"] = dict(kwargs.get("parameters") or {}) | self._parameters
+        kwargs["virtual_files"] = {
+            name: resolve_frame(df) for (name, df) in (kwargs.get("virtual_files") or {}).items()
+        }
+        kwargs["virtual_files"] |= self._virtual_files
+        if not kwargs["virtual_files"]:
+            kwargs.pop("virtual_files")
+
+        try:
+            metadata = pickle.dumps(
+                {
+                    "filename": str(Path(self._filename).resolve()),
+                    "kwargs": kwargs,
+                    "updated_in_place": self._updated_in_place,
+                }
+            )
+        except Exception as e:
+            logger.warning("Failed to save the keyword arguments of the model; it can not be updated in place: %s" % e)
+            metadata = b""
+
+        jl_helper("save_model")(self.core, str(filename), Config.fingerprint(), np.frombuffer(metadata, dtype=np.uint8))
+
+    @classmethod
+    def load_generated(cls, filename: str | Path) -> "Model":
+        """Load a model that was saved using `save_generated`.
+
+        Arguments:
+            filename (str | Path): File that the model was saved to.
+
+        Returns:
+            Model: The generated model.
+        """
+        data = jl_helper("load_model")(str(filename), Config.fingerprint())
+
+        metadata = np.asarray(data.metadata).tobytes()
+        metadata = pickle.loads(metadata) if metadata else {"filename": "", "kwargs": {}}
+
+        model = cls(metadata["filename"], **metadata["kwargs"])
+        model._model = data.model
+        model._status = ModelStatus.GENERATED
+        model._updated_in_place = metadata.get("updated_in_place", False)
+        apply_solver_threads(model.core)
+        return model
+
     def compute_iis(self, filename=None) -> None:
         """Compute and print the Irreducible Infeasible Set (IIS) of the model, or optionally write it to a file.
 
@@ -253,6 +811,8 @@ class Model:
 
         if f is None:
             raise Exception(f"Field `{field}` not found in component `{component}`")
+        if self._updated_in_place and fieldtype in ["exp", "obj"]:
+            raise Exception(f"Field `{field}` of component `{component}` is not available after in-place updates")
 
         try:
             if mode == "value":
@@ -0,0 +1,147 @@
+import copy
+import hashlib
+
+import pandas as pd
+
+from .util import logger
+
+
+_frames: dict[str, "FrameHandle"] = {}
+
+
+class FrameHandle:
+    """Handle of a DataFrame that was registered using :py:func:`iesopt.register_frame`.
+
+    It can be used instead of the DataFrame, e.g., as virtual file: `iesopt.Model(..., virtual_files={"data": handle})`.
+    """
+
+    def __init__(self, name: str, df: pd.DataFrame):
+        from .julia.util import recursive_convert_py2jl
+
+        self._name = name
+        self._frame = df
+        self._jl = recursive_convert_py2jl(df)
+        self._nbytes = int(df.memory_usage(deep=True, index=False).sum())
+        # Shared with all references to this frame (see `_reference`), so that it is hashed only once.
+        self._digest = {}
+
+    def __repr__(self) -> str:
+        state = "released" if self._jl is None else f"{self._frame.shape[0]}x{self._frame.shape[1]}"
+        return f"FrameHandle('{self._name}', {state})"
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the data of the registered frame, in bytes."""
+        return self._nbytes
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """The registered `pd.DataFrame`; it must not be modified, since Julia shares its (numerical) data."""
+        self._check()
+        return self._frame
+
+    @property
+    def jl(self):
+        """The Julia `DataFrame`."""
+        self._check()
+        return self._jl
+
+    def digest(self) -> bytes:
+        """Content hash of the frame (e.g., used by the input cache), computed only once."""
+        if "sha256" not in self._digest:
+            from .cache import _hash_value
+
+            h = hashlib.sha256()
+            _hash_value(h, self.frame)
+            self._digest["sha256"] = h.digest()
+        return self._digest["sha256"]
+
+    def release(self):
+        """Release the frame, see :py:func:`iesopt.release_frame`."""
+        release_frame(self._name)
+
+    def _reference(self) -> "FrameHandle":
+        """Unregistered handle of the same frame, that stays valid if the frame is released (e.g., kept by models)."""
+        self._check()
+        return copy.copy(self)
+
+    def _check(self):
+        if self._jl is None:
+            raise Exception(f"Frame `{self._name}` was released; register it again to use it")
+
+
+def register_frame(name: str, df: pd.DataFrame) -> FrameHandle:
+    """
+    Register a DataFrame, converting it into Julia once, to pass it to multiple models without converting it again.
+
+    Registered frames stay in memory until they are released (see :py:func:`iesopt.release_frame`). Models that were
+    created using a frame keep their own reference to it, and are not affected by releasing it (its memory is freed
+    once these models are gone as well). Numerical columns are shared between Python and Julia, so the DataFrame must
+    not be modified after registering it.
+
+    Arguments:
+        name (str): Unique name of the frame.
+        df (pd.DataFrame): The DataFrame to register.
+
+    Returns:
+        FrameHandle: Handle of the frame, that can be used instead of the DataFrame (e.g., as virtual file).
+
+    Example:
+        ..  code-block:: python
+            :caption: Using the same weather data for multiple scenarios
+
+            import iesopt
+
+            weather = iesopt.register_frame("weather_2019", df_weather)
+            for price in [20.0, 30.0, 40.0]:
+                iesopt.run("config.iesopt.yaml", parameters=dict(price=price), virtual_files=dict(data=weather))
+            weather.release()
+    """
+    if name in _frames:
+        raise ValueError(f"A frame named `{name}` is already registered; release it first")
+    if not isinstance(df, pd.DataFrame):
+        raise TypeError(f"Only `pd.DataFrame`s can be registered, got `{type(df).__name__}`")
+
+    handle = _frames[name] = FrameHandle(name, df)
+    logger.debug("Registered frame `%s` (%.1f MB)" % (name, handle.nbytes / 1024**2))
+    return handle
+
+
+def release_frame(name: str):
+    """
+    Release a registered frame (see :py:func:`iesopt.register_frame`), so that its memory can be freed.
+
+    The handle returned by `register_frame` can not be used afterwards; models that were already created using it
+    keep working.
+
+    Arguments:
+        name (str): Name of the frame.
+    """
+    handle = _frames.pop(name, None)
+    if handle is None:
+        raise KeyError(f"No frame named `{name}` is registered")
+    handle._frame, handle._jl = None, None
+
+
+def registered_frames() -> dict:
+    """
+    Get all registered frames, and their memory usage.
+
+    Returns:
+        Dictionary with the entries `frames` (mapping each name to its `rows`, `columns`, and `bytes`), and `bytes` (the
+        total memory used by all registered frames).
+    """
+    frames = {
+        name: {"rows": handle.frame.shape[0], "columns": handle.frame.shape[1], "bytes": handle.nbytes}
+        for (name, handle) in _frames.items()
+    }
+    return {"frames": frames, "bytes": sum(frame["bytes"] for frame in frames.values())}
+
+
+def resolve_frame(item):
+    """The `pd.DataFrame` of `item`, if it is a `FrameHandle`, otherwise `item` itself."""
+    return item.frame if isinstance(item, FrameHandle) else item
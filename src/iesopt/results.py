@@ -1,11 +1,17 @@
+import sys
 import warnings
 import re
+from bisect import bisect_left
+from collections import OrderedDict
+from collections.abc import Mapping
+from fnmatch import fnmatchcase
 import pandas as pd
 import numpy as np
 from pydantic import validate_call
 
+from .config import Config
 from .util import get_iesopt_module_attr
-from .julia import jl_isa
+from .julia.helpers import jl_helper
 
 
 class ddict(dict):
@@ -18,26 +24,32 @@ class ddict(dict):
 
 class JuliaCallPyConvertReadWrapper:
     def __init__(self, obj):
+        self._obj = obj
+
+    @property
+    def _juliacall(self):
+        # Only imported when actually wrapping Julia objects, which allows wrapping plain Python data without Julia.
         import juliacall
 
-        self._juliacall = juliacall
-        self._obj = obj
+        return juliacall
 
     def keys(self):
-        if isinstance(self._obj, dict | self._juliacall.DictValue):
+        if isinstance(self._obj, dict) or isinstance(self._obj, self._juliacall.DictValue):
             return dict(self._obj).keys()
         raise TypeError(f"Object of type '{type(self._obj)}' inside JuliaCallPyConvertReadWrapper has no keys")
 
     def __len__(self):
-        if isinstance(self._obj, dict | list | tuple | self._juliacall.DictValue | self._juliacall.VectorValue):
+        if isinstance(self._obj, dict | list | tuple) or isinstance(
+            self._obj, self._juliacall.DictValue | self._juliacall.VectorValue
+        ):
             return len(self._obj)
         raise TypeError(f"Object of type '{type(self._obj)}' inside JuliaCallPyConvertReadWrapper has no length")
 
     def _rewrap_return(self, value):
+        if isinstance(value, float | int | str | bool | type(None) | np.ndarray):
+            return value
         if isinstance(value, self._juliacall.ArrayValue):
             return value.to_numpy(copy=False)
-        if isinstance(value, float | int | str | bool | type(None)):
-            return value
 
         if isinstance(value, self._juliacall.DictValue):
             return JuliaCallPyConvertReadWrapper(value)
@@ -52,20 +64,220 @@ class JuliaCallPyConvertReadWrapper:
         return self._rewrap_return(self._obj.get(key))
 
 
+class _ResultsStore(Mapping):
+    """Compact store of results, mapping `(component, fieldtype, field)` to values.
+
+    Temporal results (one float per snapshot) are rows of a single matrix, and scalar results are entries of a single
+    vector; all other results (e.g., vectors of a different length) are kept as they are. Temporal results are returned
+    as views into the matrix (slicing them, e.g., to a range of snapshots, also returns views).
+    """
+
+    TEMPORAL, SCALAR, OTHER = 0, 1, 2
+
+    def __init__(self, entries: dict, n_snapshots: int):
+        self._index = {}
+        temporal, scalars, self._other = [], [], []
+        for key, value in entries.items():
+            if type(value) is float:
+                self._index[key] = (_ResultsStore.SCALAR, len(scalars))
+                scalars.append(value)
+            elif (
+                isinstance(value, np.ndarray)
+                and value.ndim == 1
+                and value.dtype.kind == "f"
+                and len(value) == n_snapshots > 0
+            ):
+                self._index[key] = (_ResultsStore.TEMPORAL, len(temporal))
+                temporal.append(value)
+            else:
+                self._index[key] = (_ResultsStore.OTHER, len(self._other))
+                self._other.append(value)
+
+        self.temporal = np.empty((len(temporal), n_snapshots), dtype=np.float64)
+        for i, value in enumerate(temporal):
+            self.temporal[i] = value
+        self.scalars = np.array(scalars, dtype=np.float64)
+
+    def __getitem__(self, key):
+        kind, i = self._index[key]
+        if kind == _ResultsStore.TEMPORAL:
+            return self.temporal[i]
+        if kind == _ResultsStore.SCALAR:
+            return float(self.scalars[i])
+        return self._other[i]
+
+    def __contains__(self, key) -> bool:
+        return key in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def temporal_rows(self, keys: list):
+        """Matrix of the temporal results `keys` (one row each), or `None` if any of them is not temporal.
+
+        This is a view into the store if `keys` are consecutive rows (e.g., all temporal results), otherwise a copy.
+        """
+        rows = []
+        for key in keys:
+            kind, i = self._index[key]
+            if kind != _ResultsStore.TEMPORAL:
+                return None
+            rows.append(i)
+
+        if len(rows) > 0 and rows == list(range(rows[0], rows[0] + len(rows))):
+            return self.temporal[rows[0] : rows[0] + len(rows)]
+        return self.temporal[rows]
+
+
+class _LazyResults:
+    """Results that are fetched on demand, keeping at most `budget` bytes of them (least recently used ones are dropped).
+
+    All available results, and their kind (0 = scalar, 1 = vector, 2 = other, see `pack_results`), are indexed once,
+    when first needed, without extracting any values.
+    """
+
+    def __init__(self, index, budget: int):
+        self._index = index
+        self._kinds = None
+        self._entries = OrderedDict()
+        self.budget = budget
+        self.nbytes = 0
+        self.stats = {"hits": 0, "misses": 0, "evicted": 0}
+
+    @property
+    def kinds(self) -> dict:
+        if self._kinds is None:
+            self._kinds = self._index()
+        return self._kinds
+
+    def get(self, key, fetch):
+        """Value of `key`, calling `fetch()` to obtain it if it is not cached."""
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return self._entries[key][0]
+
+        self.stats["misses"] += 1
+        value = fetch()
+        size = value.nbytes if isinstance(value, np.ndarray) else sys.getsizeof(value)
+        if size > self.budget:
+            return value
+
+        self._entries[key] = (value, size)
+        self.nbytes += size
+        while self.nbytes > self.budget:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.nbytes -= evicted
+            self.stats["evicted"] += 1
+        return value
+
+    def info(self) -> dict:
+        return {"entries": len(self._entries), "bytes": self.nbytes, "budget": self.budget, **self.stats}
+
+
+class _ResultsIndex:
+    """Index of result keys, built once, to select results by component and field without scanning all of them.
+
+    Results are grouped by component, and by fieldtype and/or field (ignoring the `__dual` suffix). Component names are
+    additionally kept sorted, so that prefix (and glob) queries use a binary search instead of a prefix tree. Components
+    with certain tags are looked up using `tagged(tags)` (if available), once per tag.
+    """
+
+    MATCH = ["regex", "glob", "prefix", "exact"]
+
+    def __init__(self, keys, tagged=None):
+        self._by_component = {}
+        self._by_field = {}
+        for key in keys:
+            c, t, f = key
+            f = f.split("__")[0]
+            self._by_component.setdefault(c, []).append(key)
+            for k in [(t, f), (t, None), (None, f)]:
+                self._by_field.setdefault(k, []).append(key)
+
+        self._order = {c: i for (i, c) in enumerate(self._by_component)}
+        self._names = sorted(self._by_component)
+        self._tagged = tagged
+        self._tags = {}
+        self._queries = {}
+
+    def components(self, pattern: str, match: str) -> list[str]:
+        """Components that match `pattern`, in the order of their results."""
+        if match not in _ResultsIndex.MATCH:
+            raise ValueError(f"`match` must be one of {_ResultsIndex.MATCH}, got '{match}'")
+        if match == "exact":
+            return [pattern] if pattern in self._by_component else []
+
+        query = (pattern, match)
+        if query not in self._queries:
+            if match == "regex":
+                regex = re.compile(pattern)
+                found = [c for c in self._by_component if regex.search(c)]
+            else:
+                prefix = pattern if match == "prefix" else re.split(r"[*?\[]", pattern, maxsplit=1)[0]
+                found = []
+                for i in range(bisect_left(self._names, prefix), len(self._names)):
+                    if not self._names[i].startswith(prefix):
+                        break
+                    if match == "prefix" or fnmatchcase(self._names[i], pattern):
+                        found.append(self._names[i])
+                found.sort(key=self._order.__getitem__)
+
+            # Repeated queries (e.g., refreshing a dashboard) are answered directly.
+            if len(self._queries) >= 256:
+                self._queries.clear()
+            self._queries[query] = found
+        return self._queries[query]
+
+    def select(
+        self, component: str, match: str, *, fieldtype: str = None, field: str = None, tagged=None
+    ) -> list[tuple]:
+        """Keys of all results of components that match `component`, optionally filtered by field and/or tags."""
+        components = self.components(component, match)
+        if tagged is not None:
+            tags = (tagged,) if isinstance(tagged, str) else tuple(tagged)
+            if tags not in self._tags:
+                if self._tagged is None:
+                    raise ValueError("Selecting components by tag is only possible for results of a model")
+                self._tags[tags] = set(self._tagged(list(tags)))
+            components = [c for c in components if c in self._tags[tags]]
+
+        if fieldtype is None and field is None:
+            return [key for c in components for key in self._by_component[c]]
+        selected = set(components)
+        return [key for key in self._by_field.get((fieldtype, field), []) if key[0] in selected]
+
+
 class Results:
     _valid_attrs = ["attributes", "model", "custom", "input", "info", "snapshots", "components"]
 
+    # Field types of results that IESopt computes from its own expressions, which keep the values from generating the
+    # model; these are not available for models that were updated in place (see `Model.update_parameters`).
+    _STALE_AFTER_UPDATE = ["exp", "obj", "res"]
+
     @validate_call
-    def __init__(self, *, file: str = None, model=None):
+    def __init__(self, *, file: str = None, model=None, data: dict = None, budget: float = None):
         """
-        Create a new `Results` object, either from a file or from an IESopt model. Make sure to pass either a file or a
-        model explicitly using a keyword argument.
+        Create a new `Results` object, either from a file, from an IESopt model, or from already extracted data. Make
+        sure to pass exactly one of them explicitly using a keyword argument.
+
+        By default, all results of a model are extracted at once, when first accessed. Setting a memory `budget`
+        instead fetches each result from the model only when it is accessed, keeping at most `budget` MB of them in
+        memory (dropping the least recently used ones first, see `cache_info()`).
 
         Keyword Arguments
             file : Optional[str]
                 Path to the results file to load, by default None
             model : Optional[IESopt.Model]
                 IESopt model to extract results from, by default None
+            data : Optional[dict]
+                Plain results data (not referencing Julia), as created by `Results.to_data()`, by default None
+            budget : Optional[float]
+                Memory budget (in MB) of results that are fetched on demand from `model`, by default None, which uses
+                `IESOPT_RESULTS_BUDGET` (extracting all results at once if that is not set either)
         """
         self._attributes = None
         self._model = None
@@ -77,28 +289,40 @@ class Results:
         self._source = None
 
         self._cache = None
+        self._lazy = None
+        self._index = None
+        self._tagged = None
+        self._stale = set()
 
-        self._IESopt = get_iesopt_module_attr("IESopt")
-        self._julia = get_iesopt_module_attr("julia")
-
-        if (int(file is None) + int(model is None)) != 1:
-            raise Exception("Either file or model must be set, not both and not none of them.")
+        if (int(file is not None) + int(model is not None) + int(data is not None)) != 1:
+            raise Exception("Exactly one of file, model, or data must be set.")
         elif file is not None:
             if not isinstance(file, str):
                 raise Exception("File must be a `str`, did you try passing a model without `model=your_model`?")
             self._from_file(file)
         elif model is not None:
-            self._from_model(model)
+            self._from_model(model, budget)
+        elif data is not None:
+            self._from_data(data)
 
         # Allow dot access to attributes of "model" results, to align with access to the models structure.
         self._model = ddict(self._model)
 
+    @property
+    def _IESopt(self):
+        return get_iesopt_module_attr("IESopt")
+
+    @property
+    def _julia(self):
+        return get_iesopt_module_attr("julia")
+
     @property
     def components(self):
         return JuliaCallPyConvertReadWrapper(self._model["components"])
 
     @property
     def objectives(self):
+        self._check_stale("obj")
         return JuliaCallPyConvertReadWrapper(self._model["objectives"])
 
     @property
@@ -128,6 +352,13 @@ class Results:
         elif mode != "primal":
             raise ValueError(f"`mode` must be 'primal' or 'dual', got '{mode}'")
 
+        self._check_stale(fieldtype)
+
+        if self._lazy is not None:
+            if (component, fieldtype, field) not in self._lazy.kinds:
+                raise ValueError(f"Failed to access result '{fieldtype}.{field}' in component '{component}'")
+            return self._lookup((component, fieldtype, field))
+
         if build_cache:
             self._build_cache()
 
@@ -140,7 +371,9 @@ class Results:
         return self._get_safe(component, fieldtype, field, mode)
 
     @validate_call
-    def query_available_results(self, component: str, mode: str = "both"):
+    def query_available_results(
+        self, component: str, mode: str = "both", *, match: str = "regex", tagged: str | list[str] = None
+    ):
         """
         Query the available results for a specific component, optionally filtered by `mode`.
 
@@ -149,24 +382,21 @@ class Results:
                 Component to query results for
             mode : Optional[str]
                 Mode to query results for, either "both", "primal", or "dual", by default "both"
+            match : Optional[str]
+                How `component` is matched against component names, either "regex" (searching for the regular
+                expression), "glob" (e.g., "unit_*"), "prefix", or "exact", by default "regex"; all but "regex" avoid
+                checking every component
+            tagged : Optional[str | list[str]]
+                Only query components with this tag (or these tags), by default None; only for results of a model
         """
-        regex = re.compile(component)
-
-        if not self._has_cache():
-            self._build_cache()
+        keys = self._get_index().select(component, match, tagged=tagged)
 
         if mode == "both":
-            return [
-                (it[1], (x := it[2].split("__"))[0], "primal" if len(x) == 1 else "dual")
-                for it in self._cache
-                if re.search(regex, it[0])
-            ]
+            return [(it[1], (x := it[2].split("__"))[0], "primal" if len(x) == 1 else "dual") for it in keys]
         elif mode == "primal":
-            return [(it[1], it[2]) for it in self._cache if re.search(regex, it[0]) and "__dual" not in it[2]]
+            return [(it[1], it[2]) for it in keys if "__dual" not in it[2]]
         elif mode == "dual":
-            return [
-                (it[1], it[2].split("__")[0]) for it in self._cache if re.search(regex, it[0]) and "__dual" in it[2]
-            ]
+            return [(it[1], it[2].split("__")[0]) for it in keys if "__dual" in it[2]]
         else:
             raise ValueError("Invalid mode, must be either 'both', 'primal', or 'dual'")
 
@@ -199,15 +429,28 @@ class Results:
 
         Returns:
             Dictionary of results, with keys as tuples of (component, fieldtype, field) and values as the result.
+
+        For models that were updated in place (see `Model.update_parameters`), only "var" and "con" results are
+        available (and extracted by default).
         """
         if build_cache:
             self._build_cache()
 
         if field_types is None:
-            field_types = ["var", "exp", "con", "obj", "res"]
+            field_types = [t for t in ["var", "exp", "con", "obj", "res"] if t not in self._stale]
+        for t in field_types:
+            self._check_stale(t)
 
         entries = {}
-        if self._cache is None:
+        if self._lazy is not None:
+            for c, t, f in self._lazy.kinds:
+                if (t in field_types) and ((filter is None) or filter(c, t, f)):
+                    entries[(c, t, f)] = self._lookup((c, t, f))
+        elif self._cache is None and self._source == "an IESopt model":
+            for (c, t, f), v in self._extract_all(field_types).items():
+                if (filter is None) or filter(c, t, f):
+                    entries[(c, t, f)] = v
+        elif self._cache is None:
             for c in self._model["components"].keys():
                 for t in field_types:
                     container = getattr(self._model["components"][c], t)
@@ -263,6 +506,10 @@ class Results:
                             return pd.Series(v, index=self._snapshots, name=k)
 
             if orientation == "wide":
+                values = self._cache.temporal_rows(list(_dict.keys())) if self._has_store() else None
+                if values is not None:
+                    columns = pd.MultiIndex.from_tuples(list(_dict.keys()))
+                    return pd.DataFrame(values.T, index=self._snapshots, columns=columns, copy=False)
                 return pd.DataFrame(_dict, index=self._snapshots)
 
         if orientation == "wide":
@@ -277,40 +524,8 @@ class Results:
             orientation = "long"
 
         if orientation == "long":
-            n_snapshots = len(self._snapshots)
-            _data = {c: [] for c in ["snapshot", "component", "fieldtype", "field", "value", "mode"]}
-
-            for (c, t, f), v in _dict.items():
-                m = "primal"
-                if f.endswith("__dual"):
-                    f = f[:-6]
-                    m = "dual"
-
-                if isinstance(v, (int, float)):
-                    _data["snapshot"].append(None)
-                    _data["component"].append(c)
-                    _data["fieldtype"].append(t)
-                    _data["field"].append(f)
-                    _data["value"].append(v)
-                    _data["mode"].append(m)
-                else:
-                    size = len(v)
-                    if size == n_snapshots:
-                        snapshots = self._snapshots
-                        field_names = [f] * n_snapshots
-                    else:
-                        snapshots = [None] * size
-                        field_names = [f"{f}[i_{idx}]" for idx in range(size)]
-
-                    _data["snapshot"].extend(snapshots)
-                    _data["component"].extend([c] * size)
-                    _data["fieldtype"].extend([t] * size)
-                    _data["field"].extend(field_names)
-                    _data["value"].extend(v)
-                    _data["mode"].extend([m] * size)
-
             try:
-                return pd.DataFrame(_data)
+                return self._to_pandas_long(_dict)
             except Exception:
                 warnings.warn(
                     "Failed to create DataFrame. This is mostlikely due to non aligned result shapes. A "
@@ -321,41 +536,151 @@ class Results:
 
         raise ValueError(f"`orientation` can be 'wide' or 'long', got '{orientation}'.")
 
+    def _to_pandas_long(self, _dict: dict) -> pd.DataFrame:
+        # Each result is a segment of rows: temporal results (one row per snapshot), scalars (one row), or other vectors
+        # (one row per entry, named `field[i_0]`, ...). All columns are built from per-segment data, and all string
+        # columns (including `snapshot`, referring to the shared snapshots) are categoricals.
+        n_snapshots = len(self._snapshots)
+        names = {c: [] for c in ["component", "fieldtype", "field", "mode"]}
+        sizes, temporal, values = [], [], []
+
+        def add(c, t, f, m, size, is_temporal):
+            names["component"].append(c)
+            names["fieldtype"].append(t)
+            names["field"].append(f)
+            names["mode"].append(m)
+            sizes.append(size)
+            temporal.append(is_temporal)
+
+        for (c, t, f), v in _dict.items():
+            m = "primal"
+            if f.endswith("__dual"):
+                f = f[:-6]
+                m = "dual"
+
+            if isinstance(v, (int, float)):
+                add(c, t, f, m, 1, False)
+                values.append(np.array([v]))
+            else:
+                v = np.asarray(v if isinstance(v, np.ndarray) else list(v))
+                if len(v) == n_snapshots:
+                    add(c, t, f, m, n_snapshots, True)
+                else:
+                    for idx in range(len(v)):
+                        add(c, t, f"{f}[i_{idx}]", m, 1, False)
+                values.append(v)
+
+        sizes = np.array(sizes, dtype=np.int64)
+        n_rows = int(sizes.sum())
+
+        columns = {}
+        starts = np.repeat(np.cumsum(sizes) - sizes, sizes)
+        codes = np.where(np.repeat(np.array(temporal, dtype=bool), sizes), np.arange(n_rows) - starts, -1)
+        if pd.Index(self._snapshots).is_unique:
+            columns["snapshot"] = pd.Categorical.from_codes(codes, categories=self._snapshots, ordered=True)
+        else:
+            # Non-temporal rows (code -1) get a missing snapshot, as above (which requires an index that can hold it).
+            snapshots = pd.Index(self._snapshots, dtype=object)
+            columns["snapshot"] = snapshots.take(codes, allow_fill=True, fill_value=np.nan)
+
+        for col, entries in names.items():
+            categories, inverse = np.unique(np.array(entries, dtype=object), return_inverse=True)
+            columns[col] = pd.Categorical.from_codes(np.repeat(inverse, sizes), categories=categories)
+        columns["value"] = np.concatenate(values) if values else np.array([], dtype=np.float64)
+
+        return pd.DataFrame(columns, columns=["snapshot", "component", "fieldtype", "field", "value", "mode"])
+
     @validate_call
-    def overview(self, component: str, *, temporal: bool, mode: str = "both"):
-        regex = re.compile(component)
+    def overview(
+        self,
+        component: str,
+        *,
+        temporal: bool,
+        mode: str = "both",
+        match: str = "regex",
+        fieldtype: str = None,
+        field: str = None,
+        tagged: str | list[str] = None,
+    ):
+        """
+        Get an overview of all temporal (as :py:class:`pandas.DataFrame`), or all scalar (as
+        :py:class:`pandas.Series`) results of the components matching `component`.
 
-        if not self._has_cache():
-            self._build_cache()
+        Arguments:
+            component : str
+                Component(s) to get results for, see `match`
+            temporal : bool
+                Whether to get temporal or scalar results
+            mode : Optional[str]
+                Mode to get results for, either "both", "primal", or "dual", by default "both"
+            match : Optional[str]
+                How `component` is matched, see `query_available_results`, by default "regex"
+            fieldtype : Optional[str]
+                Only get results of this fieldtype (e.g., "var"), by default None
+            field : Optional[str]
+                Only get results of this field (e.g., "flow"), by default None
+            tagged : Optional[str | list[str]]
+                Only get results of components with this tag (or these tags), by default None
 
-        if mode == "both":
-            ret = {
-                (k[0], k[1], (x := k[2].split("__"))[0], "primal" if len(x) == 1 else "dual"): v
-                for (k, v) in self._cache.items()
-                if re.search(regex, k[0]) and isinstance(v, int | float) != temporal
-            }
-        elif mode == "primal":
-            ret = {
-                (k[0], k[1], k[2], "primal"): v
-                for (k, v) in self._cache.items()
-                if re.search(regex, k[0]) and "__dual" not in k[2] and isinstance(v, int | float) != temporal
-            }
-        elif mode == "dual":
-            ret = {
-                (k[0], k[1], k[2].split("__")[0], "dual"): v
-                for (k, v) in self._cache.items()
-                if re.search(regex, k[0]) and "__dual" in k[2] and isinstance(v, int | float) != temporal
-            }
-        else:
+        Returns:
+            DataFrame or Series, with the columns/index (`component`, `fieldtype`, `field`, `mode`), or `None` if there
+            are no matching results.
+        """
+        if mode not in ["both", "primal", "dual"]:
             raise ValueError("Invalid mode, must be either 'both', 'primal', or 'dual'")
 
-        if len(ret) == 0:
+        # Maps each selected result to its column (`component`, `fieldtype`, `field`, `mode`).
+        selected = {}
+        for k in self._get_index().select(component, match, fieldtype=fieldtype, field=field, tagged=tagged):
+            is_dual = "__dual" in k[2]
+            if (mode == "primal" and is_dual) or (mode == "dual" and not is_dual):
+                continue
+            if self._is_scalar(k) == temporal:
+                continue
+            selected[k] = (k[0], k[1], k[2].split("__")[0] if is_dual else k[2], "dual" if is_dual else "primal")
+
+        if len(selected) == 0:
             return None
 
         if temporal:
-            return pd.DataFrame(ret, index=self._snapshots).sort_index(axis=1)
+            values = self._cache.temporal_rows(list(selected.keys())) if self._has_store() else None
+            if values is not None:
+                columns = pd.MultiIndex.from_tuples(list(selected.values()))
+                return pd.DataFrame(values.T, index=self._snapshots, columns=columns, copy=False).sort_index(axis=1)
+            return pd.DataFrame(
+                {col: self._lookup(k) for (k, col) in selected.items()}, index=self._snapshots
+            ).sort_index(axis=1)
         else:
-            return pd.Series(ret)
+            return pd.Series({col: self._lookup(k) for (k, col) in selected.items()})
+
+    def cache_info(self) -> dict | None:
+        """
+        Get statistics of results that are fetched on demand (see `budget`), or `None` if all results are extracted at
+        once.
+
+        Returns:
+            Dictionary with the entries `entries` (number of results kept in memory), `bytes` (their size), `budget` (in
+            bytes), and the number of `hits`, `misses`, and `evicted` results.
+        """
+        return None if self._lazy is None else self._lazy.info()
+
+    def to_data(self) -> dict:
+        """
+        Extract all results into plain Python data (not referencing any Julia objects), that can be pickled.
+
+        Returns:
+            Dictionary that can be used to recreate the results, using `Results(data=...)`.
+        """
+        results = self.to_dict()
+        objectives = {} if "obj" in self._stale else self.objectives._obj
+
+        return {
+            "source": self._source,
+            "snapshots": list(self._snapshots),
+            "components": list(self._components),
+            "objectives": {str(k): Results._to_plain(v) for (k, v) in objectives.items()},
+            "results": {k: Results._to_plain(v) for (k, v) in results.items()},
+        }
 
     # def __getattr__(self, attr: str):
     #     if attr not in Results._valid_attrs:
@@ -366,13 +691,75 @@ class Results:
     #         raise Exception(f"Attribute '{attr}' not properly loaded, consider checking `results.entries()` first")
     #     return getattr(self, f"_{attr}")
 
+    def _extract_all(self, field_types: list[str]) -> dict:
+        # Extract all results using a single call (see `pack_results`); values are views into a single buffer.
+        components = self._model["components"]
+        packed = jl_helper("pack_results")(components, field_types)
+
+        kinds = packed.kinds.to_numpy(copy=False)
+        offsets = packed.offsets.to_numpy(copy=False)
+        buffer = packed.buffer.to_numpy(copy=False)
+        names = str(packed.names).split("\0")
+
+        entries = {}
+        for i in range(len(kinds)):
+            c, t, f = names[3 * i : 3 * i + 3]
+            if kinds[i] == 0:
+                entries[(c, t, f)] = float(buffer[offsets[i]])
+            elif kinds[i] == 1:
+                entries[(c, t, f)] = buffer[offsets[i] : offsets[i + 1]]
+            else:
+                entries[(c, t, f)] = Results._safe_convert(getattr(getattr(components[c], t), f))
+        return entries
+
+    def _index_all(self) -> dict:
+        # Index all results (see `_LazyResults`), without extracting any values.
+        field_types = [t for t in ["var", "exp", "con", "obj", "res"] if t not in self._stale]
+        packed = jl_helper("pack_results")(self._model["components"], field_types, False)
+        names = str(packed.names).split("\0")
+        kinds = packed.kinds.to_numpy(copy=False)
+        return {tuple(names[3 * i : 3 * i + 3]): int(kinds[i]) for i in range(len(kinds))}
+
+    def _keys(self):
+        if self._lazy is not None:
+            return self._lazy.kinds
+        self._build_cache()
+        return self._cache
+
+    def _check_stale(self, fieldtype: str):
+        if fieldtype in self._stale:
+            raise ValueError(
+                f"Results of fieldtype '{fieldtype}' are not available, since the model was updated in place (IESopt "
+                f"computes them from its expressions, which keep the values from generating the model); only 'var' "
+                f"and 'con' results are, use `generate` to obtain all of them"
+            )
+
+    def _get_index(self) -> _ResultsIndex:
+        if self._index is None:
+            self._index = _ResultsIndex(self._keys(), self._tagged)
+        return self._index
+
+    def _lookup(self, key: tuple):
+        if self._lazy is not None:
+            # Copy, to not keep references to memory owned by Julia (and to be able to account for its size).
+            return self._lazy.get(key, lambda: Results._to_plain(self._get_safe(*key)))
+        return self._cache[key]
+
+    def _is_scalar(self, key: tuple) -> bool:
+        if self._lazy is not None and self._lazy.kinds[key] != 2:
+            return self._lazy.kinds[key] == 0
+        return isinstance(self._lookup(key), int | float)
+
     def _build_cache(self):
-        if self._cache is None:
-            self._cache = self.to_dict(build_cache=False)
+        if self._lazy is None and self._cache is None:
+            self._cache = _ResultsStore(self.to_dict(build_cache=False), len(self._snapshots))
 
     def _has_cache(self):
         return self._cache is not None
 
+    def _has_store(self):
+        return isinstance(self._cache, _ResultsStore)
+
     def _get_safe(self, component: str, fieldtype: str, field: str, mode: str = "primal"):
         if mode not in ["primal", "dual"]:
             raise ValueError(f"`mode` must be 'primal' or 'dual', got '{mode}'.")
@@ -424,8 +811,15 @@ class Results:
         self._components = sorted(results["model/components"].keys())
         self._source = file
 
-    def _from_model(self, model):
+    def _from_model(self, model, budget: float | None):
         self._source = "an IESopt model"
+        self._tagged = lambda tags: [str(c.name) for c in model.get_components(tagged=tags)]
+        if model._updated_in_place is True:
+            self._stale = set(Results._STALE_AFTER_UPDATE)
+        if budget is None and Config.get("results_budget") != "":
+            budget = float(Config.get("results_budget"))
+        if budget is not None:
+            self._lazy = _LazyResults(self._index_all, int(budget * 1024 * 1024))
         self._model = {
             "components": model.internal.results.components,
             "objectives": model.internal.results.objectives,
@@ -434,6 +828,13 @@ class Results:
         self._snapshots = [model.internal.model.snapshots[t].name for t in model.internal.model.T]
         self._components = sorted(model.internal.results.components.keys())
 
+    def _from_data(self, data: dict):
+        self._source = data["source"]
+        self._model = {"components": None, "objectives": data["objectives"], "custom": None}
+        self._snapshots = data["snapshots"]
+        self._components = data["components"]
+        self._cache = _ResultsStore(data["results"], len(self._snapshots))
+
     def __repr__(self) -> str:
         _sep = "', '"
         return (
@@ -454,13 +855,29 @@ class Results:
             + (f"'{_sep.join(self._info)}'" if self._info is not None else "none")
         )
 
+    @classmethod
+    def _to_plain(cls, value):
+        if isinstance(value, int | float | str | bool | type(None)):
+            return value
+        if not isinstance(value, np.ndarray):
+            value = Results._safe_convert(value)
+        if isinstance(value, np.ndarray):
+            # Copy, since arrays obtained from Julia only wrap memory owned by Julia.
+            return np.array(value, copy=True)
+        return value
+
     @classmethod
     def _safe_convert(cls, value):
         # TODO: ensure recursive conversion of all multi-element types
-        if jl_isa(value, "AbstractVector"):
+        if isinstance(value, int | float | str | bool | type(None) | np.ndarray):
+            return value
+
+        # Classify using a single call into Julia, instead of checking each type separately.
+        kind = jl_helper("classify")(value)
+        if kind == 1:
             return value.to_numpy(copy=False)
-        if jl_isa(value, "AbstractDict"):
+        if kind == 2:
             return dict(value)
-        if jl_isa(value, "AbstractSet"):
+        if kind == 3:
             return set(value)
         return value
@@ -0,0 +1,117 @@
+import os
+import copy
+
+from .config import Config
+from .util import logger
+
+
+_workers = None
+_applied = {"julia": None, "solver": None}
+
+
+def _available_cores() -> int:
+    try:
+        # Respects CPU affinity (e.g., cores assigned by a scheduler on a cluster).
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def set_workers(workers: int):
+    """Set the number of Python workers (processes running models in parallel) that share the thread budget.
+
+    This takes precedence over `IESOPT_WORKERS`, and is set automatically by the daemon.
+    """
+    global _workers
+    _workers = max(1, int(workers))
+
+
+def allocation() -> dict | None:
+    """Split the thread budget (`IESOPT_THREADS`) between workers, Julia, and the solver.
+
+    Each worker gets an equal share of the budget. Inside a worker, Julia and the solver can both use the full share,
+    since Julia is idle while the solver runs (and vice versa).
+
+    Returns:
+        Dictionary with the entries `budget`, `workers`, `julia`, and `solver` (threads per worker), or `None` if no
+        thread budget is configured.
+    """
+    budget = Config.get("threads")
+    if budget in ["", "no"]:
+        return None
+
+    budget = _available_cores() if budget == "auto" else int(budget)
+    workers = _workers or int(Config.get("workers"))
+    share = max(1, budget // workers)
+    if budget < workers:
+        logger.warning("Thread budget (%d) is smaller than the number of workers (%d)" % (budget, workers))
+
+    return {
+        "budget": budget,
+        "workers": workers,
+        "julia": share if Config.get("multithreaded") else 1,
+        "solver": share,
+    }
+
+
+def apply_solver_threads(model) -> int | None:
+    """Set the number of solver threads of a generated model according to the thread budget (if one is configured)."""
+    alloc = allocation()
+    if alloc is None:
+        return None
+
+    from .julia.helpers import jl_helper
+
+    if not jl_helper("set_threads")(model, alloc["solver"]):
+        logger.warning("Solver does not support setting the number of threads; ignoring thread budget")
+        return None
+
+    _applied["solver"] = alloc["solver"]
+    return alloc["solver"]
+
+
+def record_julia_threads(n: int):
+    _applied["julia"] = n
+
+
+def thread_report(*, log: bool = False) -> dict:
+    """
+    Get a report on how the thread budget (`IESOPT_THREADS`) was allocated in the current process.
+
+    Keyword Arguments:
+        log (bool): Whether to also write the report to the logger (at `INFO` level), defaults to `False`.
+
+    Returns:
+        Dictionary with the entries `allocation` (planned split, see :py:func:`iesopt.threads.allocation`, `None` if no
+        budget is configured), and `applied` (number of Julia threads that are actually running, and number of solver
+        threads that were last set on a model; `None` if not applied yet).
+
+    Example:
+        ..  code-block:: python
+            :caption: Inspecting the thread allocation
+
+            import iesopt
+            model = iesopt.run("opt/config.iesopt.yaml")
+            iesopt.thread_report(log=True)
+    """
+    report = {"allocation": allocation(), "applied": copy.deepcopy(_applied)}
+
+    if log:
+        alloc = report["allocation"]
+        if alloc is None:
+            logger.info("Thread report: no thread budget configured")
+        else:
+            logger.info(
+                "Thread report: budget %d, %d worker(s); planned per worker: julia=%d, solver=%d; applied: julia=%s, "
+                "solver=%s"
+                % (
+                    alloc["budget"],
+                    alloc["workers"],
+                    alloc["julia"],
+                    alloc["solver"],
+                    report["applied"]["julia"],
+                    report["applied"]["solver"],
+                )
+            )
+
+    return report
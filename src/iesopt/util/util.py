@@ -7,5 +7,10 @@ def set_iesopt_module_attr(attr: str, value):
 
 
 def get_iesopt_module_attr(attr: str):
-    """Get an internal attribute of the `iesopt` module."""
-    return sys.modules["iesopt"].__dict__[f"_!_attr_{attr}"]
+    """Get an internal attribute of the `iesopt` module, initializing Julia first if that did not happen yet."""
+    attrs = sys.modules["iesopt"].__dict__
+    if f"_!_attr_{attr}" not in attrs:
+        from ..julia.general import ensure_initialized
+
+        ensure_initialized()
+    return attrs[f"_!_attr_{attr}"]
@@ -0,0 +1,10 @@
+import iesopt.benchmark
+
+
+class TestBenchmark:
+    def test_compare_clone(self):
+        ret = iesopt.benchmark.compare_clone(["01_basic_single_node"], repeats=1)
+
+        timings = ret["01_basic_single_node"]
+        assert timings["variables"] > 0
+        assert timings["generate"] > 0 and timings["clone"] > 0
@@ -0,0 +1,93 @@
+import os
+import time
+
+import pandas as pd
+
+import iesopt
+from iesopt import cache
+from iesopt.config import Config
+
+from .test_model import CONFIG, CONFIG_VIRTUAL_FILE, _collect_garbage
+
+
+def _write_inputs(root):
+    (root / "config.iesopt.yaml").write_text("config: {}\n")
+    (root / "files").mkdir()
+    (root / "files" / "data.csv").write_text("demand\n1\n2\n")
+    (root / "out").mkdir()
+    (root / "out" / "results.csv").write_text("x\n1\n")
+    return root / "config.iesopt.yaml"
+
+
+def _key(filename, **kwargs):
+    folders = {k: k for k in ["files", "templates", "components", "addons"]}
+    return cache.cache_key(cache.input_files(filename, folders, None, kwargs.get("config")), kwargs)
+
+
+class TestCacheKey:
+    def test_tracks_inputs(self, tmp_path):
+        filename = _write_inputs(tmp_path)
+        key = _key(filename)
+        assert _key(filename) == key
+
+        # Results (or anything else outside of the input folders) do not matter.
+        (tmp_path / "out" / "results.csv").write_text("x\n2\n")
+        assert _key(filename) == key
+
+        (tmp_path / "files" / "data.csv").write_text("demand\n1\n3\n")
+        assert _key(filename) != key
+
+    def test_tracks_kwargs(self, tmp_path):
+        filename = _write_inputs(tmp_path)
+        df = pd.DataFrame({"demand": [1.0, 2.0]})
+
+        key = _key(filename, parameters={"price": 50}, virtual_files={"data": df})
+        assert _key(filename, parameters={"price": 50}, virtual_files={"data": df.copy()}) == key
+        assert _key(filename, parameters={"price": 60}, virtual_files={"data": df}) != key
+        assert _key(filename, parameters={"price": 50}, virtual_files={"data": df * 2}) != key
+
+    def test_unhashable_kwargs(self, tmp_path):
+        filename = _write_inputs(tmp_path)
+        assert _key(filename, parameters={"price": object()}) is None
+
+
+class TestEviction:
+    def test_least_recently_used_first(self, tmp_path):
+        for i, name in enumerate(["a", "b", "c"]):
+            (tmp_path / (name + cache.SUFFIX)).write_bytes(b"x" * 100)
+            os.utime(tmp_path / (name + cache.SUFFIX), (time.time() + i, time.time() + i))
+
+        # Using `a` makes `b` the least recently used entry.
+        os.utime(tmp_path / ("a" + cache.SUFFIX), (time.time() + 10, time.time() + 10))
+
+        assert cache.evict(tmp_path, 250) == 1
+        assert sorted(p.stem for p in tmp_path.iterdir()) == ["a", "c"]
+
+
+class TestInputCache:
+    def test_second_generate_is_cached(self, tmp_path, monkeypatch):
+        monkeypatch.setitem(Config._config, "input_cache", str(tmp_path / "cache"))
+        filename = tmp_path / "config.iesopt.yaml"
+        filename.write_text(CONFIG)
+
+        hits = cache.info()["hits"]
+        reference = iesopt.run(filename)
+        model = iesopt.run(filename)
+
+        assert cache.info()["hits"] == hits + 1
+        assert cache.info()["entries"] == 1
+        assert abs(model.objective_value - reference.objective_value) < 1e-4
+
+    def test_cached_with_virtual_files(self, tmp_path, monkeypatch):
+        monkeypatch.setitem(Config._config, "input_cache", str(tmp_path / "cache"))
+        filename = tmp_path / "config.iesopt.yaml"
+        filename.write_text(CONFIG_VIRTUAL_FILE)
+
+        # The cached model is stored while the views into the frames of the first model are still alive.
+        hits = cache.info()["hits"]
+        iesopt.run(filename, virtual_files={"data": pd.DataFrame({"demand": [1.0, 2.0, 3.0, 4.0]})})
+        _collect_garbage()
+        model = iesopt.run(filename, virtual_files={"data": pd.DataFrame({"demand": [1.0, 2.0, 3.0, 4.0]})})
+
+        assert cache.info()["hits"] == hits + 1
+        assert abs(model.objective_value - 50.0 * 10.0) < 1e-4
@@ -0,0 +1,63 @@
+import iesopt
+from iesopt.config import Config
+
+
+class TestFingerprint:
+    def test_fingerprint_is_stable(self):
+        assert Config.fingerprint() == Config.fingerprint()
+        assert len(Config.fingerprint()) == 64
+
+    def test_fingerprint_ignores_runtime_options(self, monkeypatch):
+        fingerprint = Config.fingerprint()
+        monkeypatch.setitem(Config._config, "optimization", "performance")
+        assert Config.fingerprint() == fingerprint
+
+    def test_fingerprint_tracks_environment(self, monkeypatch):
+        fingerprint = Config.fingerprint()
+        monkeypatch.setitem(Config._config, "solver_gurobi", "1.6.0")
+        assert Config.fingerprint() != fingerprint
+
+    def test_sysimage_keyed_by_fingerprint(self):
+        assert Config.fingerprint()[:16] in iesopt.__sysimage__.name
+
+
+class TestThreadBudget:
+    def test_no_budget(self, monkeypatch):
+        from iesopt.threads import allocation
+
+        monkeypatch.setitem(Config._config, "threads", "")
+        assert allocation() is None
+        assert iesopt.thread_report()["allocation"] is None
+
+    def test_split_between_workers(self, monkeypatch):
+        from iesopt.threads import allocation
+
+        monkeypatch.setitem(Config._config, "threads", "8")
+        monkeypatch.setitem(Config._config, "workers", "3")
+        monkeypatch.setitem(Config._config, "multithreaded", "no")
+        assert allocation() == {"budget": 8, "workers": 3, "julia": 1, "solver": 2}
+
+        monkeypatch.setitem(Config._config, "multithreaded", "yes")
+        assert allocation()["julia"] == 2
+
+    def test_workers_override(self, monkeypatch):
+        from iesopt import threads
+
+        monkeypatch.setattr(threads, "_workers", None)
+        monkeypatch.setitem(Config._config, "threads", "2")
+        monkeypatch.setitem(Config._config, "workers", "1")
+        threads.set_workers(4)
+        alloc = threads.allocation()
+        assert alloc["workers"] == 4 and alloc["solver"] == 1
+
+
+class TestEnvironmentOverlay:
+    def test_environ_takes_precedence(self, monkeypatch):
+        monkeypatch.setenv("IESOPT_OPTIMIZATION", "performance")
+        monkeypatch.setenv("IESOPT_SOLVER_GUROBI", "1.6.0")
+        monkeypatch.setenv("IESOPT_USE_SYSIMAGE", "no")
+
+        entries = Config._from_environ()
+        assert entries["IESOPT_OPTIMIZATION"] == "performance"
+        assert entries["IESOPT_SOLVER_GUROBI"] == "1.6.0"
+        assert "IESOPT_USE_SYSIMAGE" not in entries
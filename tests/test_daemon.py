@@ -0,0 +1,70 @@
+import os
+import stat
+import socket
+import multiprocessing
+import time
+
+import pytest
+
+import iesopt
+import iesopt.daemon
+
+
+def _serve(socket_path):
+    iesopt.daemon.serve(socket_path, workers=1, warmup=False)
+
+
+class TestDaemon:
+    def test_run(self, tmp_path):
+        socket_path = tmp_path / "iesopt.sock"
+        config_file = iesopt.make_example("01_basic_single_node", dst_dir=tmp_path, dst_name="config")
+
+        # Start the daemon from a fresh process, since this one already loaded Julia.
+        server = multiprocessing.get_context("spawn").Process(target=_serve, args=(socket_path,))
+        server.start()
+        try:
+            for _ in range(600):
+                if socket_path.exists():
+                    break
+                time.sleep(0.1)
+
+            model = iesopt.daemon.run(config_file, socket_path=socket_path, config={"general.verbosity.core": "error"})
+            assert model.status == iesopt.ModelStatus.OPTIMAL
+            assert abs(model.objective_value - 525.0) < 1e-4
+            assert len(model.results.to_dict()) > 0
+        finally:
+            server.terminate()
+            server.join()
+
+    def test_socket_is_private(self, tmp_path, mocker):
+        # WHEN: the socket is bound, it must already be inaccessible to other users (not only after `chmod`)
+        modes = []
+        chmod = mocker.patch("os.chmod", side_effect=lambda p, m: modes.append(stat.S_IMODE(os.stat(p).st_mode)))
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+            iesopt.daemon._bind_private(server, tmp_path / "iesopt.sock")
+
+        assert chmod.called
+        assert modes[0] & 0o077 == 0
+
+    def test_refuses_foreign_sockets(self, tmp_path, mocker):
+        path = tmp_path / "iesopt.sock"
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+            iesopt.daemon._bind_private(server, path)
+
+            # WHEN: the socket is accessible by other users
+            os.chmod(path, 0o666)
+            with pytest.raises(PermissionError, match="other users can access it"):
+                iesopt.daemon.run("config.iesopt.yaml", socket_path=path)
+
+            # WHEN: the socket is owned by another user
+            os.chmod(path, 0o600)
+            mocker.patch("os.getuid", return_value=os.getuid() + 1)
+            with pytest.raises(PermissionError, match="owned by another user"):
+                iesopt.daemon.run("config.iesopt.yaml", socket_path=path)
+
+    def test_default_socket_is_private(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        assert iesopt.daemon.default_socket() == tmp_path / "iesopt.sock"
+
+        monkeypatch.delenv("XDG_RUNTIME_DIR")
+        assert iesopt.daemon.default_socket().parent.name == f"iesopt-{os.getuid()}"
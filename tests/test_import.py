@@ -0,0 +1,53 @@
+import json
+import subprocess
+import sys
+
+import iesopt
+
+# Budget (in seconds) for Julia-free paths; these do not start Julia, so they should never take more than a fraction
+# of a second (the budget is chosen generously to prevent flaky results on slow CI runners).
+IMPORT_BUDGET = 1.0
+
+
+def _measure(code: str) -> dict:
+    script = (
+        "import json, sys, time\n"
+        "t0 = time.perf_counter()\n"
+        f"{code}\n"
+        "elapsed = time.perf_counter() - t0\n"
+        "print(json.dumps({'elapsed': elapsed, 'modules': [m for m in ('juliacall', 'pandas', 'pydantic') "
+        "if m in sys.modules]}))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+class TestLazyImport:
+    def test_import(self):
+        ret = _measure("import iesopt")
+        assert ret["modules"] == []
+        assert ret["elapsed"] < IMPORT_BUDGET
+
+    def test_config(self):
+        ret = _measure("import iesopt\nfrom iesopt.config import Config\nConfig.get('julia')")
+        assert ret["modules"] == []
+        assert ret["elapsed"] < IMPORT_BUDGET
+
+    def test_results_without_julia(self):
+        ret = _measure(
+            "from unittest import mock\nimport iesopt\nr = iesopt.Results(model=mock.MagicMock())\nr._snapshots"
+        )
+        assert "juliacall" not in ret["modules"]
+        assert ret["elapsed"] < 2 * IMPORT_BUDGET
+
+
+class TestStartupReport:
+    def test_report_before_initialization(self):
+        from iesopt.julia.report import phase
+
+        with phase("test_phase"):
+            pass
+
+        report = iesopt.startup_report()
+        assert report["phases"]["test_phase"] >= 0.0
+        assert {"initialized", "total", "environment", "sysimage"} <= set(report.keys())
@@ -0,0 +1,361 @@
+import asyncio
+import gc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import iesopt
+
+# A minimal model: a single plant (with a parametric marginal cost) supplying a fixed demand of 10 in each snapshot.
+CONFIG = """
+parameters:
+  price: 50
+  capacity: 100
+
+config:
+  general:
+    verbosity:
+      core: error
+  optimization:
+    problem_type: LP
+    snapshots:
+      count: 4
+
+carriers:
+  electricity: {}
+
+components:
+  node:
+    type: Node
+    carrier: electricity
+
+  plant:
+    type: Unit
+    outputs: {electricity: node}
+    conversion: ~ -> 1 electricity
+    capacity: <capacity> out:electricity
+    marginal_cost: <price> per out:electricity
+
+  demand:
+    type: Profile
+    carrier: electricity
+    node_from: node
+    value: 10
+"""
+
+
+# The same model, with the demand read from a (virtual) file.
+CONFIG_VIRTUAL_FILE = CONFIG.replace("  optimization:", "  files:\n    data: data.csv\n  optimization:").replace(
+    "value: 10", "value: demand@data"
+)
+
+# The same model, with the plant's availability read from the (virtual) file, and an expensive backup plant.
+CONFIG_AVAILABILITY = CONFIG_VIRTUAL_FILE.replace(
+    "marginal_cost: <price> per out:electricity\n",
+    "marginal_cost: <price> per out:electricity\n    availability_factor: availability@data\n",
+) + (
+    "\n  backup:\n    type: Unit\n    outputs: {electricity: node}\n    conversion: ~ -> 1 electricity\n"
+    "    capacity: 100 out:electricity\n    marginal_cost: 100 per out:electricity\n"
+)
+
+
+def _collect_garbage():
+    # Free everything that is no longer referenced, on both sides (which releases NumPy arrays that Julia held).
+    gc.collect()
+    iesopt.julia.GC.gc()
+    gc.collect()
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    filename = tmp_path / "config.iesopt.yaml"
+    filename.write_text(CONFIG)
+    return filename
+
+
+class TestUpdateParameters:
+    def test_update_and_resolve(self, config_file):
+        model = iesopt.Model(config_file)
+        model.generate()
+        model.optimize()
+        assert abs(model.objective_value - 2000.0) < 1e-4
+
+        for price in [60.0, 20.0, 50.0]:
+            model.update_parameters(price=price)
+            assert model.status == iesopt.ModelStatus.GENERATED
+            model.optimize()
+            assert abs(model.objective_value - price * 40.0) < 1e-4
+
+    def test_matches_regenerated_model(self, config_file):
+        model = iesopt.Model(config_file, parameters={"price": 50})
+        model.generate()
+        model.update_parameters(price=75, capacity=20)
+        model.optimize()
+
+        reference = iesopt.run(config_file, parameters={"price": 75, "capacity": 20})
+        assert abs(model.objective_value - reference.objective_value) < 1e-4
+
+    def test_results_match_regenerated_model(self, config_file):
+        model = iesopt.Model(config_file, parameters={"price": 50})
+        model.generate()
+        model.update_parameters(price=75, capacity=20)
+        model.optimize()
+        reference = iesopt.run(config_file, parameters={"price": 75, "capacity": 20})
+
+        # THEN: all available ("var" and "con") results match the regenerated model
+        results, expected = model.results.to_dict(), reference.results.to_dict(field_types=["var", "con"])
+        assert results.keys() == expected.keys()
+        for key, value in expected.items():
+            assert np.allclose(results[key], value, atol=1e-6), key
+
+        # THEN: results computed from IESopt's expressions (that keep the values from generating the model) are not
+        with pytest.raises(ValueError, match="updated in place"):
+            model.results.get("component", "plant", "exp", "out_electricity")
+        with pytest.raises(ValueError, match="updated in place"):
+            model.results.to_pandas(field_types=["obj"])
+
+    def test_interacting_parameters(self, tmp_path):
+        # WHEN: two parameters enter the same coefficient jointly (as product)
+        config_file = tmp_path / "config.iesopt.yaml"
+        config_file.write_text(
+            CONFIG.replace("capacity: 100", "capacity: 100\n  factor: 1").replace(
+                "marginal_cost: <price> per", "marginal_cost: <price> * <factor> per"
+            )
+        )
+        model = iesopt.Model(config_file)
+        model.generate()
+
+        # THEN: updating both of them is rejected, instead of summing their effects
+        with pytest.raises(Exception, match="jointly"):
+            model.update_parameters(price=60.0, factor=2.0)
+
+    def test_non_numerical_parameter(self, config_file):
+        model = iesopt.Model(config_file)
+        model.generate()
+        with pytest.raises(TypeError):
+            model.update_parameters(price="expensive")
+
+
+class TestUpdateVirtualFile:
+    def test_update_and_resolve(self, tmp_path):
+        config_file = tmp_path / "config.iesopt.yaml"
+        config_file.write_text(CONFIG_VIRTUAL_FILE)
+
+        model = iesopt.Model(config_file, virtual_files={"data": pd.DataFrame({"demand": [10.0, 10.0, 10.0, 10.0]})})
+        model.generate()
+
+        for demand in [[1.0, 2.0, 3.0, 4.0], [10.0, 0.0, 20.0, 5.0]]:
+            model.update_virtual_file("data", pd.DataFrame({"demand": demand}))
+            model.optimize()
+            assert abs(model.objective_value - 50.0 * sum(demand)) < 1e-4
+
+    def test_update_frame_in_place(self, tmp_path):
+        config_file = tmp_path / "config.iesopt.yaml"
+        config_file.write_text(CONFIG_VIRTUAL_FILE)
+
+        # WHEN: the frame that the model was created with is modified in place, and then passed as update
+        df = pd.DataFrame({"demand": [10.0, 10.0, 10.0, 10.0]})
+        model = iesopt.Model(config_file, virtual_files={"data": df})
+        model.generate()
+        df["demand"] = [1.0, 2.0, 3.0, 4.0]
+        model.update_virtual_file("data", df)
+        model.optimize()
+
+        # THEN: the update is computed against the values the model was created with
+        assert abs(model.objective_value - 50.0 * 10.0) < 1e-4
+
+    def test_frame_modified_before_generate(self, tmp_path):
+        config_file = tmp_path / "config.iesopt.yaml"
+        config_file.write_text(CONFIG_VIRTUAL_FILE)
+
+        # WHEN: the frame is modified after creating the model, but before generating it
+        df = pd.DataFrame({"demand": [10.0, 10.0, 10.0, 10.0]})
+        model = iesopt.Model(config_file, virtual_files={"data": df})
+        df.loc[:, "demand"] = 0.0
+        model.generate()
+        model.optimize()
+
+        # THEN: the model uses the values it was created with
+        assert abs(model.objective_value - 50.0 * 40.0) < 1e-4
+
+    def test_update_availability_factor(self, tmp_path):
+        config_file = tmp_path / "config.iesopt.yaml"
+        config_file.write_text(CONFIG_AVAILABILITY)
+
+        # WHEN: the availability factor (which must stay within [0, 1]) of the plant is updated in place
+        df = pd.DataFrame({"demand": [10.0] * 4, "availability": [1.0] * 4})
+        model = iesopt.Model(config_file, virtual_files={"data": df})
+        model.generate()
+        updated = pd.DataFrame({"demand": [10.0] * 4, "availability": [0.05, 0.5, 1.0, 0.0]})
+        model.update_virtual_file("data", updated)
+        model.optimize()
+
+        # THEN: the plant covers 5 + 10 + 10 + 0, and the backup the rest
+        reference = iesopt.run(config_file, virtual_files={"data": updated})
+        assert abs(model.objective_value - (50.0 * 25.0 + 100.0 * 15.0)) < 1e-4
+        assert abs(model.objective_value - reference.objective_value) < 1e-4
+
+    def test_nan_values(self, tmp_path):
+        config_file = tmp_path / "config.iesopt.yaml"
+        config_file.write_text(CONFIG_VIRTUAL_FILE)
+
+        model = iesopt.Model(config_file, virtual_files={"data": pd.DataFrame({"demand": [10.0] * 4})})
+        model.generate()
+        with pytest.raises(Exception, match="NaN"):
+            model.update_virtual_file("data", pd.DataFrame({"demand": [1.0, np.nan, 3.0, 4.0]}))
+
+    def test_structural_change(self, tmp_path):
+        config_file = tmp_path / "config.iesopt.yaml"
+        config_file.write_text(CONFIG_VIRTUAL_FILE)
+
+        model = iesopt.Model(config_file, virtual_files={"data": pd.DataFrame({"demand": [10.0, 10.0, 10.0, 10.0]})})
+        model.generate()
+        with pytest.raises(Exception, match="structure"):
+            model.update_virtual_file("data", pd.DataFrame({"demand": [1.0, 2.0]}))
+        with pytest.raises(Exception, match="not a virtual file"):
+            model.update_virtual_file("other", pd.DataFrame({"demand": [1.0, 2.0, 3.0, 4.0]}))
+
+
+class TestWarmStart:
+    def test_warm_start_after_update(self, config_file):
+        model = iesopt.Model(config_file)
+        model.generate()
+        model.optimize()
+
+        model.update_parameters(price=60.0)
+        model.optimize(warm_start=True)
+        assert abs(model.objective_value - 2400.0) < 1e-4
+
+        stats = model.solve_stats
+        assert [entry["warm_start"] for entry in stats] == [False, True]
+        assert "iterations_saved" in stats[1]
+
+    def test_warm_start_without_solution(self, config_file):
+        # WHEN: a warm start is requested, but there is no previous solution
+        model = iesopt.Model(config_file)
+        model.generate()
+        model.optimize(warm_start=True)
+
+        # THEN: the solve is recorded as cold
+        assert model.solve_stats[0]["warm_start"] is False
+        assert "iterations_saved" not in model.solve_stats[0]
+
+    def test_warm_start_from_results(self, config_file):
+        reference = iesopt.run(config_file)
+
+        model = iesopt.Model(config_file)
+        model.generate()
+        model.optimize(warm_start=reference.results)
+        assert abs(model.objective_value - reference.objective_value) < 1e-4
+
+
+class TestClone:
+    def test_clones_are_independent(self, config_file):
+        model = iesopt.Model(config_file)
+        model.generate()
+
+        clone = model.clone()
+        assert clone.status == iesopt.ModelStatus.GENERATED
+        assert clone.core is not model.core
+
+        clone.update_parameters(price=60.0)
+        clone.optimize()
+        assert abs(clone.objective_value - 2400.0) < 1e-4
+
+        # Components of the clone refer to the cloned model (the original one is not optimized yet).
+        conversion = clone.get_component("plant").var.conversion
+        assert abs(sum(clone._JuMP.value(v) for v in conversion) - 40.0) < 1e-4
+
+        model.optimize()
+        assert abs(model.objective_value - 2000.0) < 1e-4
+
+    def test_clone_with_virtual_files(self, tmp_path):
+        config_file = tmp_path / "config.iesopt.yaml"
+        config_file.write_text(CONFIG_VIRTUAL_FILE)
+
+        model = iesopt.Model(config_file, virtual_files={"data": pd.DataFrame({"demand": [1.0, 2.0, 3.0, 4.0]})})
+        model.generate()
+        clone = model.clone()
+
+        # The clone owns its input data, which outlives the (views into NumPy arrays of the) original model.
+        del model
+        _collect_garbage()
+        clone.optimize()
+        assert abs(clone.objective_value - 50.0 * 10.0) < 1e-4
+
+        clone.update_virtual_file("data", pd.DataFrame({"demand": [4.0, 3.0, 2.0, 0.0]}))
+        clone.optimize()
+        assert abs(clone.objective_value - 50.0 * 9.0) < 1e-4
+
+
+class TestAsync:
+    def test_generate_and_optimize(self, config_file):
+        async def solve():
+            model = iesopt.Model(config_file)
+            await model.generate_async()
+            await model.optimize_async(timeout=60.0)
+            return model
+
+        model = asyncio.run(solve())
+        assert model.status == iesopt.ModelStatus.OPTIMAL
+        assert abs(model.objective_value - 2000.0) < 1e-4
+
+    def test_optimize_interruptible(self, config_file):
+        model = iesopt.Model(config_file)
+        model.generate()
+        assert not model._can_interrupt()
+
+        # Solving while polling the flag from another Julia thread works, also if it is never set.
+        model._optimize(False, np.zeros(1, dtype=np.uint8))
+        assert model.status == iesopt.ModelStatus.OPTIMAL
+        assert abs(model.objective_value - 2000.0) < 1e-4
+
+
+class TestSaveGenerated:
+    def test_save_and_load(self, config_file, tmp_path):
+        model = iesopt.Model(config_file)
+        model.generate()
+        model.update_parameters(price=60.0)
+        model.save_generated(tmp_path / "model.iesopt.jls")
+
+        loaded = iesopt.Model.load_generated(tmp_path / "model.iesopt.jls")
+        assert loaded.status == iesopt.ModelStatus.GENERATED
+        loaded.optimize()
+        assert abs(loaded.objective_value - 2400.0) < 1e-4
+        conversion = loaded.get_component("plant").var.conversion
+        assert abs(sum(loaded._JuMP.value(v) for v in conversion) - 40.0) < 1e-4
+
+        # The loaded model can still be updated in place.
+        loaded.update_parameters(price=20.0)
+        loaded.optimize()
+        assert abs(loaded.objective_value - 800.0) < 1e-4
+
+    def test_save_and_load_with_virtual_files(self, tmp_path):
+        config_file = tmp_path / "config.iesopt.yaml"
+        config_file.write_text(CONFIG_VIRTUAL_FILE)
+
+        model = iesopt.Model(config_file, virtual_files={"data": pd.DataFrame({"demand": [1.0, 2.0, 3.0, 4.0]})})
+        model.generate()
+        model.save_generated(tmp_path / "model.iesopt.jls")
+        del model
+        _collect_garbage()
+
+        # The saved model contains the input data itself (not pointers to the memory of the original one).
+        loaded = iesopt.Model.load_generated(tmp_path / "model.iesopt.jls")
+        loaded.optimize()
+        assert abs(loaded.objective_value - 50.0 * 10.0) < 1e-4
+
+        loaded.update_virtual_file("data", pd.DataFrame({"demand": [4.0, 3.0, 2.0, 0.0]}))
+        loaded.optimize()
+        assert abs(loaded.objective_value - 50.0 * 9.0) < 1e-4
+
+
+class TestResults:
+    def test_bulk_extraction(self, config_file):
+        results = iesopt.run(config_file).results
+
+        entries = results.to_dict(build_cache=False)
+        assert len(entries) > 0
+        for (c, t, f), v in entries.items():
+            assert np.array_equal(np.asarray(v), np.asarray(results._get_safe(c, t, f)))
@@ -14,3 +14,75 @@ class TestPythonJuliaConversion:
         for config in configs:
             model = iesopt.Model("", config=config)
             assert type(model._kwargs["config"]["a"]) is int
+
+
+class TestHelpers:
+    def test_jl_isa(self):
+        assert iesopt.jl_isa(iesopt.IESopt, "Module")
+        assert not iesopt.jl_isa(iesopt.IESopt, "AbstractVector")
+
+    def test_helpers_are_compiled_once(self):
+        from iesopt.julia.helpers import jl_helper, jl_type
+
+        assert jl_helper("classify") is jl_helper("classify")
+        assert jl_type("Vector{Any}") is jl_type("Vector{Any}")
+        assert iesopt.julia.seval("isdefined(Main, :IESoptPythonHelpers)")
+
+
+class TestDataFrame:
+    def test_numerical_columns_are_shared(self):
+        import numpy as np
+        import pandas as pd
+        from iesopt.julia.util import recursive_convert_py2jl
+
+        values = np.array([1.0, 2.0, 3.0])
+        df = pd.DataFrame({"x": values, "s": ["a", "b", "c"], "c": pd.Categorical(["u", "v", "u"])}, copy=False)
+        jl_df = recursive_convert_py2jl(df)
+
+        assert list(iesopt.julia.names(jl_df)) == ["x", "s", "c"]
+        assert iesopt.jl_isa(jl_df, "IESopt.DataFrames.DataFrame")
+        assert iesopt.jl_isa(iesopt.julia.getindex(jl_df, iesopt.julia.Colon(), "s"), "Vector{String}")
+
+        # The numerical column is a view into the NumPy array.
+        df["x"].to_numpy()[0] = 10.0
+        assert iesopt.julia.getindex(jl_df, 1, "x") == 10.0
+
+    def test_none_is_missing(self):
+        import pandas as pd
+        from iesopt.julia.util import recursive_convert_py2jl
+
+        jl_df = recursive_convert_py2jl(pd.DataFrame({"s": ["a", None], "o": [1.0, None]}, dtype=object))
+
+        assert iesopt.jl_isa(iesopt.julia.getindex(jl_df, iesopt.julia.Colon(), "s"), "Vector{Union{Missing, String}}")
+        assert iesopt.julia.ismissing(iesopt.julia.getindex(jl_df, 2, "o"))
+
+    def test_nested_kwargs(self):
+        import numpy as np
+        from iesopt.julia.util import recursive_convert_py2jl
+
+        jl = recursive_convert_py2jl(
+            {"a": [1.0, 2.0], "b": np.arange(3), "c": {"d": [1, "x"], "e": []}, "f": [[1, 2], [3]], "g": True}
+        )
+
+        assert iesopt.jl_isa(jl, "Dict{String, Any}")
+        assert iesopt.jl_isa(jl["a"], "Vector{Float64}")
+        assert iesopt.jl_isa(jl["b"], "Vector{Int64}")
+        assert iesopt.jl_isa(jl["c"], "Dict{String, Any}")
+        assert iesopt.jl_isa(jl["c"]["d"], "Vector{Any}")
+        assert iesopt.jl_isa(jl["c"]["e"], "Vector{Any}")
+        assert iesopt.jl_isa(jl["f"][0], "Vector{Int64}")
+        assert list(jl["b"]) == [0, 1, 2]
+        assert jl["g"] is True
+
+    def test_arrays_that_are_not_vectors(self):
+        import numpy as np
+        from iesopt.julia.util import recursive_convert_py2jl
+
+        matrix = np.arange(6.0).reshape(2, 3)
+        jl = recursive_convert_py2jl({"scalar": np.array(2.5), "matrix": matrix, "rows": [matrix]})
+
+        # Only 1-dimensional arrays are vectors, others are passed as they are (not as vectors of their rows).
+        assert float(jl["scalar"]) == 2.5
+        assert np.array_equal(np.asarray(jl["matrix"]), matrix)
+        assert np.array_equal(np.asarray(jl["rows"][0]), matrix)
+        assert recursive_convert_py2jl(matrix) is matrix
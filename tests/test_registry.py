@@ -0,0 +1,60 @@
+import pandas as pd
+import pytest
+
+import iesopt
+
+from .test_model import CONFIG_VIRTUAL_FILE
+
+
+@pytest.fixture
+def frame():
+    handle = iesopt.register_frame("demand", pd.DataFrame({"demand": [1.0, 2.0, 3.0, 4.0]}))
+    yield handle
+    if "demand" in iesopt.registered_frames()["frames"]:
+        handle.release()
+
+
+class TestRegistry:
+    def test_memory_accounting(self, frame):
+        registered = iesopt.registered_frames()
+        assert registered["frames"]["demand"] == {"rows": 4, "columns": 1, "bytes": 32}
+        assert registered["bytes"] >= 32
+
+        frame.release()
+        assert "demand" not in iesopt.registered_frames()["frames"]
+        with pytest.raises(Exception, match="released"):
+            frame.jl
+
+    def test_duplicate_name(self, frame):
+        with pytest.raises(ValueError):
+            iesopt.register_frame("demand", pd.DataFrame({"demand": [1.0]}))
+
+    def test_virtual_file(self, frame, tmp_path):
+        config_file = tmp_path / "config.iesopt.yaml"
+        config_file.write_text(CONFIG_VIRTUAL_FILE)
+
+        model = iesopt.run(config_file, virtual_files={"data": frame})
+        assert abs(model.objective_value - 50.0 * 10.0) < 1e-4
+
+        model.update_virtual_file("data", pd.DataFrame({"demand": [2.0, 2.0, 2.0, 2.0]}))
+        model.optimize()
+        assert abs(model.objective_value - 50.0 * 8.0) < 1e-4
+
+    def test_release_after_creating_model(self, frame, tmp_path):
+        config_file = tmp_path / "config.iesopt.yaml"
+        config_file.write_text(CONFIG_VIRTUAL_FILE)
+
+        # WHEN: the frame is released after creating a model that uses it
+        model = iesopt.Model(config_file, virtual_files={"data": frame})
+        frame.release()
+
+        # THEN: the model can still be generated, updated, and saved
+        model.generate()
+        model.update_virtual_file("data", pd.DataFrame({"demand": [2.0, 2.0, 2.0, 2.0]}))
+        model.optimize()
+        assert abs(model.objective_value - 50.0 * 8.0) < 1e-4
+        model.save_generated(tmp_path / "model.jls")
+
+        # THEN: new models can not use the released frame
+        with pytest.raises(Exception, match="Frame `demand` was released"):
+            iesopt.Model(config_file, virtual_files={"data": frame})
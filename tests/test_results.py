@@ -1,8 +1,9 @@
+import numpy as np
 import pandas as pd
 import pytest
 from pandas.testing import assert_frame_equal
 
-from iesopt.results import Results
+from iesopt.results import Results, _ResultsIndex
 
 
 class TestToPandas_Long:
@@ -21,7 +22,7 @@ class TestToPandas_Long:
 
         assert_frame_equal(
             df,
-            pd.DataFrame(
+            _long_frame(
                 {
                     "snapshot": [1, 2, 3] * 4,
                     "component": ["comp1"] * 3 + ["comp2"] * 9,
@@ -29,7 +30,8 @@ class TestToPandas_Long:
                     "field": ["my_var1"] * 3 + ["my_var2"] * 3 + ["my_con"] * 3 + ["my_exp"] * 3,
                     "value": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0, 12.0],
                     "mode": ["primal"] * 12,
-                }
+                },
+                snapshots=[1, 2, 3],
             ),
         )
 
@@ -45,7 +47,7 @@ class TestToPandas_Long:
         df = results.to_pandas(orientation="long")
         assert_frame_equal(
             df,
-            pd.DataFrame(
+            _long_frame(
                 {
                     "snapshot": [None, 1, 2, 3],
                     "component": ["comp1"] + ["comp2"] * 3,
@@ -53,7 +55,8 @@ class TestToPandas_Long:
                     "field": ["my_var1"] + ["my_var2"] * 3,
                     "value": [4.0, 1.0, 2.0, 3.0],
                     "mode": ["primal"] * 4,
-                }
+                },
+                snapshots=[1, 2, 3],
             ),
         )
 
@@ -68,7 +71,7 @@ class TestToPandas_Long:
         df = results.to_pandas(orientation="long")
         assert_frame_equal(
             df,
-            pd.DataFrame(
+            _long_frame(
                 {
                     "snapshot": [1, 2, 3],
                     "component": ["comp1"] * 3,
@@ -76,7 +79,8 @@ class TestToPandas_Long:
                     "field": ["my_var1"] * 3,
                     "value": [1.0, 2.0, 3.0],
                     "mode": ["dual"] * 3,
-                }
+                },
+                snapshots=[1, 2, 3],
             ),
         )
 
@@ -92,7 +96,7 @@ class TestToPandas_Long:
         df = results.to_pandas(orientation="long")
         assert_frame_equal(
             df,
-            pd.DataFrame(
+            _long_frame(
                 {
                     "snapshot": [1, 2, 3, None, None],
                     "component": ["comp1"] * 5,
@@ -100,10 +104,201 @@ class TestToPandas_Long:
                     "field": ["my_var1"] * 3 + ["my_var2[i_0]", "my_var2[i_1]"],
                     "value": [1.0, 2.0, 3.0, 5.0, 10.0],
                     "mode": ["primal"] * 5,
-                }
+                },
+                snapshots=[1, 2, 3],
             ),
         )
 
+    def test__to_pandas_with_duplicate_snapshots(self, create_result):
+        # WHEN: snapshot names are not unique (so they cannot be categories)
+        results = create_result(
+            snapshots=["t1", "t2", "t2"],
+            data={("comp1", "var", "my_var"): [1.0, 2.0, 3.0], ("comp1", "obj", "my_obj"): 4.0},
+        )
+        df = results.to_pandas(orientation="long")
+
+        # THEN: non-temporal values have no snapshot (instead of the last one)
+        assert list(df["snapshot"][:3]) == ["t1", "t2", "t2"]
+        assert pd.isna(df["snapshot"][3])
+        assert list(df["value"]) == [1.0, 2.0, 3.0, 4.0]
+
+
+class TestFromData:
+    def test__from_data(self):
+        # WHEN: results are created from plain data (e.g., returned by the daemon)
+        results = Results(
+            data={
+                "source": "an IESopt model",
+                "snapshots": [1, 2, 3],
+                "components": ["comp1"],
+                "objectives": {"total_cost": 12.0},
+                "results": {
+                    ("comp1", "var", "my_var1"): np.array([1.0, 2.0, 3.0]),
+                    ("comp1", "obj", "value"): 4.0,
+                },
+            }
+        )
+
+        assert results.objectives["total_cost"] == 12.0
+        assert results.get("component", "comp1", "obj", "value") == 4.0
+        assert results.query_available_results("comp1", mode="primal") == [("var", "my_var1"), ("obj", "value")]
+        assert results.to_pandas(field_types=["var"]).tolist() == [1.0, 2.0, 3.0]
+
+
+class TestStore:
+    def test__store_returns_views(self):
+        # WHEN: results are created from plain data, with temporal, scalar, and irregular results
+        results = Results(
+            data={
+                "source": "an IESopt model",
+                "snapshots": [1, 2, 3],
+                "components": ["comp1", "comp2"],
+                "objectives": {},
+                "results": {
+                    ("comp1", "var", "my_var1"): np.array([1.0, 2.0, 3.0]),
+                    ("comp1", "var", "my_var1__dual"): np.array([0.1, 0.2, 0.3]),
+                    ("comp1", "obj", "value"): 4.0,
+                    ("comp2", "var", "my_var2"): np.array([5.0, 10.0]),
+                    ("comp2", "exp", "my_exp"): np.array([7.0, 8.0, 9.0]),
+                },
+            }
+        )
+
+        # THEN: temporal results are views into a single matrix
+        value = results.get("component", "comp1", "var", "my_var1")
+        assert np.shares_memory(value, results._cache.temporal)
+        assert np.shares_memory(results.get("component", "comp1", "var", "my_var1", mode="dual")[1:], value.base)
+        assert results.get("component", "comp1", "obj", "value") == 4.0
+        assert results.get("component", "comp2", "var", "my_var2").tolist() == [5.0, 10.0]
+
+        df = results.overview("comp1", temporal=True)
+        assert df[("comp1", "var", "my_var1", "dual")].tolist() == [0.1, 0.2, 0.3]
+        assert results.overview("comp", temporal=False).tolist() == [4.0]
+
+        df = results.to_pandas(field_types=["var"], filter=lambda c, t, f: c == "comp1", orientation="wide")
+        assert np.shares_memory(df.to_numpy(), results._cache.temporal)
+        assert df[("comp1", "var", "my_var1")].tolist() == [1.0, 2.0, 3.0]
+
+
+class TestLazy:
+    def test__lazy_results_are_fetched_on_demand(self, mocker):
+        # WHEN: results of a model are accessed with a budget (fitting two temporal results)
+        data = {
+            ("comp1", "var", "my_var1"): np.array([1.0, 2.0, 3.0]),
+            ("comp1", "var", "my_var1__dual"): np.array([0.1, 0.2, 0.3]),
+            ("comp1", "obj", "value"): 4.0,
+            ("comp2", "exp", "my_exp"): np.array([7.0, 8.0, 9.0]),
+        }
+        results = Results(model=mocker.MagicMock(), budget=48 / 1024**2)
+        results._snapshots = [1, 2, 3]
+        results._index_all = lambda: {k: 0 if isinstance(v, float) else 1 for (k, v) in data.items()}
+        results._lazy._index = results._index_all
+        fetch = mocker.patch.object(results, "_get_safe", side_effect=lambda c, t, f: data[(c, t, f)])
+
+        # THEN: results are listed without fetching any of them
+        assert results.query_available_results("comp1", mode="dual") == [("var", "my_var1")]
+        assert results.overview("comp", temporal=False).tolist() == [4.0]
+        assert fetch.call_count == 1
+
+        # THEN: fetched results are cached, and the least recently used ones are evicted
+        assert results.get("component", "comp1", "var", "my_var1").tolist() == [1.0, 2.0, 3.0]
+        assert results.get("component", "comp1", "var", "my_var1").tolist() == [1.0, 2.0, 3.0]
+        results.get("component", "comp2", "exp", "my_exp")
+        results.get("component", "comp1", "var", "my_var1", mode="dual")
+        info = results.cache_info()
+        assert (info["hits"], info["misses"], info["evicted"]) == (1, 4, 2)
+        assert info["bytes"] <= info["budget"]
+
+        df = results.overview("comp1", temporal=True)
+        assert df[("comp1", "var", "my_var1", "dual")].tolist() == [0.1, 0.2, 0.3]
+        with pytest.raises(ValueError):
+            results.get("component", "comp3", "var", "my_var3")
+
+    def test__results_are_not_lazy_by_default(self, mocker):
+        assert Results(model=mocker.MagicMock()).cache_info() is None
+
+
+class TestIndex:
+    keys = [
+        ("unit_a", "var", "flow"),
+        ("unit_a", "con", "flow__dual"),
+        ("unit_b", "var", "flow"),
+        ("node", "var", "state"),
+        ("unit_c", "obj", "value"),
+    ]
+
+    def test__index_matches_components(self):
+        index = _ResultsIndex(TestIndex.keys)
+
+        assert index.components("unit_", "prefix") == ["unit_a", "unit_b", "unit_c"]
+        assert index.components("unit_[ab]", "glob") == ["unit_a", "unit_b"]
+        assert index.components("*e", "glob") == ["node"]
+        assert index.components("unit_b", "exact") == ["unit_b"]
+        assert index.components("unit", "exact") == []
+        assert index.components("n.*e", "regex") == ["node"]
+        with pytest.raises(ValueError):
+            index.components("unit", "fuzzy")
+
+    def test__index_selects_fields_and_tags(self):
+        index = _ResultsIndex(TestIndex.keys, tagged=lambda tags: ["unit_b", "node"] if tags == ["Unit"] else [])
+
+        assert index.select("unit_", "prefix", fieldtype="var", field="flow") == [TestIndex.keys[0], TestIndex.keys[2]]
+        assert index.select("unit_a", "exact", field="flow") == TestIndex.keys[:2]
+        assert index.select("", "prefix", fieldtype="obj") == [TestIndex.keys[4]]
+        assert index.select("unit_*", "glob", tagged="Unit") == [TestIndex.keys[2]]
+        with pytest.raises(ValueError):
+            _ResultsIndex(TestIndex.keys).select("unit_*", "glob", tagged="Unit")
+
+    def test__results_use_index(self):
+        # WHEN: results are queried using different kinds of matches
+        results = Results(
+            data={
+                "source": "an IESopt model",
+                "snapshots": [1, 2],
+                "components": ["node", "unit_a", "unit_b"],
+                "objectives": {},
+                "results": {k: np.array([1.0, 2.0]) for k in TestIndex.keys[:4]} | {TestIndex.keys[4]: 3.0},
+            }
+        )
+
+        # THEN: all of them use the same index, and regex (the default) behaves as before
+        assert results.query_available_results("unit_a") == [("var", "flow", "primal"), ("con", "flow", "dual")]
+        assert results.query_available_results("unit_a", match="exact", mode="dual") == [("con", "flow")]
+        assert results.query_available_results("unit", match="exact") == []
+        df = results.overview("unit_?", temporal=True, match="glob", field="flow", mode="primal")
+        assert list(df.columns) == [("unit_a", "var", "flow", "primal"), ("unit_b", "var", "flow", "primal")]
+        assert results.overview("unit", temporal=False).tolist() == [3.0]
+        assert results._index is not None
+
+
+class TestUpdatedInPlace:
+    def test__expressions_are_not_available(self, mocker):
+        # WHEN: results are created from a model that was updated in place
+        model = mocker.MagicMock()
+        model._updated_in_place = True
+        results = Results(model=model)
+
+        # THEN: results computed from IESopt's expressions can not be accessed
+        for fieldtype in ["exp", "obj", "res"]:
+            with pytest.raises(ValueError, match="updated in place"):
+                results.get("component", "comp1", fieldtype, "value")
+            with pytest.raises(ValueError, match="updated in place"):
+                results.to_dict(field_types=[fieldtype], build_cache=False)
+        with pytest.raises(ValueError, match="updated in place"):
+            results.objectives
+
+    def test__not_updated(self, mocker):
+        model = mocker.MagicMock()
+        model._updated_in_place = False
+        assert Results(model=model)._stale == set()
+
+
+def _long_frame(data, snapshots):
+    # Long results use categoricals for all columns except `value` (with the snapshots as categories of `snapshot`).
+    data = data | {"snapshot": pd.Categorical(data["snapshot"], categories=snapshots, ordered=True)}
+    df = pd.DataFrame(data)
+    return df.astype({c: "category" for c in ["component", "fieldtype", "field", "mode"]})
+
 
 @pytest.fixture
 def create_result(mocker):
@@ -0,0 +1,94 @@
+import os
+import json
+import sys
+import time
+import subprocess
+from pathlib import Path
+
+import pytest
+
+import iesopt
+from iesopt.config import Config
+from iesopt.julia.shared import shared_environment
+
+# Number of processes that are started at the same time, see `TestFanOut`.
+STRESS_PROCESSES = int(os.environ.get("IESOPT_STRESS_PROCESSES", "8"))
+
+
+# Holds the setup lock for a moment, logging when it enters and exits; run as separate process, see `TestSetupLock`.
+_HOLD_LOCK = """
+import sys, time
+from pathlib import Path
+from iesopt.julia.setup import _setup_lock
+
+target, log = Path(sys.argv[1]), Path(sys.argv[2])
+with _setup_lock(target):
+    with open(log, "a") as f:
+        f.write("enter\\n")
+    time.sleep(0.05)
+    with open(log, "a") as f:
+        f.write("exit\\n")
+"""
+
+
+class TestSetupLock:
+    def test_lock_is_exclusive(self, tmp_path):
+        # Start the lock holders from a clean working directory, with only the folder containing `iesopt` on the path
+        # (the test runner may have put `src/iesopt` itself on it, shadowing the package with `iesopt.py`).
+        log = tmp_path / "log.txt"
+        env = os.environ | {"PYTHONPATH": str(Path(iesopt.__file__).parent.parent)}
+        processes = [
+            subprocess.Popen([sys.executable, "-c", _HOLD_LOCK, str(tmp_path), str(log)], cwd=tmp_path, env=env)
+            for _ in range(8)
+        ]
+        for p in processes:
+            p.wait()
+
+        assert all(p.returncode == 0 for p in processes)
+        assert log.read_text().splitlines() == ["enter", "exit"] * 8
+
+
+class TestSharedEnvironment:
+    def test_environment_is_relocatable(self, tmp_path, monkeypatch):
+        (tmp_path / "iesopt_shared.json").write_text(
+            json.dumps(
+                {
+                    "julia": "julia",
+                    "executable": "julia/bin/julia",
+                    "fingerprint": Config.fingerprint(),
+                    "optimization": Config.get("optimization"),
+                }
+            )
+        )
+        monkeypatch.setenv("IESOPT_LOCAL_DEPOT", str(tmp_path / "local"))
+
+        env = shared_environment(tmp_path)
+        assert env["PYTHON_JULIACALL_EXE"] == str(tmp_path / "julia" / "bin" / "julia")
+        assert env["PYTHON_JULIACALL_PROJECT"] == str(tmp_path / "project")
+        assert env["JULIA_DEPOT_PATH"].split(os.pathsep)[:2] == [str(tmp_path / "local"), str(tmp_path / "depot")]
+        assert env["JULIA_PKG_OFFLINE"] == "true"
+
+    def test_missing_environment(self, tmp_path):
+        with pytest.raises(Exception, match="not a shared IESopt environment"):
+            shared_environment(tmp_path)
+
+
+class TestFanOut:
+    def test_concurrent_startup(self):
+        # Start many processes at once (like an array job on a cluster), which must all come up, sharing one setup.
+        t0 = time.perf_counter()
+        processes = [
+            subprocess.Popen(
+                [sys.executable, "-c", "import iesopt; iesopt.julia; print(iesopt.startup_report()['environment'])"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            )
+            for _ in range(STRESS_PROCESSES)
+        ]
+        environments = [p.communicate()[0].strip().splitlines()[-1] for p in processes]
+        elapsed = time.perf_counter() - t0
+
+        print(f"Fan-out startup of {STRESS_PROCESSES} processes: {elapsed:.2f}s")
+        assert all(p.returncode == 0 for p in processes)
+        assert environments.count("resolved") <= 1